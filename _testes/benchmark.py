@@ -0,0 +1,200 @@
+"""
+Benchmarks da biblioteca contra o servidor local `mock_monday_server` (sem acessar o Monday).
+
+Mede a vazão (itens/s), o tempo total e o pico de memória de:
+  - extract:        `extrair_dados_paginados` (quadro inteiro, sem filtro de data);
+  - list2dfs:       `list2dfs` sobre a lista de itens no formato da API;
+  - prepare_batch:  `_prepare_batch_request` em lotes de 100 linhas;
+  - create_items:   `create_items_in_group` (upload completo).
+
+Tamanhos: 1k, 100k e 1M itens (ou qualquer número, ex: "--sizes 5000").
+
+Uso:
+    python _testes/benchmark.py --sizes 1k,100k --json resultados.json
+    python _testes/benchmark.py --sizes 1k,100k --compare resultados.json   # aponta regressões
+
+Com `--compare`, o script termina com código 1 se algum benchmark ficar mais
+lento que a referência além da tolerância (`--tolerance`, padrão 20%).
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+from mock_monday_server import MockMondayServer, MockBoard
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+BENCHMARKS = ("extract", "list2dfs", "prepare_batch", "create_items")
+BOARD_NAME = "_benchmark"
+BATCH_SIZE = 100
+
+
+def parse_size(text: str) -> int:
+    return SIZES.get(text) or int(text.replace("_", ""))
+
+def peak_rss_mb() -> float | None:
+    """Pico de memória residente do processo até agora (MB), quando disponível."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+@contextlib.contextmanager
+def measure(result: dict, count: int):
+    start = time.perf_counter()
+    yield
+    seconds = time.perf_counter() - start
+    result.update(seconds=round(seconds, 3), items_per_s=round(count / seconds, 1) if seconds else None,
+                  peak_rss_mb=peak_rss_mb())
+
+def build_dataframe(n: int):
+    import pandas as pd
+    return pd.DataFrame({
+        "Elemento": [f"Item bench {i}" for i in range(n)],
+        "Status": [("Feito", "Em andamento", "Travado")[i % 3] for i in range(n)],
+        "Data de Entrega": [f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}" for i in range(n)],
+        "Horas": [str(i % 40) for i in range(n)],
+        "Cliente": [f"Cliente {i % 97}" for i in range(n)],
+    })
+
+
+class BenchmarkRunner:
+    """Sobe o servidor mock, configura a biblioteca para usá-lo e executa os benchmarks."""
+    def __init__(self, sizes: list[int], subitems: int, latency: float, budget: int):
+        self.sizes = sizes
+        self.boards = {n: MockBoard(str(2000 + i), n_items=n, subitems_per_item=subitems) for i, n in enumerate(sizes)}
+        self.server = MockMondayServer(boards=list(self.boards.values()), latency=latency, complexity_budget=budget)
+        self.budget = budget
+
+    def __enter__(self):
+        url = self.server.start()
+        env_path = Path(tempfile.mkdtemp()) / ".env"
+        env_path.write_text(f"MONDAY_API_TOKEN=mock\nMONDAY_API_URL={url}\nMONDAY_COMPLEXITY_BUDGET={self.budget}\n",
+                            encoding="utf-8")
+
+        from monday_lib import load_settings
+        load_settings(str(env_path))
+        logging.getLogger().setLevel(logging.WARNING)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.stop()
+
+    def run(self, name: str, n: int) -> dict:
+        result = {"benchmark": name, "size": n}
+        getattr(self, f"bench_{name}")(n, result)
+        return result
+
+    def bench_extract(self, n: int, result: dict):
+        from monday_lib import extrair_dados_paginados
+        board = self.boards[n]
+        with measure(result, n):
+            items = extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=False)
+        assert len(items) == n, f"esperados {n} itens, recebidos {len(items)}"
+
+    def bench_list2dfs(self, n: int, result: dict):
+        from monday_lib.utils.handler import list2dfs
+        board = self.boards[n]
+        items = [board.api_item(i) for i in range(n)]
+        with measure(result, n):
+            elementos, _ = list2dfs(items)
+        assert len(elementos) == n
+
+    def bench_prepare_batch(self, n: int, result: dict):
+        from monday_lib.mapper.column_map import ColunaIDMapper
+        from monday_lib.service.data_import_monday import _build_auto_column_map, _prepare_batch_request
+        board = self.boards[n]
+        df = build_dataframe(n)
+        mapper = ColunaIDMapper(board.id, BOARD_NAME)
+        auto_map, item_name_col = _build_auto_column_map(df, mapper, {})
+        with measure(result, n):
+            for start in range(0, n, BATCH_SIZE):
+                _prepare_batch_request(df.iloc[start:start + BATCH_SIZE], board.id, "topics", auto_map, item_name_col, mapper)
+
+    def bench_create_items(self, n: int, result: dict):
+        from monday_lib import create_items_in_group
+        board = self.boards[n]
+        df = build_dataframe(n)
+        with measure(result, n):
+            summary = create_items_in_group(board.id, "topics", df, BOARD_NAME, batch_size=BATCH_SIZE)
+        result["summary"] = {key: value for key, value in summary.items() if not isinstance(value, list)}
+
+
+def compare(results: list[dict], baseline_path: str, tolerance: float) -> list[str]:
+    """Compara com uma execução anterior; retorna a lista de regressões encontradas."""
+    baseline = {(r["benchmark"], r["size"]): r for r in json.loads(Path(baseline_path).read_text(encoding="utf-8"))}
+    regressions = []
+    for r in results:
+        ref = baseline.get((r["benchmark"], r["size"]))
+        if not ref or not ref.get("seconds") or "seconds" not in r:
+            continue
+        ratio = r["seconds"] / ref["seconds"]
+        r["vs_baseline"] = round(ratio, 2)
+        if ratio > 1 + tolerance:
+            regressions.append(f"{r['benchmark']} ({r['size']} itens): {ref['seconds']}s -> {r['seconds']}s ({ratio:.2f}x)")
+    return regressions
+
+def print_table(results: list[dict]):
+    header = f"{'benchmark':<15}{'itens':>10}{'tempo (s)':>12}{'itens/s':>14}{'pico RSS (MB)':>15}{'vs ref':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        if "error" in r:
+            print(f"{r['benchmark']:<15}{r['size']:>10}  ERRO: {r['error']}")
+            continue
+        print(f"{r['benchmark']:<15}{r['size']:>10}{r['seconds']:>12}{r['items_per_s'] or '-':>14}"
+              f"{r['peak_rss_mb'] or '-':>15}{r.get('vs_baseline', '-'):>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks da monday_lib contra o servidor mock.")
+    parser.add_argument("--sizes", default="1k,100k,1M", help="Tamanhos dos quadros (ex: 1k,100k,1M ou 5000).")
+    parser.add_argument("--only", default=",".join(BENCHMARKS), help=f"Benchmarks a executar ({', '.join(BENCHMARKS)}).")
+    parser.add_argument("--subitems", type=int, default=1, help="Subitens por item nos quadros sintéticos.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latência (s) simulada por resposta.")
+    parser.add_argument("--budget", type=int, default=10 ** 12,
+                        help="Orçamento de complexidade por minuto (padrão: praticamente ilimitado).")
+    parser.add_argument("--json", help="Salva os resultados neste arquivo.")
+    parser.add_argument("--compare", help="Arquivo JSON de uma execução anterior para comparação.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Tolerância de regressão (0.2 = 20%%).")
+    args = parser.parse_args()
+
+    sizes = [parse_size(s.strip()) for s in args.sizes.split(",") if s.strip()]
+    names = [b.strip() for b in args.only.split(",") if b.strip()]
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Benchmarks desconhecidos: {', '.join(sorted(unknown))}")
+
+    results = []
+    with BenchmarkRunner(sizes, args.subitems, args.latency, args.budget) as runner:
+        for n in sizes:
+            for name in names:
+                try:
+                    results.append(runner.run(name, n))
+                except Exception as e:
+                    results.append({"benchmark": name, "size": n, "error": f"{type(e).__name__}: {e}"})
+                print(f"[{name} / {n}] concluído", file=sys.stderr)
+
+    regressions = compare(results, args.compare, args.tolerance) if args.compare else []
+    print_table(results)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    if regressions:
+        print("\nRegressões em relação à referência:")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1164 @@
+"""
+Cenários de comportamento da biblioteca contra o servidor local `mock_monday_server` (sem acessar o Monday).
+
+Cada cenário monta a situação no servidor mock (cursor vencido, item movido
+de grupo, ...), executa a função pública correspondente e confere o
+resultado. Diferente do `benchmark.py`, aqui o que importa é a resposta
+correta, não o tempo.
+
+Uso:
+    python _testes/cenarios_mock.py                 # todos os cenários
+    python _testes/cenarios_mock.py --only retomada_streaming_cursor_expirado
+
+O script termina com código 1 se algum cenário falhar.
+"""
+import os
+import sys
+import time
+import asyncio
+import subprocess
+import uuid
+import logging
+import shutil
+import argparse
+import tempfile
+import traceback
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from mock_monday_server import MockMondayServer, MockBoard
+
+BOARD_NAME = "_cenarios"
+CENARIOS = {}
+
+
+def cenario(func):
+    """Registra um cenário pelo nome da função."""
+    CENARIOS[func.__name__] = func
+    return func
+
+
+class CenarioRunner:
+    """Sobe o servidor mock e configura a biblioteca para usá-lo (um quadro novo por cenário)."""
+    def __init__(self):
+        self.server = MockMondayServer(boards=[])
+        self._next_board = 3000
+
+    def __enter__(self):
+        url = self.server.start()
+        env_path = Path(tempfile.mkdtemp()) / ".env"
+        env_path.write_text(f"MONDAY_API_TOKEN=mock\nMONDAY_API_URL={url}\n", encoding="utf-8")
+
+        from monday_lib import load_settings, get_settings
+        load_settings(str(env_path))
+        # Os ids dos quadros se repetem entre execuções: descarta os mapas de colunas salvos
+        shutil.rmtree(get_settings().PERSIST_PATH / BOARD_NAME, ignore_errors=True)
+        logging.getLogger().setLevel(logging.WARNING)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.stop()
+
+    def board(self, n_items: int, subitems: int = 1) -> MockBoard:
+        self._next_board += 1
+        board = MockBoard(str(self._next_board), n_items=n_items, subitems_per_item=subitems)
+        self.server.add_board(board)
+        return board
+
+
+@cenario
+def retomada_streaming_cursor_expirado(runner: CenarioRunner):
+    """
+    Exportação com `job_id` e `streaming=True` interrompida na 3ª página; o
+    cursor salvo vence na API. A retomada deve refazer só a parte afetada
+    (APICursorExpiredError na leitura em streaming) e trazer todos os itens.
+    """
+    from monday_lib import extrair_dados_paginados, iter_items_paginados
+    board = runner.board(300)
+    kwargs = dict(filtrar_por_data=False, tamanho_pagina=50, streaming=True)
+    esperado = extrair_dados_paginados(board.id, BOARD_NAME, **kwargs)
+
+    job_id = f"cenario_{uuid.uuid4().hex[:8]}"
+    paginas = iter_items_paginados(board.id, BOARD_NAME, job_id=job_id, por_pagina=True, **kwargs)
+    for _ in range(3):
+        next(paginas)
+    paginas.close()  # o checkpoint fica com 3 páginas e o cursor da 4ª
+
+    ttl = runner.server.cursor_ttl
+    runner.server.cursor_ttl = 0.2
+    try:
+        time.sleep(0.3)
+        itens = extrair_dados_paginados(board.id, BOARD_NAME, job_id=job_id, **kwargs)
+    finally:
+        runner.server.cursor_ttl = ttl
+    assert len(itens) == 300, f"esperados 300 itens, recebidos {len(itens)}"
+    assert itens == esperado, "itens diferentes da exportação sem interrupção"
+
+
+@cenario
+def incremental_grupo_movido_e_excluido(runner: CenarioRunner):
+    """
+    Extração incremental com filtro de grupo: um item movido para um grupo fora
+    do filtro deve sair do resultado; a exclusão de um grupo do filtro faz a
+    busca falhar (grupo não encontrado) em vez de devolver o resultado antigo,
+    e a exclusão de um grupo sem filtro leva à extração completa.
+    """
+    from monday_lib import call_monday_api, extrair_dados_incrementais, extrair_dados_paginados
+    board = runner.board(90)
+    grupos = ["Em andamento", "Feito"]
+    kwargs = dict(filtrar_por_data=False, grupos=grupos, tamanho_pagina=50)
+    ids = lambda itens: sorted(item["id"] for item in itens)
+
+    inicial = extrair_dados_incrementais(board.id, BOARD_NAME, completo=True, **kwargs)
+    assert len(inicial) == 60, f"esperados 60 itens, recebidos {len(inicial)}"
+
+    movido = next(item for item in inicial if item["group"]["title"] == "Feito")
+    call_monday_api("mutation ($itemId: ID!, $groupId: String!) { move_item_to_group(item_id: $itemId, group_id: $groupId) { id } }",
+                    {"itemId": movido["id"], "groupId": "group_travado"})
+    itens = extrair_dados_incrementais(board.id, BOARD_NAME, **kwargs)
+    assert movido["id"] not in ids(itens), "item movido para fora do filtro continua no resultado"
+    assert ids(itens) == ids(extrair_dados_paginados(board.id, BOARD_NAME, **kwargs))
+
+    delete = "mutation ($boardId: ID!, $groupId: String!) { delete_group(board_id: $boardId, group_id: $groupId) { id } }"
+    call_monday_api(delete, {"boardId": board.id, "groupId": "group_feito"})
+    try:
+        extrair_dados_incrementais(board.id, BOARD_NAME, **kwargs)
+    except ValueError as e:
+        assert "Feito" in str(e), e
+    else:
+        raise AssertionError("grupo excluído do filtro não foi detectado")
+
+    sem_filtro = dict(filtrar_por_data=False, tamanho_pagina=50)
+    inicial = extrair_dados_incrementais(board.id, BOARD_NAME, completo=True, **sem_filtro)
+    call_monday_api(delete, {"boardId": board.id, "groupId": "group_travado"})
+    itens = extrair_dados_incrementais(board.id, BOARD_NAME, **sem_filtro)
+    assert not any(item["group"]["title"] == "Travado" for item in itens), "itens do grupo excluído continuam no resultado"
+    esperados = sum(item["group"]["title"] != "Travado" for item in inicial)
+    assert len(itens) == esperados, f"esperados {esperados} itens, recebidos {len(itens)}"
+
+
+@cenario
+def exportacao_sync_sem_httpx(runner: CenarioRunner):
+    """Importar a extração síncrona não deve carregar o cliente assíncrono (httpx)."""
+    codigo = ("import sys, monday_lib.service.data_export_monday; "
+              "print(sorted(m for m in ('httpx', 'monday_lib.api_client.async_client') if m in sys.modules))")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    saida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True,
+                           env=env).stdout.strip()
+    assert saida == "[]", f"módulos assíncronos carregados: {saida}"
+
+
+@cenario
+def clientes_assincronos_fechados(runner: CenarioRunner):
+    """
+    As versões síncronas das funções assíncronas rodam o próprio event loop
+    (`asyncio.run`) e devem fechar o cliente assíncrono criado para ele; o
+    cliente de quem roda o próprio loop (`set_async_client`) fica aberto.
+    """
+    from monday_lib import (extrair_dados_por_janelas, extrair_dados_quadros, aextrair_dados_quadros, BoardSpec,
+                            set_async_client)
+    from monday_lib.api_client import async_client
+    criados = []
+
+    class ClienteRegistrado(async_client.AsyncMondayClient):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            criados.append(self)
+
+    board = runner.board(60)
+    original = async_client.AsyncMondayClient
+    async_client.AsyncMondayClient = ClienteRegistrado
+    try:
+        extrair_dados_por_janelas(board.id, BOARD_NAME, "Data de Entrega", "2025-01-01", "2025-12-31", janela_dias=90)
+        with tempfile.TemporaryDirectory() as pasta:
+            resultados = extrair_dados_quadros([BoardSpec(BOARD_NAME, board.id, "Data de Entrega", pasta,
+                                                          filtrar_por_data=False)])
+        assert all(r.ok for r in resultados), [r.erro for r in resultados]
+    finally:
+        async_client.AsyncMondayClient = original
+    assert criados, "nenhum cliente assíncrono criado"
+    assert all(cliente.http.is_closed for cliente in criados), "cliente assíncrono deixado aberto"
+
+    async def com_cliente_proprio(pasta: str) -> bool:
+        async with async_client.AsyncMondayClient() as cliente:
+            set_async_client(cliente)
+            await aextrair_dados_quadros([BoardSpec(BOARD_NAME, board.id, "Data de Entrega", pasta,
+                                                    filtrar_por_data=False)])
+            return not cliente.http.is_closed
+    with tempfile.TemporaryDirectory() as pasta:
+        assert asyncio.run(com_cliente_proprio(pasta)), "cliente de quem chamou foi fechado"
+
+
+@cenario
+def cache_grupos_invalidado_por_mutations(runner: CenarioRunner):
+    """
+    A busca de grupos usa o cache de respostas do cliente: qualquer mutation
+    do quadro (síncrona ou assíncrona, pelos serviços ou por `call_monday_api`)
+    invalida os grupos em cache, e um nome ausente força uma nova busca.
+    """
+    from monday_lib import (get_group_id, create_monday_group, acreate_monday_group, call_monday_api,
+                            acall_monday_api)
+    board = runner.board(10)
+    delete = "mutation ($boardId: ID!, $groupId: String!) { delete_group(board_id: $boardId, group_id: $groupId) { id } }"
+
+    assert get_group_id(board.id, "Feito") == "group_feito"
+    call_monday_api(delete, {"boardId": board.id, "groupId": "group_feito"})
+    assert get_group_id(board.id, "Feito") is None, "grupo excluído continua no cache"
+
+    novo = create_monday_group(board.id, "Novo")
+    assert get_group_id(board.id, "Novo") == novo
+    asyncio.run(acall_monday_api(delete, {"boardId": board.id, "groupId": novo}))
+    assert get_group_id(board.id, "Novo") is None, "exclusão assíncrona não invalidou o cache"
+
+    async def criar_e_buscar():
+        return await acreate_monday_group(board.id, "Outro")
+    outro = asyncio.run(criar_e_buscar())
+    assert get_group_id(board.id, "Outro") == outro
+
+
+@cenario
+def colunas_tardias_nos_arquivos(runner: CenarioRunner):
+    """
+    Colunas do quadro que só têm valor a partir da segunda página (aqui,
+    "Horas" e "Data de Entrega") devem estar no arquivo desde o cabeçalho,
+    em todos os formatos gravados página a página, inclusive no modo tipado.
+    """
+    import pandas as pd
+    from monday_lib import PageArchive, reprocessar_dados_monday
+    board = runner.board(20)
+    tardias = {"Horas", "Data de Entrega"}
+    itens = [board.api_item(i) for i in range(20)]
+    for item in itens[:10]:
+        item["columns"] = [col for col in item["columns"] if col["column"]["title"] not in tardias]
+    esquema = {c["title"]: {"id": c["id"], "type": c["type"]} for c in board.columns}
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, "arquivo")
+        for _ in PageArchive(arquivo).record([itens[:10], itens[10:]], board_id=board.id, subsetor=BOARD_NAME,
+                                             esquema=esquema):
+            pass
+        for formato, tipado in (("xlsx", False), ("csv", False), ("parquet", False), ("parquet", True),
+                                ("feather", True)):
+            _, _, caminho, _ = reprocessar_dados_monday(arquivo, os.path.join(pasta, f"{formato}_{tipado}"),
+                                                        tipado=tipado, formato=formato, retornar_dataframes=False)
+            df = {"xlsx": pd.read_excel, "csv": pd.read_csv, "parquet": pd.read_parquet,
+                  "feather": pd.read_feather}[formato](caminho)
+            assert tardias <= set(df.columns), f"{formato}: colunas fora do arquivo: {tardias - set(df.columns)}"
+            assert df["Horas"].iloc[:10].isna().all() and df["Horas"].iloc[10:].notna().all(), formato
+
+
+@cenario
+def colunas_tardias_dos_subitens(runner: CenarioRunner):
+    """
+    O mesmo para os subitens: o esquema do quadro de subitens (buscado uma vez,
+    pela coluna `subtasks`) fixa as colunas do arquivo de subelementos, na
+    extração e no reprocessamento de um arquivo de páginas.
+    """
+    import pandas as pd
+    from monday_lib import ColunaIDMapper, PageArchive, extrair_dados_monday, reprocessar_dados_monday
+    board = runner.board(20)
+    mapper = ColunaIDMapper(board.id, BOARD_NAME)
+    assert list(mapper.subitem_map) == [c["title"] for c in board.sub_columns], mapper.subitem_map
+    tardia = "Horas Subitem"
+    itens = [board.api_item(i) for i in range(20)]
+    for item in itens[:10]:
+        for sub in item["subitems"]:
+            sub["columns"] = [col for col in sub["columns"] if col["column"]["title"] != tardia]
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, "arquivo")
+        for _ in PageArchive(arquivo).record([itens[:10], itens[10:]], board_id=board.id, subsetor=BOARD_NAME,
+                                             esquema=mapper.coluna_map, esquema_subitens=mapper.subitem_map):
+            pass
+        for formato, tipado in (("csv", False), ("parquet", True)):
+            _, _, _, caminho = reprocessar_dados_monday(arquivo, os.path.join(pasta, f"{formato}_{tipado}"),
+                                                        tipado=tipado, formato=formato, retornar_dataframes=False)
+            df = pd.read_csv(caminho) if formato == "csv" else pd.read_parquet(caminho)
+            assert tardia in df.columns, f"{formato}: coluna '{tardia}' fora do arquivo de subelementos"
+            assert df[tardia].iloc[:10].isna().all() and df[tardia].iloc[10:].notna().all(), formato
+
+        _, caminho, _, caminho_sub = extrair_dados_monday(BOARD_NAME, board.id, None, os.path.join(pasta, "extracao"),
+                                                          filtrar_por_data=False, formato="csv",
+                                                          retornar_dataframes=False)
+        assert list(pd.read_csv(caminho_sub).columns)[4:] == list(mapper.subitem_map)
+
+
+@cenario
+def conversao_tipada_pelo_value(runner: CenarioRunner):
+    """
+    No modo tipado, com o `value` pedido à API, datas (UTC, com fuso),
+    checkbox e números são lidos só do `value`, nunca do `text` (hora no fuso
+    da conta, número formatado), e o dtype não depende da página. Sem o
+    `value`, tudo vem do `text`.
+    """
+    import pandas as pd
+    from monday_lib import ItemFlattener, PageArchive, reprocessar_dados_monday
+    esquema = {"Entrega": {"id": "data", "type": "date"}, "Ok": {"id": "check", "type": "checkbox"},
+               "Horas": {"id": "horas", "type": "numbers"}}
+
+    def item(n, entrega=None, ok=None, horas=None, com_value=True):
+        colunas = [("data", "date", "Entrega", entrega), ("check", "checkbox", "Ok", ok), ("horas", "numbers", "Horas", horas)]
+        return {"id": str(n), "name": f"Item {n}", "group": {"title": "Feito"}, "subitems": [], "columns": [
+            {"id": id_, "type": tipo, "column": {"title": titulo}, "text": valor[0] if valor else ""}
+            | ({"value": valor[1] if valor else None} if com_value else {})
+            for id_, tipo, titulo, valor in colunas if valor is not False]}
+
+    paginas = [
+        [item(1, entrega=("2025-03-02 02:30", '{"date":"2025-03-01","time":"23:30:00"}'),
+              ok=("v", '{"checked":"true"}'), horas=("12,5 h", '"12.5"')),
+         item(2)],
+        [item(3, entrega=False, ok=("", None), horas=("3 h", '"3"'))],
+    ]
+    flattener = ItemFlattener(esquema, tipado=True, todas_colunas=True)
+    frames = []
+    for pagina in paginas:
+        flattener.add_page(pagina)
+        frames.append(flattener.take_frames()[0])
+    assert all(str(df["Entrega"].dtype) == "datetime64[ns, UTC]" for df in frames), [df.dtypes for df in frames]
+    primeira = frames[0]
+    assert primeira["Entrega"].iloc[0] == pd.Timestamp("2025-03-01 23:30", tz="UTC")
+    assert primeira["Entrega"].isna().iloc[1]
+    assert primeira["Ok"].tolist() == [True, False] and frames[1]["Ok"].tolist() == [False]
+    assert primeira["Horas"].iloc[0] == 12.5 and frames[1]["Horas"].iloc[0] == 3.0
+
+    sem_value = ItemFlattener(esquema, tipado=True)
+    sem_value.add_page([item(1, entrega=("2025-03-02 02:30", None), ok=("v", None), horas=("7", None), com_value=False)])
+    df = sem_value.to_frames()[0]
+    assert df["Entrega"].iloc[0] == pd.Timestamp("2025-03-02 02:30") and df["Ok"].iloc[0] and df["Horas"].iloc[0] == 7
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, "arquivo")
+        for _ in PageArchive(arquivo).record(paginas, board_id="1", subsetor=BOARD_NAME, esquema=esquema):
+            pass
+        _, _, xlsx, _ = reprocessar_dados_monday(arquivo, os.path.join(pasta, "xlsx"), tipado=True, formato="xlsx",
+                                                 retornar_dataframes=False)
+        assert pd.read_excel(xlsx)["Entrega"].iloc[0] == pd.Timestamp("2025-03-01 23:30")
+
+
+@cenario
+def janelas_divididas_sem_repeticao(runner: CenarioRunner):
+    """
+    Extração por janelas em que as janelas passam de `max_paginas_janela`
+    páginas e são divididas: os itens já lidos são mantidos e o resultado tem
+    os mesmos itens da extração paginada, sem repetições.
+    """
+    from monday_lib import extrair_dados_paginados, extrair_dados_por_janelas
+    board = runner.board(400)
+    datas = dict(column_name="Data de Entrega", init_date="2025-01-01", end_date="2025-12-31")
+    esperado = extrair_dados_paginados(board.id, BOARD_NAME, tamanho_pagina=100, **datas)
+
+    mensagens = []
+    handler = logging.Handler(logging.INFO)
+    handler.emit = lambda record: mensagens.append(record.getMessage())
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    try:
+        itens = extrair_dados_por_janelas(board.id, BOARD_NAME, janela_dias=120, max_paginas_janela=2,
+                                          tamanho_pagina=10, **datas)
+    finally:
+        root.removeHandler(handler)
+        root.setLevel(logging.WARNING)
+    assert any("dividindo em duas" in m for m in mensagens), "nenhuma janela foi dividida"
+    ids = [item["id"] for item in itens]
+    assert len(ids) == len(set(ids)), f"{len(ids) - len(set(ids))} itens repetidos"
+    assert set(ids) == {item["id"] for item in esperado}, "itens diferentes da extração paginada"
+
+
+@cenario
+def preparacao_do_quadro_em_uma_chamada(runner: CenarioRunner):
+    """
+    As leituras de preparação de um quadro (mapa de colunas, grupos e
+    contagem de itens) vão juntas em uma única chamada à API, na extração
+    e no upload.
+    """
+    import pandas as pd
+    from monday_lib import extrair_dados_paginados, extrair_dados_monday, create_items_in_group
+    stats = runner.server.stats
+
+    board = runner.board(30)
+    antes = stats["requests"]
+    itens = extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=False, colunas=["Cliente"], grupos=["Feito"])
+    chamadas = stats["requests"] - antes
+    assert len(itens) == 10 and all(item["group"]["title"] == "Feito" for item in itens)
+    assert chamadas == 2, f"esperadas 2 chamadas (preparação + página), feitas {chamadas}"
+
+    # A gravação reaproveita o mapa da preparação; as colunas dos subitens (de
+    # outro quadro) são buscadas uma vez, quando usadas
+    board = runner.board(30)
+    with tempfile.TemporaryDirectory() as pasta:
+        for esperadas in (3, 1):
+            antes = stats["requests"]
+            extrair_dados_monday(BOARD_NAME, board.id, None, pasta, filtrar_por_data=False, filtrar_grupo="Feito",
+                                 formato="csv", retornar_dataframes=False)
+            chamadas = stats["requests"] - antes
+            assert chamadas == esperadas, f"esperadas {esperadas} chamadas, feitas {chamadas}"
+
+    board = runner.board(10)
+    df = pd.DataFrame({"Nome": [f"Novo {i}" for i in range(25)], "Cliente": ["ACME"] * 25})
+    antes = stats["requests"]
+    resumo = create_items_in_group(board.id, "group_feito", df, BOARD_NAME, batch_size=10)
+    chamadas = stats["requests"] - antes
+    assert resumo["success_count"] == 25 and board.items_count() == 35
+    assert chamadas == 4, f"esperadas 4 chamadas (preparação + 3 lotes), feitas {chamadas}"
+
+
+@cenario
+def retentativas_e_orcamento(runner: CenarioRunner):
+    """
+    O `Retry-After` da API é a espera mínima, mesmo acima de `max_delay`, e
+    só o prazo total o limita. No cliente assíncrono, quem espera vaga no
+    semáforo não reserva orçamento de complexidade.
+    """
+    from monday_lib import RetryPolicy, Deadline, APIRateLimitError, ComplexityBudget
+    from monday_lib.api_client.async_client import AsyncMondayClient
+    from monday_lib.api_client.rate_limit import operation_key
+
+    politica = RetryPolicy(base_delay=0.01, max_delay=0.05)
+    erro = APIRateLimitError("reset in 2 seconds", retry_after=2)
+    espera = politica.next_delay(erro, 1, Deadline())
+    assert espera is not None and espera >= 2, f"Retry-After encurtado: {espera}"
+    assert politica.next_delay(erro, 1, Deadline(1)) is None, "espera além do prazo total"
+
+    board = runner.board(5)
+    query = "query ($boardId: [ID!]) { boards(ids: $boardId) { id } }"
+    orcamento = ComplexityBudget(capacity=1_000_000)
+    uma_chamada = orcamento.estimate(operation_key(query))
+
+    async def chamadas_concorrentes() -> float:
+        async with AsyncMondayClient(max_concurrency=1, budget=orcamento) as cliente:
+            tarefas = [asyncio.create_task(cliente.execute(query, {"boardId": [board.id]}, use_cache=False))
+                       for _ in range(5)]
+            await asyncio.sleep(0.1)
+            reservado = orcamento._in_flight
+            await asyncio.gather(*tarefas)
+            return reservado
+
+    runner.server.latency = 0.3
+    try:
+        reservado = asyncio.run(chamadas_concorrentes())
+    finally:
+        runner.server.latency = 0.0
+    assert reservado == uma_chamada, f"reservado {reservado} com uma chamada em andamento ({uma_chamada} cada)"
+
+
+@cenario
+def upload_com_timeout_sync_e_async(runner: CenarioRunner):
+    """
+    `create_items_in_group` e `acreate_items_in_group` tratam igual um lote com
+    Timeout (504): os itens do lote são conferidos pela contagem do quadro no
+    fim, e o resumo é o mesmo nas duas versões.
+    """
+    import pandas as pd
+    from monday_lib import create_items_in_group, acreate_items_in_group
+    server = runner.server
+    df = pd.DataFrame({"Nome": [f"Novo {i}" for i in range(25)], "Cliente": ["ACME"] * 25})
+
+    uploads = {
+        "sync": lambda board: create_items_in_group(board.id, "group_feito", df, BOARD_NAME, batch_size=10),
+        "async": lambda board: asyncio.run(acreate_items_in_group(board.id, "group_feito", df, BOARD_NAME,
+                                                                  batch_size=10)),
+    }
+    for versao, upload in uploads.items():
+        board = runner.board(10)
+        antes = server.stats["requests"]
+        # Preparação, lote 1, lote 2 (504, mas aplicado), lote 3 e a contagem final
+        server.timeout_every = antes + 3
+        try:
+            resumo = upload(board)
+        finally:
+            server.timeout_every = 0
+        chamadas = server.stats["requests"] - antes
+        assert board.items_count() == 35, versao
+        assert resumo["timeout_batches"] == [{"batch_number": 2, "item_count": 10}], (versao, resumo["timeout_batches"])
+        assert resumo["success_count"] == 25 and resumo["uncreated_items_after_timeout"] == 0, (versao, resumo)
+        assert len(resumo["created_ids"]) == 15, (versao, len(resumo["created_ids"]))
+        assert chamadas == 5, f"{versao}: esperadas 5 chamadas, feitas {chamadas}"
+
+
+@cenario
+def sessao_http_reaproveitada(runner: CenarioRunner):
+    """
+    Chamadas seguidas pelo cliente compartilhado reaproveitam a mesma conexão
+    (keep-alive) e pedem as respostas comprimidas (gzip).
+    """
+    from monday_lib import call_monday_api
+    stats = runner.server.stats
+    board = runner.board(5)
+    query = "query ($boardId: [ID!]) { boards(ids: $boardId) { id } }"
+
+    call_monday_api(query, {"boardId": [board.id]}, refresh=True)
+    antes = dict(stats)
+    for _ in range(20):
+        call_monday_api(query, {"boardId": [board.id]}, refresh=True)
+    conexoes = stats["connections"] - antes["connections"]
+    assert stats["requests"] - antes["requests"] == 20
+    assert conexoes == 0, f"{conexoes} conexões novas em 20 chamadas"
+    assert stats["compressed"] - antes["compressed"] == 20, "respostas sem gzip"
+
+
+@cenario
+def retentativas_504_e_429(runner: CenarioRunner):
+    """
+    Queries que recebem 504 são repetidas e a extração vem completa; um 429
+    por orçamento esgotado espera o `Retry-After` do servidor e a chamada
+    é bem-sucedida em seguida.
+    """
+    from monday_lib import extrair_dados_paginados, call_monday_api
+    server = runner.server
+    board = runner.board(120)
+    kwargs = dict(filtrar_por_data=False, tamanho_pagina=20)
+    esperado = extrair_dados_paginados(board.id, BOARD_NAME, **kwargs)
+
+    timeouts = server.stats["timeouts"]
+    server.timeout_every = 3
+    try:
+        itens = extrair_dados_paginados(board.id, BOARD_NAME, **kwargs)
+    finally:
+        server.timeout_every = 0
+    assert server.stats["timeouts"] > timeouts, "nenhum 504 simulado"
+    assert itens == esperado, "extração com 504 diferente da extração sem falhas"
+
+    limitadas = server.stats["rate_limited"]
+    with server.lock:
+        # Orçamento esgotado, com a janela do servidor renovada em menos de 1s (Retry-After: 1)
+        server._budget_left = 0
+        server._window_start = time.monotonic() - 59.2
+    inicio = time.monotonic()
+    data = call_monday_api("query ($boardId: [ID!]) { boards(ids: $boardId) { id } }", {"boardId": [board.id]},
+                           refresh=True)
+    assert data["boards"][0]["id"] == board.id
+    assert server.stats["rate_limited"] == limitadas + 1, "429 não simulado ou repetido antes do Retry-After"
+    assert time.monotonic() - inicio >= 1, "Retry-After não respeitado"
+
+
+@cenario
+def cache_de_respostas_chaves_e_validade(runner: CenarioRunner):
+    """
+    O cache de respostas separa as entradas pelas variáveis da query, descarta
+    as do quadro alterado por uma mutation, expira pelo TTL da operação,
+    descarta as menos usadas ao passar de `max_entries` e, com `disk=True`,
+    atende um cache novo (outro processo) a partir do disco.
+    """
+    from monday_lib import MondayClient, ResponseCache
+    from monday_lib.queries.templates import QUERY_BOARD_ITEM_COUNT
+    stats = runner.server.stats
+    create = ("mutation ($boardId: ID!, $itemName: String!) "
+              "{ create_item(board_id: $boardId, item_name: $itemName) { id } }")
+    a, b, c = runner.board(10), runner.board(20), runner.board(30)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        cache = ResponseCache(max_entries=2, ttls={"getBoardItemCount": 0.5}, disk=True, disk_path=pasta)
+        cliente = MondayClient(cache=cache)
+
+        def contagem(board) -> tuple[int, int]:
+            antes = stats["requests"]
+            data = cliente.execute(QUERY_BOARD_ITEM_COUNT, {"boardId": board.id})
+            return data["boards"][0]["items_count"], stats["requests"] - antes
+
+        assert contagem(a) == (10, 1) and contagem(a) == (10, 0)
+        assert contagem(b) == (20, 1), "variáveis diferentes reaproveitaram a mesma entrada"
+        cliente.execute(create, {"boardId": a.id, "itemName": "Novo"})
+        assert contagem(a) == (11, 1), "mutation não invalidou a entrada do quadro"
+        assert contagem(b) == (20, 0), "mutation invalidou a entrada de outro quadro"
+
+        # Um cache novo na mesma pasta (ex: outra execução) lê as entradas do disco
+        antes = stats["requests"]
+        data = MondayClient(cache=ResponseCache(disk=True, disk_path=pasta)).execute(
+            QUERY_BOARD_ITEM_COUNT, {"boardId": b.id})
+        assert data["boards"][0]["items_count"] == 20 and stats["requests"] == antes, "entrada em disco não usada"
+
+        time.sleep(0.6)
+        assert contagem(b) == (20, 1), "entrada expirada ainda usada"
+
+    cliente = MondayClient(cache=ResponseCache(max_entries=2, ttls={"getBoardItemCount": 60}))
+    for board in (a, b, c):
+        contagem(board)
+    assert contagem(c)[1] == 0 and contagem(b)[1] == 0
+    assert contagem(a)[1] == 1, "entrada menos usada não foi descartada"
+
+
+@cenario
+def leitura_em_streaming_igual_a_completa(runner: CenarioRunner):
+    """
+    A leitura das páginas em streaming (item a item) traz os mesmos itens da
+    leitura da resposta inteira: primeira página, continuações pelo cursor,
+    items_page de um grupo, projeção de colunas e `value` bruto.
+    """
+    from monday_lib import extrair_dados_paginados
+    board = runner.board(130, subitems=2)
+    variantes = [
+        dict(filtrar_por_data=False, tamanho_pagina=40),
+        dict(filtrar_por_data=True, column_name="Data de Entrega", init_date="2025-01-01", end_date="2025-06-30",
+             tamanho_pagina=25),
+        dict(filtrar_por_data=False, grupos=["Feito", "Travado"], colunas=["Cliente", "Status"], tamanho_pagina=15),
+        dict(filtrar_por_data=False, valores_brutos=True, tamanho_pagina=50),
+    ]
+    for kwargs in variantes:
+        esperado = extrair_dados_paginados(board.id, BOARD_NAME, **kwargs)
+        itens = extrair_dados_paginados(board.id, BOARD_NAME, streaming=True, **kwargs)
+        assert esperado, kwargs
+        assert itens == esperado, f"streaming diferente da leitura completa: {kwargs}"
+
+
+@cenario
+def metricas_por_chamada(runner: CenarioRunner):
+    """
+    Os hooks do cliente recebem as métricas de cada tentativa de chamada, com
+    a função e a página de origem; o `MetricsRegistry` do cliente soma as
+    chamadas e as retentativas por operação.
+    """
+    from monday_lib import MondayClient, MetricsRegistry, extrair_dados_paginados, get_client, set_client
+    board = runner.board(60)
+    registros = []
+    registro = MetricsRegistry()
+    original = get_client()
+    set_client(MondayClient(metrics=registro, hooks=[registros.append]))
+    # 504 na 3ª página (sem filtro nem projeção, a extração não faz chamadas de preparação)
+    runner.server.timeout_every = runner.server.stats["requests"] + 3
+    try:
+        itens = extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=False, tamanho_pagina=20)
+    finally:
+        runner.server.timeout_every = 0
+        set_client(original)
+    assert len(itens) == 60
+
+    paginas = [m for m in registros if m.page is not None]
+    assert [(m.page, m.attempt) for m in paginas] == [(1, 1), (2, 1), (3, 1), (3, 2)], paginas
+    assert [m.status_code for m in paginas] == [200, 200, 504, 200]
+    assert all(m.function == "extrair_dados_paginados" for m in registros), {m.function for m in registros}
+    assert all(m.response_bytes > 0 and m.total_time > 0 for m in registros)
+    assert all(m.complexity_cost for m in registros if m.status_code == 200)
+
+    texto = registro.to_prometheus()
+    assert 'status="504"' in texto and "retries" in texto, texto
+
+
+@cenario
+def servidor_mock_aceita_as_queries_da_biblioteca(runner: CenarioRunner):
+    """
+    Toda query que a biblioteca monta (templates .gql e `queries.builder`, com
+    o bloco `complexity` injetado) é válida no schema do servidor mock, e o
+    benchmark roda de ponta a ponta contra ele.
+    """
+    from itertools import product
+    from graphql import parse, validate
+    from mock_monday_server import SCHEMA
+    from monday_lib.queries import builder, templates
+    from monday_lib.api_client.rate_limit import inject_complexity
+
+    queries = {name: templates.get_query(file) for name, file in templates.QUERY_NAMES.items()}
+    for flags in product((False, True), repeat=5):
+        queries[f"items_page{flags}"] = builder.build_items_page_query(*flags)
+    for flags in product((False, True), repeat=3):
+        queries[f"next_items_page{flags}"] = builder.build_next_items_page_query(*flags)
+    for values in (False, True):
+        queries[f"subitems({values})"] = builder.build_subitems_query(values)
+    for name, query in queries.items():
+        errors = validate(SCHEMA, parse(inject_complexity(query)))
+        assert not errors, f"{name}: {errors[0].message}"
+
+    benchmark = Path(__file__).parent / "benchmark.py"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    saida = subprocess.run([sys.executable, str(benchmark), "--sizes", "200"], capture_output=True, text=True,
+                           env=env)
+    assert saida.returncode == 0, saida.stderr[-2000:]
+    assert all(nome in saida.stdout for nome in ("extract", "list2dfs", "prepare_batch", "create_items")), saida.stdout
+
+
+@cenario
+def importacao_sem_efeitos_colaterais(runner: CenarioRunner):
+    """
+    `import monday_lib` não carrega pandas, requests, httpx nem módulos internos
+    e não configura o logging; todo nome de `__all__` é resolvido sob demanda.
+    """
+    codigo = ("import sys, logging, monday_lib; "
+              "carregados = sorted(m for m in sys.modules if m.split('.')[0] in ('pandas', 'requests', 'httpx') "
+              "or (m.startswith('monday_lib.'))); "
+              "print(carregados, len(logging.getLogger().handlers)); "
+              "faltando = [n for n in monday_lib.__all__ if getattr(monday_lib, n, None) is None]; "
+              "print(faltando)")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    saida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True,
+                           env=env).stdout.strip().splitlines()
+    assert saida[0] == "[] 0", f"importação com efeitos colaterais: {saida[0]}"
+    assert saida[1] == "[]", f"nomes públicos sem definição: {saida[1]}"
+
+
+@cenario
+def exportacao_por_gerador(runner: CenarioRunner):
+    """
+    `iter_items_paginados` entrega os mesmos itens de `extrair_dados_paginados`,
+    mas só busca uma página quando ela é consumida; `por_pagina=True` entrega
+    as páginas inteiras e `aiter_items_paginados` tem o mesmo resultado.
+    """
+    from monday_lib import extrair_dados_paginados, iter_items_paginados, aiter_items_paginados
+    stats = runner.server.stats
+    board = runner.board(100)
+    kwargs = dict(filtrar_por_data=False, tamanho_pagina=30)
+    esperado = extrair_dados_paginados(board.id, BOARD_NAME, **kwargs)
+
+    antes = stats["requests"]
+    itens = iter_items_paginados(board.id, BOARD_NAME, **kwargs)
+    primeiros = [next(itens) for _ in range(30)]
+    assert stats["requests"] - antes == 1, "páginas buscadas antes de serem consumidas"
+    next(itens)
+    assert stats["requests"] - antes == 2
+    itens.close()
+    assert primeiros == esperado[:30]
+
+    paginas = list(iter_items_paginados(board.id, BOARD_NAME, por_pagina=True, **kwargs))
+    assert [len(p) for p in paginas] == [30, 30, 30, 10]
+    assert [item for pagina in paginas for item in pagina] == esperado
+
+    async def coletar():
+        return [item async for item in aiter_items_paginados(board.id, BOARD_NAME, **kwargs)]
+    assert asyncio.run(coletar()) == esperado, "versão assíncrona diferente"
+
+
+@cenario
+def incremental_mescla_alteracoes(runner: CenarioRunner):
+    """
+    A extração incremental mescla no resultado salvo só o que mudou desde a
+    marca d'água: itens alterados e criados entram, excluídos e os que saíram
+    do período de datas saem. O resultado é o mesmo de uma extração completa,
+    buscando só os itens alterados.
+    """
+    from monday_lib import call_monday_api, extrair_dados_incrementais, extrair_dados_paginados, get_settings
+    stats = runner.server.stats
+    board = runner.board(200)
+    kwargs = dict(filtrar_por_data=True, column_name="Data de Entrega", init_date="2025-01-01",
+                  end_date="2025-06-30", tamanho_pagina=40)
+
+    inicial = {item["id"]: item for item in extrair_dados_incrementais(board.id, BOARD_NAME, completo=True, **kwargs)}
+    assert (get_settings().PERSIST_PATH / BOARD_NAME / f"{board.id}_incremental.pkl").exists()
+    alterado, saiu_do_periodo, excluido = list(inicial)[:3]
+
+    change = ("mutation ($boardId: ID!, $itemId: ID!, $values: JSON!) "
+              "{ change_multiple_column_values(board_id: $boardId, item_id: $itemId, column_values: $values) { id } }")
+    call_monday_api(change, {"boardId": board.id, "itemId": alterado, "values": '{"text": "Cliente Novo"}'})
+    call_monday_api(change, {"boardId": board.id, "itemId": saiu_do_periodo, "values": '{"date4": {"date": "2025-12-01"}}'})
+    call_monday_api("mutation ($itemId: ID!) { delete_item(item_id: $itemId) { id } }", {"itemId": excluido})
+    novo = call_monday_api("mutation ($boardId: ID!, $itemName: String!, $values: JSON!) "
+                           "{ create_item(board_id: $boardId, item_name: $itemName, column_values: $values) { id } }",
+                           {"boardId": board.id, "itemName": "Novo", "values": '{"date4": {"date": "2025-03-01"}}'})
+    novo = novo["create_item"]["id"]
+
+    antes = dict(stats)
+    itens = {item["id"]: item for item in extrair_dados_incrementais(board.id, BOARD_NAME, **kwargs)}
+    assert stats["items_served"] - antes["items_served"] == 3, "busca incremental trouxe itens não alterados"
+    esperado = {item["id"]: item for item in extrair_dados_paginados(board.id, BOARD_NAME, **kwargs)}
+    assert itens == esperado, "resultado incremental diferente da extração completa"
+    assert novo in itens and excluido not in itens and saiu_do_periodo not in itens
+    cliente = next(c["text"] for c in itens[alterado]["columns"] if c["column"]["title"] == "Cliente")
+    assert cliente == "Cliente Novo", cliente
+
+
+@cenario
+def projecao_de_colunas(runner: CenarioRunner):
+    """
+    Com `colunas`, os itens trazem só os valores dessas colunas, iguais aos
+    da extração completa (e os mesmos campos fixos); um título que não existe no quadro é um ValueError.
+    """
+    from monday_lib import extrair_dados_paginados
+    board = runner.board(50)
+    completo = extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=False, tamanho_pagina=25)
+    itens = extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=False, tamanho_pagina=25,
+                                    colunas=["Status", "Horas", "Status"])
+
+    titulos = lambda item: [c["column"]["title"] for c in item["columns"]]
+    assert [item["id"] for item in itens] == [item["id"] for item in completo]
+    for item, original in zip(itens, completo):
+        assert sorted(titulos(item)) == ["Horas", "Status"], titulos(item)
+        assert item["columns"] == [c for c in original["columns"] if c["column"]["title"] in ("Status", "Horas")]
+        assert (item["name"], item["group"]) == (original["name"], original["group"])
+
+    try:
+        extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=False, colunas=["Não existe"])
+    except ValueError as e:
+        assert "Não existe" in str(e), e
+    else:
+        raise AssertionError("coluna inexistente não foi detectada")
+
+
+@cenario
+def filtro_de_grupos_no_servidor(runner: CenarioRunner):
+    """
+    Com `grupos`, só os itens desses grupos são lidos do servidor (um
+    items_page por grupo), com ou sem filtro de datas, e o resultado é o da
+    extração completa filtrada pelo grupo.
+    """
+    from monday_lib import extrair_dados_paginados
+    stats = runner.server.stats
+    board = runner.board(90, subitems=0)
+    for filtro in (dict(filtrar_por_data=False),
+                   dict(filtrar_por_data=True, column_name="Data de Entrega", init_date="2025-02-01",
+                        end_date="2025-09-30")):
+        completo = extrair_dados_paginados(board.id, BOARD_NAME, tamanho_pagina=20, **filtro)
+        esperado = [item for item in completo if item["group"]["title"] in ("Feito", "Travado")]
+
+        antes = stats["items_served"]
+        itens = extrair_dados_paginados(board.id, BOARD_NAME, tamanho_pagina=20, grupos=["Travado", "Feito"], **filtro)
+        servidos = stats["items_served"] - antes
+        assert sorted(i["id"] for i in itens) == sorted(i["id"] for i in esperado), filtro
+        assert servidos == len(esperado), f"{servidos} itens lidos para {len(esperado)} dos grupos: {filtro}"
+
+    try:
+        extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=False, grupos=["Não existe"])
+    except ValueError as e:
+        assert "Não existe" in str(e), e
+    else:
+        raise AssertionError("grupo inexistente não foi detectado")
+
+
+@cenario
+def tamanho_de_pagina_adaptativo(runner: CenarioRunner):
+    """
+    Com um `PageSizeController`, as páginas crescem enquanto são rápidas e
+    baratas, caem pela metade depois de um 504 e encolhem quando passam da
+    latência alvo; os itens são os mesmos da extração com tamanho fixo.
+    """
+    from monday_lib import extrair_dados_paginados, iter_items_paginados, PageSizeController
+    server = runner.server
+    board = runner.board(1500, subitems=0)
+    esperado = extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=False, tamanho_pagina=500)
+
+    def paginas(controle: PageSizeController) -> list[int]:
+        tamanhos, itens = [], []
+        for pagina in iter_items_paginados(board.id, BOARD_NAME, filtrar_por_data=False, por_pagina=True,
+                                           tamanho_pagina=controle):
+            tamanhos.append(len(pagina))
+            itens.extend(pagina)
+        assert itens == esperado, "itens diferentes da extração com tamanho fixo"
+        return tamanhos
+
+    tamanhos = paginas(PageSizeController(initial=20, minimum=10, maximum=300))
+    assert tamanhos[:5] == [20, 30, 45, 67, 100] and max(tamanhos) == 300, tamanhos
+
+    # 504 na 4ª página: as seguintes vêm com a metade do tamanho, que só volta a crescer
+    # quando a taxa de 504 cai abaixo de `max_timeout_rate`
+    server.timeout_every = server.stats["requests"] + 4
+    try:
+        tamanhos = paginas(PageSizeController(initial=20, minimum=10, maximum=300))
+    finally:
+        server.timeout_every = 0
+    assert tamanhos[:11] == [20, 30, 45, 67] + [33] * 6 + [49], tamanhos
+
+    # ~2ms por item: páginas acima de ~100 itens passam da latência alvo de 0.2s
+    server.latency_per_item = 0.002
+    try:
+        tamanhos = paginas(PageSizeController(initial=50, minimum=10, target_latency=0.2))
+    finally:
+        server.latency_per_item = 0.0
+    assert max(tamanhos) <= 150 and tamanhos[-2] <= 110, tamanhos
+
+
+@cenario
+def continuacao_por_next_items_page(runner: CenarioRunner):
+    """
+    Só a primeira página de cada items_page passa pelo quadro; as seguintes usam
+    a raiz `next_items_page`, enviando apenas o cursor e o `limit` (mais as
+    colunas da projeção), sem repetir o quadro nem as regras.
+    """
+    from monday_lib import extrair_dados_paginados
+    server = runner.server
+    board = runner.board(100)
+    corpos = []
+    handle = server.handle
+
+    def registrar(body: dict):
+        corpos.append(body)
+        return handle(body)
+
+    server.handle = registrar
+    try:
+        itens = extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=True, column_name="Data de Entrega",
+                                        init_date="2025-01-01", end_date="2025-12-31", tamanho_pagina=30,
+                                        colunas=["Status"])
+    finally:
+        server.handle = handle
+    paginas = [b for b in corpos if "items_page" in b["query"] or "next_items_page" in b["query"]]
+    assert len(itens) == 100 and len(paginas) == 4, (len(itens), len(paginas))
+    assert "next_items_page" not in paginas[0]["query"] and "rules" in paginas[0]["variables"]
+    for body in paginas[1:]:
+        assert "next_items_page" in body["query"] and "boards" not in body["query"], body["query"]
+        assert set(body["variables"]) == {"cursor", "limit", "columnIds"}, body["variables"]
+
+
+@cenario
+def subitens_opcionais_e_adiados(runner: CenarioRunner):
+    """
+    `subitens="deferred"` traz os mesmos itens e subitens do modo `inline`,
+    buscando os subitens em lotes de `items(ids:)` (vários lotes por chamada
+    com `subitens_paralelos`, também na versão assíncrona); `"none"` não pede
+    os subitens.
+    """
+    from monday_lib import extrair_dados_paginados, aextrair_dados_paginados
+    stats = runner.server.stats
+    board = runner.board(250, subitems=2)
+    kwargs = dict(filtrar_por_data=False, tamanho_pagina=250)
+    inline = extrair_dados_paginados(board.id, BOARD_NAME, **kwargs)
+    assert all(len(item["subitems"]) == 2 for item in inline)
+
+    for paralelos, chamadas in ((1, 4), (3, 2)):
+        antes = stats["requests"]
+        adiados = extrair_dados_paginados(board.id, BOARD_NAME, subitens="deferred", subitens_paralelos=paralelos,
+                                          **kwargs)
+        assert adiados == inline, f"subitens adiados diferentes do modo inline (paralelos={paralelos})"
+        feitas = stats["requests"] - antes
+        assert feitas == chamadas, f"paralelos={paralelos}: esperadas {chamadas} chamadas, feitas {feitas}"
+
+    adiados = asyncio.run(aextrair_dados_paginados(board.id, BOARD_NAME, subitens="deferred", subitens_paralelos=3,
+                                                   **kwargs))
+    assert adiados == inline, "subitens adiados diferentes na versão assíncrona"
+
+    sem_subitens = extrair_dados_paginados(board.id, BOARD_NAME, subitens="none", **kwargs)
+    assert not any(item.get("subitems") for item in sem_subitens)
+    assert [{**item, "subitems": None} for item in sem_subitens] == [{**item, "subitems": None} for item in inline]
+
+
+@cenario
+def varios_quadros_com_falha_isolada(runner: CenarioRunner):
+    """
+    `extrair_dados_quadros` devolve um resultado por quadro, na ordem dos specs
+    (`BoardSpec` ou dicionário): os quadros ok têm os arquivos e os totais de
+    elementos e subelementos, e a falha de um quadro fica só no resultado dele.
+    """
+    from monday_lib import extrair_dados_quadros, BoardSpec
+    a, b, c = runner.board(40), runner.board(70, subitems=2), runner.board(10)
+    with tempfile.TemporaryDirectory() as pasta:
+        specs = [
+            BoardSpec(BOARD_NAME, a.id, "Data de Entrega", pasta, filtrar_por_data=False, formato="csv"),
+            dict(nome_subsetor=BOARD_NAME, id_board=c.id, nome_coluna_data="Data de Entrega", caminho_arquivos=pasta,
+                 filtrar_por_data=False, filtrar_grupo="Não existe", formato="csv"),
+            BoardSpec(BOARD_NAME, b.id, "Data de Entrega", pasta, filtrar_por_data=False, filtrar_grupo="Feito",
+                      formato="csv"),
+        ]
+        resultados = extrair_dados_quadros(specs, max_quadros=2)
+
+        assert [r.spec.id_board for r in resultados] == [a.id, c.id, b.id]
+        ok_a, falha, ok_b = resultados
+        assert ok_a.ok and ok_b.ok, (ok_a.erro, ok_b.erro)
+        assert (ok_a.total_elementos, ok_a.total_subelementos) == (40, 40)
+        assert (ok_b.total_elementos, ok_b.total_subelementos) == (23, 46)
+        assert all(Path(arquivo).exists() for r in (ok_a, ok_b) for arquivo in (r.arquivo_elementos, r.arquivo_subelementos))
+        assert not falha.ok and "Não existe" in falha.erro and isinstance(falha.excecao, ValueError), falha
+        assert falha.arquivo_elementos is None
+
+
+@cenario
+def retomada_pelo_checkpoint(runner: CenarioRunner):
+    """
+    Exportação com `job_id` (sem streaming) interrompida no meio da 2ª parte
+    (grupo): a retomada entrega as páginas salvas e busca só as que faltam, o
+    resultado é o da exportação sem interrupção e o checkpoint é apagado no
+    fim. Com outros parâmetros, o checkpoint é descartado.
+    """
+    from monday_lib import extrair_dados_paginados, iter_items_paginados, get_settings
+    stats = runner.server.stats
+    board = runner.board(120)
+    kwargs = dict(filtrar_por_data=False, grupos=["Em andamento", "Feito", "Travado"], tamanho_pagina=15)
+    esperado = extrair_dados_paginados(board.id, BOARD_NAME, **kwargs)
+
+    job_id = f"cenario_{uuid.uuid4().hex[:8]}"
+    pasta = get_settings().PERSIST_PATH / "checkpoints" / job_id
+    paginas = iter_items_paginados(board.id, BOARD_NAME, job_id=job_id, por_pagina=True, **kwargs)
+    for _ in range(4):
+        next(paginas)
+    paginas.close()  # parte 1 concluída (3 páginas) e 1 página da parte 2
+    assert pasta.exists()
+
+    antes = stats["items_served"]
+    itens = extrair_dados_paginados(board.id, BOARD_NAME, job_id=job_id, **kwargs)
+    assert itens == esperado, "itens diferentes da exportação sem interrupção"
+    lidos = stats["items_served"] - antes
+    assert lidos == 120 - 55, f"a retomada leu {lidos} itens da API (esperados {120 - 55})"
+    assert not pasta.exists(), "checkpoint não foi apagado no fim"
+
+    paginas = iter_items_paginados(board.id, BOARD_NAME, job_id=job_id, por_pagina=True, **kwargs)
+    next(paginas)
+    paginas.close()
+    antes = stats["items_served"]
+    outros = extrair_dados_paginados(board.id, BOARD_NAME, job_id=job_id, colunas=["Status"], **kwargs)
+    assert len(outros) == 120 and stats["items_served"] - antes == 120, "checkpoint de outros parâmetros reaproveitado"
+
+
+@cenario
+def achatamento_colunar_igual_ao_por_linha(runner: CenarioRunner):
+    """
+    O achatamento colunar (`ItemFlattener`, usado por `list2dfs`) monta as
+    mesmas tabelas do achatamento antigo, um dicionário por linha, inclusive
+    com colunas ausentes em parte dos itens; entregue página a página
+    (`take_frames`), o resultado concatenado é o mesmo.
+    """
+    import pandas as pd
+    from monday_lib import extrair_dados_paginados, ItemFlattener
+    from monday_lib.utils.handler import list2dfs, _obter_valor_coluna
+    board = runner.board(90, subitems=2)
+    itens = extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=False, tamanho_pagina=30)
+    for i, item in enumerate(itens):
+        # Colunas que faltam em parte dos itens (ex: páginas com projeção)
+        item["columns"] = item["columns"][i % 3:]
+
+    linhas, sublinhas = [], []
+    for item in itens:
+        linhas.append({"id": item["id"], "grupo": item["group"]["title"], "nome": item["name"],
+                       **_obter_valor_coluna(item["columns"])})
+        for sub in item["subitems"]:
+            sublinhas.append({"item_pai_id": item["id"], "item_pai_nome": item["name"], "subitem_id": sub["id"],
+                              "subitem_nome": sub["name"], **_obter_valor_coluna(sub["columns"])})
+    esperado = (pd.DataFrame(linhas), pd.DataFrame(sublinhas))
+
+    def igual(obtido: tuple, referencia: tuple):
+        for df, ref in zip(obtido, referencia):
+            pd.testing.assert_frame_equal(df.reset_index(drop=True).fillna(""), ref.fillna(""), check_dtype=False)
+
+    igual(list2dfs(itens), esperado)
+    flattener = ItemFlattener(acumular=False)
+    partes = []
+    for inicio in range(0, len(itens), 30):
+        flattener.add_page(itens[inicio:inicio + 30])
+        partes.append(flattener.take_frames())
+    igual([pd.concat([p[k] for p in partes]) for k in (0, 1)], esperado)
+
+
+@cenario
+def excel_em_streaming_com_varias_planilhas(runner: CenarioRunner):
+    """
+    A gravação do .xlsx página a página continua em uma nova planilha, com o
+    mesmo cabeçalho, quando a atual chega a `EXCEL_MAX_ROWS` linhas; lidas em
+    sequência, as planilhas têm as linhas dos DataFrames retornados. Sem
+    `retornar_dataframes`, nada fica acumulado e só os arquivos são gerados.
+    """
+    import pandas as pd
+    from monday_lib import extrair_dados_monday
+    from monday_lib.utils import writers
+    board = runner.board(2500, subitems=0)
+    kwargs = dict(filtrar_por_data=False, tamanho_pagina=500, formato="xlsx")
+
+    limite = writers.EXCEL_MAX_ROWS
+    writers.EXCEL_MAX_ROWS = 1001  # cabeçalho + 1000 linhas por planilha
+    try:
+        with tempfile.TemporaryDirectory() as pasta:
+            elementos, _, arquivo, _ = extrair_dados_monday(BOARD_NAME, board.id, None, pasta, **kwargs)
+            planilhas = pd.read_excel(arquivo, sheet_name=None, dtype=str)
+            assert list(planilhas) == ["Sheet1", "Sheet2", "Sheet3"], list(planilhas)
+            assert [len(df) for df in planilhas.values()] == [1000, 1000, 500]
+            lido = pd.concat(planilhas.values(), ignore_index=True)
+            assert list(lido.columns) == list(elementos.columns) and len(elementos) == 2500
+            pd.testing.assert_frame_equal(lido.fillna(""), elementos.fillna("").astype(str), check_dtype=False)
+
+            resultado = extrair_dados_monday(BOARD_NAME, board.id, None, pasta, retornar_dataframes=False, **kwargs)
+            assert resultado[:2] == (None, None), resultado
+            assert sum(len(df) for df in pd.read_excel(resultado[2], sheet_name=None).values()) == 2500
+    finally:
+        writers.EXCEL_MAX_ROWS = limite
+
+
+@cenario
+def arquivo_de_paginas_e_reprocessamento(runner: CenarioRunner):
+    """
+    Uma extração com `arquivar_em` guarda as páginas brutas (jsonl ou Arrow):
+    `extrair_dados_arquivados` devolve os mesmos itens, com o mesmo filtro de
+    grupo, e `reprocessar_dados_monday` refaz as mesmas tabelas, tipadas ou
+    não, sem nenhuma chamada à API.
+    """
+    import pandas as pd
+    from monday_lib import (extrair_dados_monday, extrair_dados_paginados, extrair_dados_arquivados,
+                            reprocessar_dados_monday)
+    stats = runner.server.stats
+    board = runner.board(80, subitems=2)
+    esperado = extrair_dados_paginados(board.id, BOARD_NAME, filtrar_por_data=False, tamanho_pagina=30)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for formato_arquivo in ("jsonl", "arrow"):
+            arquivo = os.path.join(pasta, f"arquivo_{formato_arquivo}")
+            tabelas = {}
+            for tipado in (False, True):
+                tabelas[tipado] = extrair_dados_monday(BOARD_NAME, board.id, None, os.path.join(pasta, "online"),
+                                                       filtrar_por_data=False, tamanho_pagina=30, tipado=tipado,
+                                                       formato="csv", arquivar_em=f"{arquivo}_{tipado}",
+                                                       formato_arquivo=formato_arquivo)[:2]
+
+            antes = stats["requests"]
+            itens = extrair_dados_arquivados(f"{arquivo}_False")
+            assert itens == esperado, f"{formato_arquivo}: itens arquivados diferentes da extração"
+            feito = extrair_dados_arquivados(f"{arquivo}_False", grupo="Feito")
+            assert feito == [item for item in esperado if item["group"]["title"] == "Feito"]
+            for tipado, (elementos, subelementos) in tabelas.items():
+                refeito = reprocessar_dados_monday(f"{arquivo}_{tipado}", os.path.join(pasta, "offline"),
+                                                   tipado=tipado, formato="csv")
+                pd.testing.assert_frame_equal(refeito[0], elementos)
+                pd.testing.assert_frame_equal(refeito[1], subelementos)
+            assert stats["requests"] == antes, f"{formato_arquivo}: leitura do arquivo chamou a API"
+
+
+@cenario
+def queries_combinadas_em_uma_chamada(runner: CenarioRunner):
+    """
+    O `QueryBatcher` (e o `AsyncQueryBatcher`) junta as leituras pendentes em
+    uma única chamada e entrega a cada uma a sua resposta; se uma delas falha,
+    só ela recebe o erro, e as mutations vão na hora, fora do lote.
+    """
+    from monday_lib import QueryBatcher, AsyncQueryBatcher, MondayClient, ResponseCache, APIError
+    from monday_lib.api_client.async_client import AsyncMondayClient
+    from monday_lib.queries.templates import QUERY_BOARD_ITEM_COUNT
+    stats = runner.server.stats
+    boards = [runner.board(n) for n in (10, 20, 30)]
+    invalida = ("query ($boardId: [ID!]) { boards(ids: $boardId) { items_page(limit: 1, query_params: "
+                "{rules: [{column_id: \"nao_existe\", compare_value: [\"x\"]}]}) { cursor } } }")
+    sem_cache = lambda: ResponseCache(ttls={})
+
+    antes = stats["requests"]
+    with QueryBatcher(MondayClient(cache=sem_cache()), window=None) as lote:
+        contagens = [lote.submit(QUERY_BOARD_ITEM_COUNT, {"boardId": b.id}) for b in boards]
+        assert stats["requests"] == antes, "leitura enviada antes do fim do lote"
+    assert [f.result()["boards"][0]["items_count"] for f in contagens] == [10, 20, 30]
+    assert stats["requests"] - antes == 1, f"{stats['requests'] - antes} chamadas para 3 leituras"
+
+    with QueryBatcher(MondayClient(cache=sem_cache()), window=None) as lote:
+        ok = lote.submit(QUERY_BOARD_ITEM_COUNT, {"boardId": boards[0].id})
+        erro = lote.submit(invalida, {"boardId": [boards[0].id]})
+        antes = stats["mutations"]
+        lote.submit("mutation ($boardId: ID!, $itemName: String!) "
+                    "{ create_item(board_id: $boardId, item_name: $itemName) { id } }",
+                    {"boardId": boards[1].id, "itemName": "Novo"}).result()
+        assert stats["mutations"] == antes + 1, "mutation esperou o lote"
+    assert ok.result()["boards"][0]["items_count"] == 10
+    assert isinstance(erro.exception(), APIError), erro.exception()
+
+    async def combinadas():
+        async with AsyncMondayClient(cache=sem_cache()) as cliente:
+            lote = AsyncQueryBatcher(cliente)
+            return await asyncio.gather(*(lote.execute(QUERY_BOARD_ITEM_COUNT, {"boardId": b.id}) for b in boards))
+    antes = stats["requests"]
+    respostas = asyncio.run(combinadas())
+    assert [r["boards"][0]["items_count"] for r in respostas] == [10, 21, 30]
+    assert stats["requests"] - antes == 1, f"{stats['requests'] - antes} chamadas assíncronas para 3 leituras"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cenários da monday_lib contra o servidor mock.")
+    parser.add_argument("--only", default=",".join(CENARIOS), help=f"Cenários a executar ({', '.join(CENARIOS)}).")
+    args = parser.parse_args()
+
+    names = [c.strip() for c in args.only.split(",") if c.strip()]
+    unknown = set(names) - set(CENARIOS)
+    if unknown:
+        parser.error(f"Cenários desconhecidos: {', '.join(sorted(unknown))}")
+
+    falhas = []
+    with CenarioRunner() as runner:
+        for name in names:
+            try:
+                CENARIOS[name](runner)
+                print(f"[ok]    {name}")
+            except Exception:
+                falhas.append(name)
+                print(f"[FALHA] {name}\n{traceback.format_exc()}")
+    if falhas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
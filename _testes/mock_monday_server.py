@@ -0,0 +1,948 @@
+"""
+Servidor local que imita o subconjunto da API GraphQL do Monday.com usado pela biblioteca.
+
+Permite rodar extrações, importações e benchmarks sem acessar quadros reais:
+  - `boards { items_page / columns / groups / items_count / activity_logs }`, `next_items_page`
+    e `items(ids:)`, com a regra `__last_updated__` (itens alterados desde uma data);
+  - quadro de subitens de cada quadro (só as colunas), indicado no `settings_str` da
+    coluna `subtasks` (`columns(types: [subtasks])`);
+  - mutations `create_item`, `change_multiple_column_values`, `move_item_to_group`, `delete_item`,
+    `archive_item`, `create_group` e `delete_group` (com os eventos correspondentes no activity log);
+  - bloco `complexity { before after reset_in_x_seconds }`, com orçamento por minuto
+    (429 + COMPLEXITY_BUDGET_EXHAUSTED quando esgotado);
+  - latência configurável e 504 (Gateway Timeout) simulados.
+
+Os itens de cada quadro são gerados sob demanda a partir do índice, então um quadro
+de 1 milhão de itens não ocupa memória até ser lido.
+
+Uso em script:
+    from mock_monday_server import MockMondayServer, MockBoard
+
+    with MockMondayServer(boards=[MockBoard("1000", n_items=100_000)], latency=0.05) as server:
+        set_client(MondayClient(api_url=server.url, api_token="mock"))
+        extrair_dados_paginados("1000", "MOCK", filtrar_por_data=False)
+
+Uso pela linha de comando:
+    python _testes/mock_monday_server.py --items 100000 --port 8765
+"""
+import gzip
+import json
+import time
+import zlib
+import base64
+import random
+import argparse
+import threading
+from datetime import date, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from graphql import build_schema, parse, validate, execute, FieldNode, VariableNode, GraphQLError
+
+SCHEMA = build_schema("""
+    scalar JSON
+    scalar CompareValue
+    scalar ISO8601DateTime
+
+    type Query {
+        boards(ids: [ID!], limit: Int): [Board]
+        items(ids: [ID!], limit: Int): [Item]
+        next_items_page(cursor: String!, limit: Int): ItemsResponse
+        complexity: Complexity
+    }
+
+    type Mutation {
+        create_item(board_id: ID!, group_id: String, item_name: String!, column_values: JSON, create_labels_if_missing: Boolean): Item
+        create_group(board_id: ID!, group_name: String!): Group
+        delete_group(board_id: ID!, group_id: String!): Group
+        delete_item(item_id: ID!): Item
+        archive_item(item_id: ID!): Item
+        change_multiple_column_values(board_id: ID!, item_id: ID!, column_values: JSON!): Item
+        move_item_to_group(item_id: ID!, group_id: String!): Item
+        complexity: Complexity
+    }
+
+    # before/after/query como Float: o orçamento dos benchmarks pode passar do limite de 32 bits do Int
+    type Complexity {
+        before: Float
+        after: Float
+        query: Float
+        reset_in_x_seconds: Int
+    }
+
+    type Board {
+        id: ID!
+        name: String
+        items_count: Int
+        columns(ids: [String], types: [ColumnType]): [Column]
+        groups(ids: [String]): [Group]
+        items_page(limit: Int, cursor: String, query_params: ItemsQuery): ItemsResponse
+        activity_logs(limit: Int, page: Int, from: ISO8601DateTime, to: ISO8601DateTime): [ActivityLog]
+    }
+
+    type ActivityLog {
+        id: ID!
+        event: String
+        data: String
+        entity: String
+        created_at: String
+    }
+
+    type Group {
+        id: ID!
+        title: String
+        deleted: Boolean
+        items_page(limit: Int, cursor: String, query_params: ItemsQuery): ItemsResponse
+    }
+
+    type Column {
+        id: ID!
+        title: String
+        type: String
+        settings_str: String
+    }
+
+    enum ColumnType {
+        board_relation checkbox date dependency formula mirror name numbers people rating status
+        subtasks text
+    }
+
+    input ItemsQuery {
+        rules: [ItemsQueryRule!]
+        operator: ItemsQueryOperator
+        ids: [ID!]
+    }
+
+    input ItemsQueryRule {
+        column_id: ID!
+        compare_value: CompareValue
+        operator: ItemsQueryRuleOperator
+        compare_attribute: String
+    }
+
+    enum ItemsQueryOperator { and or }
+
+    enum ItemsQueryRuleOperator {
+        any_of not_any_of is_empty is_not_empty greater_than greater_than_or_equals
+        lower_than lower_than_or_equal between contains_text not_contains_text
+    }
+
+    type ItemsResponse {
+        cursor: String
+        items: [Item!]!
+    }
+
+    type Item {
+        id: ID!
+        name: String
+        state: String
+        created_at: String
+        updated_at: String
+        group: Group
+        board: Board
+        column_values(ids: [String]): [ColumnValue]
+        subitems: [Item]
+        parent_item: Item
+    }
+
+    interface ColumnValue {
+        id: ID!
+        type: String
+        text: String
+        value: JSON
+        column: Column
+    }
+
+    type TextValue implements ColumnValue { id: ID! type: String text: String value: JSON column: Column }
+    type StatusValue implements ColumnValue { id: ID! type: String text: String value: JSON column: Column index: Int label: String }
+    type DateValue implements ColumnValue { id: ID! type: String text: String value: JSON column: Column date: String }
+    type NumbersValue implements ColumnValue { id: ID! type: String text: String value: JSON column: Column number: Float }
+    type PeopleValue implements ColumnValue { id: ID! type: String text: String value: JSON column: Column }
+    type CheckboxValue implements ColumnValue { id: ID! type: String text: String value: JSON column: Column checked: Boolean }
+    type MirrorValue implements ColumnValue { id: ID! type: String text: String value: JSON column: Column display_value: String }
+    type FormulaValue implements ColumnValue { id: ID! type: String text: String value: JSON column: Column display_value: String }
+    type DependencyValue implements ColumnValue { id: ID! type: String text: String value: JSON column: Column display_value: String }
+    type BoardRelationValue implements ColumnValue { id: ID! type: String text: String value: JSON column: Column display_value: String }
+""")
+
+_VALUE_TYPES = {
+    "status": "StatusValue", "date": "DateValue", "numbers": "NumbersValue", "people": "PeopleValue",
+    "checkbox": "CheckboxValue", "mirror": "MirrorValue", "formula": "FormulaValue",
+    "dependency": "DependencyValue", "board_relation": "BoardRelationValue",
+}
+SCHEMA.type_map["ColumnValue"].resolve_type = lambda value, info, type_: _VALUE_TYPES.get(value["type"], "TextValue")
+
+# Colunas padrão dos quadros sintéticos: (id, título, tipo)
+DEFAULT_COLUMNS = [
+    ("status", "Status", "status"),
+    ("date4", "Data de Entrega", "date"),
+    ("date_prazo", "Prazo Inicial", "date"),
+    ("numbers", "Horas", "numbers"),
+    ("person", "Responsável", "people"),
+    ("text", "Cliente", "text"),
+    ("checkbox", "Aprovado", "checkbox"),
+    ("mirror", "Projeto", "mirror"),
+    ("formula", "Total", "formula"),
+]
+DEFAULT_SUB_COLUMNS = [
+    ("person_sub", "Responsável Subitem", "people"),
+    ("status_sub", "Status Subitem", "status"),
+    ("numbers_sub", "Horas Subitem", "numbers"),
+]
+DEFAULT_GROUPS = [("topics", "Em andamento"), ("group_feito", "Feito"), ("group_travado", "Travado")]
+STATUS_LABELS = ["Feito", "Em andamento", "Travado", ""]
+
+MAX_PAGE_LIMIT = 500
+DEFAULT_PAGE_LIMIT = 25
+_ID_SPACE = 10 ** 8          # ids de item: board * 10^8 + índice
+_SUBITEM_OFFSET = 5 * 10 ** 7  # subitens ocupam a segunda metade do espaço de ids
+_SUBITEMS_BOARD = 10 ** 9      # id do quadro de subitens: 10^9 + id do quadro
+
+
+class MockBoard:
+    """Quadro sintético, com itens gerados de forma determinística a partir do índice.
+
+    Args:
+        board_id: ID numérico do quadro (str).
+        n_items: Quantidade de itens pré-existentes.
+        subitems_per_item: Quantidade de subitens de cada item.
+        columns: Lista de colunas (id, título, tipo). Padrão: `DEFAULT_COLUMNS`.
+        groups: Lista de grupos (id, título). Os itens são distribuídos entre eles.
+        start_date: Data inicial das colunas de data; os itens se espalham por um ano.
+        name: Nome do quadro.
+    """
+    def __init__(self, board_id: str, n_items: int = 1000, subitems_per_item: int = 1,
+                 columns: list = None, sub_columns: list = None, groups: list = None,
+                 start_date: str = "2025-01-01", name: str = None):
+        self.id = str(board_id)
+        self.name = name or f"Quadro {board_id}"
+        self.n_items = n_items
+        self.subitems_per_item = subitems_per_item
+        self.columns = [dict(zip(("id", "title", "type"), c)) for c in (columns or DEFAULT_COLUMNS)]
+        self.sub_columns = [dict(zip(("id", "title", "type"), c)) for c in (sub_columns or DEFAULT_SUB_COLUMNS)]
+        self.groups = [{"id": g, "title": t} for g, t in (groups or DEFAULT_GROUPS)]
+        self.base_groups = list(self.groups)
+        self.deleted_groups = set()
+        self.start_date = date.fromisoformat(start_date)
+        self.created = []   # itens criados via create_item: dicts {name, group_id, values}
+        self.overrides = {}  # valores alterados via change_multiple_column_values: {índice: {coluna: valor}}
+        self.updated_at = {}  # {índice: 'AAAA-MM-DDTHH:MM:SSZ'} dos itens criados/alterados
+        self.removed = set()  # índices de itens excluídos ou arquivados
+        self.moved = {}       # {índice: id do grupo} dos itens movidos via move_item_to_group
+        self.activity = []    # activity_logs: dicts {event, data, created_at}
+        self._columns_by_id = {c["id"]: c for c in self.columns}
+        self._group_seq = 0
+
+    # --- índices e ids ---
+
+    @property
+    def size(self) -> int:
+        """Total de posições de itens (pré-existentes + criados), inclusive os de grupos removidos."""
+        return self.n_items + len(self.created)
+
+    @property
+    def subitems_board_id(self) -> str:
+        return str(_SUBITEMS_BOARD + int(self.id))
+
+    def item_id(self, index: int) -> str:
+        return str(int(self.id) * _ID_SPACE + index)
+
+    def subitem_id(self, index: int, k: int) -> str:
+        return str(int(self.id) * _ID_SPACE + _SUBITEM_OFFSET + index * self.subitems_per_item + k)
+
+    def group_of(self, index: int) -> dict:
+        if index in self.moved:
+            return next(g for g in self.groups if g["id"] == self.moved[index])
+        if index < self.n_items:
+            return self.base_groups[index % len(self.base_groups)]
+        group_id = self.created[index - self.n_items]["group_id"]
+        return next((g for g in self.groups if g["id"] == group_id), {"id": group_id, "title": group_id})
+
+    def alive(self, index: int) -> bool:
+        return index not in self.removed and self.group_of(index)["id"] not in self.deleted_groups
+
+    def last_updated(self, index: int) -> str:
+        return self.updated_at.get(index) or f"{self.start_date.isoformat()}T00:00:00Z"
+
+    def touch(self, index: int, **values):
+        """Marca o item como alterado agora (opcionalmente trocando valores de colunas)."""
+        if values:
+            self.overrides.setdefault(index, {}).update(values)
+        self.updated_at[index] = _utc_now()
+
+    def remove(self, index: int, event: str = "delete_pulse"):
+        """Exclui/arquiva o item e registra o evento no activity log."""
+        self.removed.add(index)
+        self.activity.append({"event": event, "created_at": _utc_now(),
+                              "data": json.dumps({"board_id": int(self.id), "pulse_id": int(self.item_id(index))})})
+
+    def move(self, index: int, group: dict):
+        """Move o item para outro grupo do quadro e registra o evento no activity log."""
+        source = self.group_of(index)
+        self.moved[index] = group["id"]
+        self.touch(index)
+        self.activity.append({"event": "move_pulse_into_group", "created_at": _utc_now(), "data": json.dumps({
+            "board_id": int(self.id), "pulse_id": int(self.item_id(index)),
+            "source_group": {"id": source["id"], "title": source["title"]},
+            "dest_group": {"id": group["id"], "title": group["title"]},
+        })})
+
+    def items_count(self) -> int:
+        if self.moved:
+            # Itens movidos não seguem mais a distribuição por índice: conta um a um
+            return sum(1 for index in range(self.size) if self.alive(index))
+        groups = len(self.base_groups)
+        count = sum((self.n_items - g + groups - 1) // groups
+                    for g, group in enumerate(self.base_groups) if group["id"] not in self.deleted_groups)
+        count += sum(1 for item in self.created if item["group_id"] not in self.deleted_groups)
+        return count - sum(1 for index in self.removed if self.group_of(index)["id"] not in self.deleted_groups)
+
+    # --- valores das colunas ---
+
+    def column_value(self, index: int, column: dict, salt: int = 0) -> dict:
+        """Valor sintético da coluna para o item `index` (no formato do `column_values`)."""
+        col_type = column["type"]
+        if salt == 0 and column["id"] in self.overrides.get(index, {}):
+            return _column_value_from_raw(column, self.overrides[index][column["id"]])
+        if index >= self.n_items and salt == 0:
+            raw = self.created[index - self.n_items]["values"].get(column["id"])
+            return _column_value_from_raw(column, raw)
+
+        seed = (index * 2654435761 + salt * 40503 + zlib.crc32(column["id"].encode()) % 1000) & 0xFFFFFFFF
+        text, value, extra = None, None, {}
+        if col_type == "status":
+            k = seed % len(STATUS_LABELS)
+            text = STATUS_LABELS[k]
+            value = json.dumps({"index": k}) if text else None
+            extra = {"index": k if text else None, "label": text or None}
+        elif col_type == "date":
+            day = self.start_date + timedelta(days=(index * 7919 + seed % 3) % 365)
+            text = day.isoformat()
+            value = json.dumps({"date": text})
+            extra = {"date": text}
+        elif col_type == "numbers":
+            number = (seed % 4000) / 4
+            text = f"{number:g}"
+            value = json.dumps(text)
+            extra = {"number": number}
+        elif col_type == "people":
+            person = seed % 13
+            text = f"Pessoa {person}"
+            value = json.dumps({"personsAndTeams": [{"id": 60000000 + person, "kind": "person"}]})
+        elif col_type == "checkbox":
+            checked = seed % 2 == 0
+            text = "v" if checked else ""
+            value = json.dumps({"checked": "true"}) if checked else None
+            extra = {"checked": checked}
+        elif col_type in ("mirror", "formula", "dependency", "board_relation"):
+            extra = {"display_value": f"{column['title']} {seed % 50}"}
+        else:
+            text = f"{column['title']} {seed % 97}"
+            value = json.dumps(text)
+        return {"id": column["id"], "type": col_type, "text": text, "value": value,
+                "column": column, **extra}
+
+    def column_text(self, index: int, column_id: str):
+        """Texto da coluna (usado pelas regras do `items_page`)."""
+        if column_id == "__last_updated__":
+            return self.last_updated(index)
+        column = self._columns_by_id.get(column_id)
+        if column is None:
+            raise GraphQLError(f"Column {column_id} not found on board {self.id}",
+                               extensions={"code": "InvalidColumnIdException"})
+        value = self.column_value(index, column)
+        return value.get("text") if value.get("text") is not None else value.get("display_value")
+
+    # --- itens ---
+
+    def item(self, index: int) -> dict:
+        board = self
+        group = self.group_of(index)
+        name = self.created[index - self.n_items]["name"] if index >= self.n_items else f"Item {index}"
+
+        def column_values(info, ids=None):
+            return [board.column_value(index, c) for c in board.columns if ids is None or c["id"] in ids]
+
+        def subitems(info):
+            if index >= board.n_items:
+                return []
+            return [board.subitem(index, k) for k in range(board.subitems_per_item)]
+
+        return {
+            "id": self.item_id(index), "name": name, "state": "active",
+            "created_at": f"{self.start_date.isoformat()}T00:00:00Z",
+            "updated_at": self.last_updated(index),
+            "group": _GroupView(self, group), "board": _BoardView(self),
+            "column_values": column_values, "subitems": subitems, "parent_item": None,
+        }
+
+    def subitem(self, index: int, k: int) -> dict:
+        board = self
+
+        def column_values(info, ids=None):
+            return [board.column_value(index, c, salt=k + 1) for c in board.sub_columns if ids is None or c["id"] in ids]
+
+        return {
+            "id": self.subitem_id(index, k), "name": f"Subitem {index}.{k}", "state": "active",
+            "group": None, "board": None, "column_values": column_values, "subitems": lambda info: [],
+            "parent_item": None,
+        }
+
+    def api_item(self, index: int) -> dict:
+        """
+        Item já no formato da resposta das queries `initial_request`/`paginated_request`
+        (sem passar pelo GraphQL), para gerar listas grandes rapidamente.
+        """
+        def columns(values: list) -> list:
+            return [{key: v[key] for key in ("id", "type", "text", "display_value") if key in v}
+                    | {"column": {"title": v["column"]["title"]}} for v in values]
+
+        subitems = [] if index >= self.n_items else [
+            {"id": self.subitem_id(index, k), "name": f"Subitem {index}.{k}",
+             "columns": columns([self.column_value(index, c, salt=k + 1) for c in self.sub_columns])}
+            for k in range(self.subitems_per_item)
+        ]
+        return {
+            "id": self.item_id(index),
+            "name": self.created[index - self.n_items]["name"] if index >= self.n_items else f"Item {index}",
+            "group": {"title": self.group_of(index)["title"]},
+            "columns": columns([self.column_value(index, c) for c in self.columns]),
+            "subitems": subitems,
+        }
+
+    def matches(self, index: int, query_params: dict | None) -> bool:
+        """Aplica as regras do `query_params` (regras e operador and/or) ao item."""
+        if not self.alive(index):
+            return False
+        if not query_params:
+            return True
+        if query_params.get("ids") and self.item_id(index) not in {str(i) for i in query_params["ids"]}:
+            return False
+        rules = query_params.get("rules") or []
+        if not rules:
+            return True
+        results = (_rule_matches(self.column_text(index, rule["column_id"]), rule) for rule in rules)
+        return any(results) if query_params.get("operator") == "or" else all(results)
+
+    def page(self, state: "_ServerState", offset: int, limit: int, query_params: dict | None,
+             group_ids: list | None = None) -> dict:
+        """Lê uma página a partir da posição `offset` e gera o cursor da próxima."""
+        if limit > MAX_PAGE_LIMIT:
+            raise GraphQLError(f"Limit must be lower or equal to {MAX_PAGE_LIMIT}",
+                               extensions={"code": "InvalidArgumentException"})
+        items = []
+        index = offset
+        while index < self.size and len(items) < limit:
+            if (group_ids is None or self.group_of(index)["id"] in group_ids) and self.matches(index, query_params):
+                items.append(self.item(index))
+            index += 1
+        state.count_items(len(items))
+        cursor = None
+        if index < self.size:
+            cursor = _encode_cursor({"b": self.id, "o": index, "q": query_params, "g": group_ids, "t": time.time()})
+        return {"cursor": cursor, "items": items}
+
+
+class _BoardView:
+    """Objeto de resolução do tipo `Board` (métodos recebem `info` e os argumentos do campo).
+
+    Com `subitems=True`, é o quadro de subitens de `board`: só as colunas
+    (`sub_columns`) são dele.
+    """
+    def __init__(self, board: MockBoard, subitems: bool = False):
+        self._board = board
+        self._subitems = subitems
+        self.id = board.subitems_board_id if subitems else board.id
+        self.name = f"Subelementos de {board.name}" if subitems else board.name
+
+    def items_count(self, info):
+        return self._board.items_count()
+
+    def columns(self, info, ids=None, types=None):
+        columns = [dict(c, settings_str="{}") for c in (self._board.sub_columns if self._subitems else self._board.columns)]
+        if types is not None and "subtasks" in types and not self._subitems and self._board.subitems_per_item:
+            # A coluna de subitens só aparece no filtro por tipo: sem valores nos itens, ela
+            # mudaria as colunas das tabelas de elementos
+            columns.append({"id": "subitems", "title": "Subelementos", "type": "subtasks",
+                            "settings_str": json.dumps({"boardIds": [int(self._board.subitems_board_id)]})})
+        return [c for c in columns if (ids is None or c["id"] in ids) and (types is None or c["type"] in types)]
+
+    def groups(self, info, ids=None):
+        return [_GroupView(self._board, g) for g in self._board.groups
+                if g["id"] not in self._board.deleted_groups and (ids is None or g["id"] in ids)]
+
+    def items_page(self, info, limit=DEFAULT_PAGE_LIMIT, cursor=None, query_params=None):
+        state = info.context
+        if cursor:
+            return state.continue_page(cursor, limit)
+        return self._board.page(state, 0, limit, query_params)
+
+    def activity_logs(self, info, limit=25, page=1, **kwargs):
+        start, end = kwargs.get("from"), kwargs.get("to")
+        logs = [dict(log, id=str(n), entity="pulse") for n, log in enumerate(self._board.activity)
+                if (not start or log["created_at"] >= start) and (not end or log["created_at"] <= end)]
+        logs.reverse()  # mais recentes primeiro, como na API
+        return logs[(page - 1) * limit: page * limit]
+
+
+class _GroupView:
+    def __init__(self, board: MockBoard, group: dict):
+        self._board = board
+        self.id = group["id"]
+        self.title = group["title"]
+        self.deleted = group["id"] in board.deleted_groups
+
+    def items_page(self, info, limit=DEFAULT_PAGE_LIMIT, cursor=None, query_params=None):
+        state = info.context
+        if cursor:
+            return state.continue_page(cursor, limit)
+        return self._board.page(state, 0, limit, query_params, group_ids=[self.id])
+
+
+class _ServerState:
+    """Estado de uma requisição: acesso aos quadros e contagem de itens retornados."""
+    def __init__(self, server: "MockMondayServer"):
+        self.server = server
+        self.items_served = 0
+        self.complexity = None
+
+    def count_items(self, n: int):
+        self.items_served += n
+
+    def board(self, board_id) -> MockBoard:
+        board = self.server.boards.get(str(board_id))
+        if board is None:
+            raise GraphQLError(f"Board {board_id} not found", extensions={"code": "ResourceNotFoundException"})
+        return board
+
+    def continue_page(self, cursor: str, limit: int) -> dict:
+        try:
+            data = _decode_cursor(cursor)
+        except ValueError:
+            raise GraphQLError("Invalid cursor", extensions={"code": "InvalidCursorException"})
+        if time.time() - data["t"] > self.server.cursor_ttl:
+            raise GraphQLError("CursorException: cursor has expired", extensions={"code": "CursorExpiredError"})
+        return self.board(data["b"]).page(self, data["o"], limit, data.get("q"), data.get("g"))
+
+
+class _Root:
+    """Campos raiz de Query e Mutation."""
+    def __init__(self, state: _ServerState):
+        self._state = state
+
+    def complexity(self, info):
+        return info.context.complexity
+
+    def boards(self, info, ids=None, limit=None):
+        server = self._state.server
+        ids = [str(i) for i in ids] if ids is not None else list(server.boards)[:limit]
+        views = []
+        for board_id in ids:
+            if board_id in server.boards:
+                views.append(_BoardView(server.boards[board_id]))
+            elif int(board_id) > _SUBITEMS_BOARD and str(int(board_id) - _SUBITEMS_BOARD) in server.boards:
+                views.append(_BoardView(server.boards[str(int(board_id) - _SUBITEMS_BOARD)], subitems=True))
+        return views
+
+    def items(self, info, ids=None, limit=None):
+        result = []
+        for raw_id in ids or []:
+            board_number, index = divmod(int(raw_id), _ID_SPACE)
+            board = self._state.server.boards.get(str(board_number))
+            if board is None:
+                continue
+            if index >= _SUBITEM_OFFSET:
+                parent, k = divmod(index - _SUBITEM_OFFSET, max(board.subitems_per_item, 1))
+                if parent < board.n_items and k < board.subitems_per_item:
+                    result.append(board.subitem(parent, k))
+            elif index < board.size and board.alive(index):
+                result.append(board.item(index))
+        self._state.count_items(len(result))
+        return result
+
+    def next_items_page(self, info, cursor, limit=DEFAULT_PAGE_LIMIT):
+        return self._state.continue_page(cursor, limit)
+
+    def create_item(self, info, board_id, item_name, group_id=None, column_values=None, create_labels_if_missing=None):
+        board = self._state.board(board_id)
+        values = json.loads(column_values) if isinstance(column_values, str) else (column_values or {})
+        if not isinstance(values, dict):
+            raise GraphQLError("column_values must be a JSON object", extensions={"code": "InvalidArgumentException"})
+        unknown = [col_id for col_id in values if col_id not in board._columns_by_id]
+        if unknown:
+            raise GraphQLError(f"Column {unknown[0]} not found on board {board.id}",
+                               extensions={"code": "InvalidColumnIdException"})
+        with self._state.server.lock:
+            group_id = group_id or board.groups[0]["id"]
+            if group_id not in {g["id"] for g in board.groups} or group_id in board.deleted_groups:
+                raise GraphQLError(f"Group {group_id} not found", extensions={"code": "InvalidGroupIdException"})
+            board.created.append({"name": item_name, "group_id": group_id, "values": values})
+            index = board.size - 1
+            board.updated_at[index] = _utc_now()
+        return board.item(index)
+
+    def create_group(self, info, board_id, group_name):
+        board = self._state.board(board_id)
+        with self._state.server.lock:
+            board._group_seq += 1
+            group = {"id": f"new_group_{board._group_seq}", "title": group_name}
+            board.groups.insert(0, group)
+        return _GroupView(board, group)
+
+    def delete_item(self, info, item_id, event="delete_pulse"):
+        board_number, index = divmod(int(item_id), _ID_SPACE)
+        board = self._state.board(board_number)
+        with self._state.server.lock:
+            if index >= board.size or not board.alive(index):
+                raise GraphQLError(f"Item {item_id} not found", extensions={"code": "ResourceNotFoundException"})
+            item = board.item(index)
+            board.remove(index, event)
+        return item
+
+    def archive_item(self, info, item_id):
+        return self.delete_item(info, item_id, event="archive_pulse")
+
+    def change_multiple_column_values(self, info, board_id, item_id, column_values):
+        board = self._state.board(board_id)
+        index = int(item_id) - int(board.id) * _ID_SPACE
+        values = json.loads(column_values) if isinstance(column_values, str) else column_values
+        with self._state.server.lock:
+            if not 0 <= index < board.size or not board.alive(index):
+                raise GraphQLError(f"Item {item_id} not found", extensions={"code": "ResourceNotFoundException"})
+            board.touch(index, **values)
+        return board.item(index)
+
+    def move_item_to_group(self, info, item_id, group_id):
+        board_number, index = divmod(int(item_id), _ID_SPACE)
+        board = self._state.board(board_number)
+        with self._state.server.lock:
+            if index >= board.size or not board.alive(index):
+                raise GraphQLError(f"Item {item_id} not found", extensions={"code": "ResourceNotFoundException"})
+            group = next((g for g in board.groups if g["id"] == group_id and g["id"] not in board.deleted_groups), None)
+            if group is None:
+                raise GraphQLError(f"Group {group_id} not found", extensions={"code": "InvalidGroupIdException"})
+            board.move(index, group)
+        return board.item(index)
+
+    def delete_group(self, info, board_id, group_id):
+        board = self._state.board(board_id)
+        with self._state.server.lock:
+            group = next((g for g in board.groups if g["id"] == group_id and g["id"] not in board.deleted_groups), None)
+            if group is None:
+                raise GraphQLError(f"Group {group_id} not found", extensions={"code": "InvalidGroupIdException"})
+            board.deleted_groups.add(group_id)
+            board.activity.append({"event": "delete_group", "created_at": _utc_now(), "data": json.dumps({
+                "board_id": int(board.id), "group_id": group_id, "group_title": group["title"],
+            })})
+        return _GroupView(board, group)
+
+
+class MockMondayServer:
+    """Servidor HTTP local que responde como a API GraphQL do Monday.com.
+
+    Args:
+        boards: Quadros sintéticos (`MockBoard`) disponíveis.
+        host, port: Endereço de escuta (port=0 escolhe uma porta livre).
+        latency: Latência fixa (s) somada a cada resposta.
+        latency_per_item: Latência (s) adicional por item retornado.
+        complexity_budget: Orçamento de complexidade por minuto.
+        timeout_rate: Probabilidade (0-1) de responder 504 em uma requisição.
+        timeout_every: Se > 0, responde 504 a cada N requisições.
+        cursor_ttl: Validade (s) dos cursores de paginação (o Monday usa 60 minutos).
+        compress: Se True, responde com gzip quando o cliente aceita.
+        seed: Semente dos sorteios (504 aleatórios).
+
+    Atributos:
+        url: URL da API (ex: 'http://127.0.0.1:8765/v2').
+        stats: Contadores de requisições, 504, 429, itens, mutations, conexões abertas e respostas com gzip.
+    """
+    def __init__(self, boards: list = None, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, latency_per_item: float = 0.0,
+                 complexity_budget: int = 10_000_000, timeout_rate: float = 0.0, timeout_every: int = 0,
+                 cursor_ttl: float = 3600, compress: bool = True, seed: int = 0):
+        self.boards = {b.id: b for b in (boards or [MockBoard("1000")])}
+        self.latency = latency
+        self.latency_per_item = latency_per_item
+        self.complexity_budget = complexity_budget
+        self.timeout_rate = timeout_rate
+        self.timeout_every = timeout_every
+        self.cursor_ttl = cursor_ttl
+        self.compress = compress
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "timeouts": 0, "rate_limited": 0, "items_served": 0, "mutations": 0,
+                      "connections": 0, "compressed": 0}
+        self._random = random.Random(seed)
+        self._budget_left = complexity_budget
+        self._window_start = time.monotonic()
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def add_board(self, board: MockBoard):
+        self.boards[board.id] = board
+
+    def start(self) -> str:
+        """Inicia o servidor em uma thread e retorna a URL da API."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # --- processamento das requisições ---
+
+    def _charge(self, cost: int) -> dict | None:
+        """Desconta `cost` do orçamento da janela atual; None se não houver orçamento."""
+        with self.lock:
+            now = time.monotonic()
+            if now - self._window_start >= 60:
+                self._window_start = now
+                self._budget_left = self.complexity_budget
+            reset_in = max(int(60 - (now - self._window_start)), 0)
+            if cost > self._budget_left:
+                return None
+            before = self._budget_left
+            self._budget_left -= cost
+            return {"before": before, "after": self._budget_left, "query": cost, "reset_in_x_seconds": reset_in}
+
+    def _should_time_out(self) -> bool:
+        with self.lock:
+            self.stats["requests"] += 1
+            if self.timeout_every and self.stats["requests"] % self.timeout_every == 0:
+                return True
+            return self.timeout_rate > 0 and self._random.random() < self.timeout_rate
+
+    def handle(self, body: dict) -> tuple[int, dict]:
+        """Executa uma requisição GraphQL e retorna (status HTTP, corpo JSON)."""
+        timed_out = self._should_time_out()
+        query = body.get("query") or ""
+        variables = body.get("variables") or {}
+        try:
+            document = parse(query)
+        except GraphQLError as e:
+            return 200, {"errors": [e.formatted]}
+        errors = validate(SCHEMA, document)
+        if errors:
+            return 200, {"errors": [e.formatted for e in errors]}
+
+        is_mutation = any(getattr(d, "operation", None) and d.operation.value == "mutation" for d in document.definitions)
+        if timed_out and not is_mutation:
+            return self._timeout()
+
+        cost = estimate_cost(document, variables)
+        complexity = self._charge(cost)
+        if complexity is None:
+            with self.lock:
+                self.stats["rate_limited"] += 1
+                retry_in = max(int(60 - (time.monotonic() - self._window_start)), 1)
+            return 429, {"errors": [{
+                "message": f"Complexity budget exhausted, query cost {cost} budget remaining "
+                           f"{self._budget_left} out of {self.complexity_budget} reset in {retry_in} seconds",
+                "extensions": {"code": "COMPLEXITY_BUDGET_EXHAUSTED", "retry_in_seconds": retry_in},
+            }]}
+
+        state = _ServerState(self)
+        state.complexity = complexity
+        root = _Root(state)
+        result = execute(SCHEMA, document, root_value=root, context_value=state, variable_values=variables)
+
+        with self.lock:
+            self.stats["items_served"] += state.items_served
+            if is_mutation:
+                self.stats["mutations"] += 1
+        delay = self.latency + self.latency_per_item * state.items_served
+        if delay:
+            time.sleep(delay)
+        if timed_out:
+            # Mutations com 504 são aplicadas mesmo assim, como acontece na API real
+            return self._timeout()
+
+        response = {"data": result.data, "account_id": 1}
+        if result.errors:
+            response["errors"] = [e.formatted for e in result.errors]
+        return 200, response
+
+    def _timeout(self) -> tuple[int, dict]:
+        with self.lock:
+            self.stats["timeouts"] += 1
+        return 504, {"error_message": "Gateway Timeout"}
+
+
+def estimate_cost(document, variables: dict) -> int:
+    """Custo de complexidade aproximado da operação (páginas de itens e mutations pesam mais)."""
+    cost = 100
+
+    def argument(node: FieldNode, name: str, default):
+        for arg in node.arguments:
+            if arg.name.value == name:
+                if isinstance(arg.value, VariableNode):
+                    return variables.get(arg.value.name.value, default)
+                return getattr(arg.value, "value", default)
+        return default
+
+    def walk(selection_set):
+        nonlocal cost
+        for node in selection_set.selections if selection_set else []:
+            if isinstance(node, FieldNode):
+                name = node.name.value
+                if name in ("items_page", "next_items_page"):
+                    limit = int(argument(node, "limit", DEFAULT_PAGE_LIMIT) or DEFAULT_PAGE_LIMIT)
+                    cost += 1000 + limit * 20
+                elif name == "items":
+                    cost += 20 * len(argument(node, "ids", []) or [])
+                elif name == "create_item":
+                    cost += 10_000
+                elif name in ("change_multiple_column_values", "delete_item", "archive_item"):
+                    cost += 5000
+                elif name == "activity_logs":
+                    cost += 100 + int(argument(node, "limit", 25) or 25)
+                elif name in ("create_group", "delete_group"):
+                    cost += 1000
+            walk(getattr(node, "selection_set", None))
+
+    for definition in document.definitions:
+        walk(getattr(definition, "selection_set", None))
+    return cost
+
+def _rule_matches(text, rule: dict) -> bool:
+    operator = rule.get("operator") or "any_of"
+    compare = rule.get("compare_value")
+    values = compare if isinstance(compare, list) else [compare]
+    if values and values[0] == "EXACT":
+        # Colunas de data e `__last_updated__`: ["EXACT", "AAAA-MM-DD"]
+        values = values[1:]
+    text = text or ""
+    if operator == "is_empty":
+        return text == ""
+    if operator == "is_not_empty":
+        return text != ""
+    if operator == "any_of":
+        return text in {str(v) for v in values}
+    if operator == "not_any_of":
+        return text not in {str(v) for v in values}
+    if operator == "between":
+        return text != "" and str(values[0]) <= text <= str(values[1])
+    if operator in ("greater_than", "greater_than_or_equals", "lower_than", "lower_than_or_equal"):
+        if text == "":
+            return False
+        a, b = _comparable(text), _comparable(values[0])
+        return {"greater_than": a > b, "greater_than_or_equals": a >= b,
+                "lower_than": a < b, "lower_than_or_equal": a <= b}[operator]
+    if operator == "contains_text":
+        return str(values[0]).lower() in text.lower()
+    if operator == "not_contains_text":
+        return str(values[0]).lower() not in text.lower()
+    return True
+
+def _utc_now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+def _comparable(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+def _column_value_from_raw(column: dict, raw) -> dict:
+    """Monta o `column_value` de um item criado via `create_item`."""
+    if isinstance(raw, dict):
+        text = raw.get("label") or raw.get("date") or raw.get("text") or raw.get("checked") or json.dumps(raw)
+    else:
+        text = "" if raw is None else str(raw)
+    value = json.dumps(raw) if raw is not None else None
+    return {"id": column["id"], "type": column["type"], "text": text, "value": value, "column": column}
+
+def _encode_cursor(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode()).decode()
+
+def _decode_cursor(cursor: str) -> dict:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as e:
+        raise ValueError(str(e)) from e
+
+def _make_handler(server: MockMondayServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Sem isso, cabeçalhos e corpo saem em pacotes separados e o ACK atrasado soma ~40ms por resposta
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def setup(self):
+            super().setup()
+            with server.lock:
+                server.stats["connections"] += 1
+
+        def do_POST(self):
+            raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if not self.headers.get("Authorization"):
+                return self._reply(401, {"errors": [{"message": "Not Authenticated"}]})
+            try:
+                body = json.loads(raw or b"{}")
+            except ValueError:
+                return self._reply(400, {"errors": [{"message": "Invalid JSON body"}]})
+            status, response = server.handle(body)
+            headers = {"Retry-After": str(response["errors"][0]["extensions"]["retry_in_seconds"])} if status == 429 else {}
+            self._reply(status, response, headers)
+
+        def _reply(self, status: int, payload: dict, headers: dict = None):
+            out = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            gzipped = server.compress and "gzip" in (self.headers.get("Accept-Encoding") or "")
+            if gzipped:
+                out = gzip.compress(out, compresslevel=1)
+                with server.lock:
+                    server.stats["compressed"] += 1
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(out)))
+            self.end_headers()
+            self.wfile.write(out)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local que imita a API GraphQL do Monday.com.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--board-id", default="1000")
+    parser.add_argument("--items", type=int, default=1000, help="Itens do quadro sintético.")
+    parser.add_argument("--subitems", type=int, default=1, help="Subitens por item.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latência fixa (s) por resposta.")
+    parser.add_argument("--latency-per-item", type=float, default=0.0)
+    parser.add_argument("--budget", type=int, default=10_000_000, help="Orçamento de complexidade por minuto.")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Probabilidade de 504 por requisição.")
+    args = parser.parse_args()
+
+    server = MockMondayServer(
+        boards=[MockBoard(args.board_id, n_items=args.items, subitems_per_item=args.subitems)],
+        host=args.host, port=args.port, latency=args.latency, latency_per_item=args.latency_per_item,
+        complexity_budget=args.budget, timeout_rate=args.timeout_rate,
+    )
+    print(f"Mock da API do Monday em {server.url} (quadro {args.board_id}, {args.items} itens). Ctrl+C para sair.")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,136 @@
-import logging
-import sys
-
-# --- CONFIGURAÇÃO CENTRAL DE LOGGING PARA A BIBLIOTECA ---
-# Esta configuração será executada UMA VEZ, na primeira vez que
-# qualquer parte do pacote 'extracao_monday' for importada.
-
-logging.basicConfig(
-    level=logging.INFO, # Define o nível mínimo de log a ser exibido (INFO e acima)
-    stream=sys.stdout,  # Direciona a saída para o terminal (console)
-    format="%(asctime)s - [%(levelname)s] - [%(filename)s -> %(funcName)s()] - %(message)s"
-)
-# para usuario final
-from .main import extrair_dados_monday
-from .service.data_import_monday import create_items_in_group
-from .service.creat_group_monday import create_monday_group
-from .service.get_group_id_monday import get_group_id
-from .service.delete_group_monday import delete_monday_group
-from .service.get_board_item_count import get_board_item_count
-from .service.log_management import copy_log_file
-from .infra.settings import load_settings
-
-# uso pesquisador/interno_do_software
-from .service.data_export_monday import extrair_dados_paginados
-from .api_client.call_api import call_monday_api
-from .service.get_id_column_monday import chamada_api_get_ids
-from .infra.settings import get_settings
-from .mapper.column_map import ColunaIDMapper
+"""
+Biblioteca para extração e importação de itens do Monday.com.
+
+A importação do pacote não tem efeitos colaterais: nenhum módulo interno,
+pandas, httpx ou template .gql é carregado até que o nome correspondente seja
+usado (`monday_lib.extrair_dados_paginados`, `from monday_lib import ...`).
+O logging do console é configurado por `load_settings` (ou `configure_logging`).
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+# Nome público -> módulo (relativo a este pacote) que o define
+_LAZY_ATTRIBUTES = {
+    # para usuario final
+    "extrair_dados_monday": ".main",
+    "extrair_dados_quadros": ".main",
+    "reprocessar_dados_monday": ".main",
+    "BoardSpec": ".main",
+    "BoardResult": ".main",
+    "create_items_in_group": ".service.data_import_monday",
+    "create_monday_group": ".service.creat_group_monday",
+    "get_group_id": ".service.get_group_id_monday",
+    "get_group_ids": ".service.get_group_id_monday",
+    "delete_monday_group": ".service.delete_group_monday",
+    "get_board_item_count": ".service.get_board_item_count",
+    "get_board_setup": ".service.board_setup_monday",
+    "BoardSetup": ".service.board_setup_monday",
+    "copy_log_file": ".service.log_management",
+
+    # variantes assíncronas (asyncio)
+    "aextrair_dados_quadros": ".main",
+    "aextrair_dados_paginados": ".service.data_export_monday",
+    "aiter_items_paginados": ".service.data_export_monday",
+    "aextrair_dados_por_janelas": ".service.data_export_monday",
+    "acreate_items_in_group": ".service.data_import_monday",
+    "acreate_monday_group": ".service.creat_group_monday",
+    "aget_group_id": ".service.get_group_id_monday",
+    "aget_board_item_count": ".service.get_board_item_count",
+    "load_settings": ".infra.settings",
+    "configure_logging": ".utils.logger",
+
+    # uso pesquisador/interno_do_software
+    "extrair_dados_paginados": ".service.data_export_monday",
+    "iter_items_paginados": ".service.data_export_monday",
+    "extrair_dados_por_janelas": ".service.data_export_monday",
+    "extrair_dados_incrementais": ".service.delta_export_monday",
+    "extrair_dados_arquivados": ".service.page_archive_monday",
+    "iter_paginas_arquivadas": ".service.page_archive_monday",
+    "PageArchive": ".service.page_archive_monday",
+    "PageSizeController": ".service.page_size",
+    "ItemFlattener": ".utils.flatten",
+    "TableWriter": ".utils.writers",
+    "ItemTablesWriter": ".utils.writers",
+    "call_monday_api": ".api_client.call_api",
+    "acall_monday_api": ".api_client.call_api",
+    "stream_monday_items": ".api_client.call_api",
+    "MondayClient": ".api_client.client",
+    "get_client": ".api_client.client",
+    "set_client": ".api_client.client",
+    "AsyncMondayClient": ".api_client.async_client",
+    "get_async_client": ".api_client.async_client",
+    "set_async_client": ".api_client.async_client",
+    "aclose_async_client": ".api_client.async_client",
+    "ComplexityBudget": ".api_client.rate_limit",
+    "get_complexity_budget": ".api_client.rate_limit",
+    "RetryPolicy": ".api_client.retry",
+    "Deadline": ".api_client.retry",
+    "QueryBatcher": ".api_client.batching",
+    "AsyncQueryBatcher": ".api_client.batching",
+    "ResponseCache": ".api_client.cache",
+    "get_response_cache": ".api_client.cache",
+    "MetricsRegistry": ".api_client.metrics",
+    "CallMetrics": ".api_client.metrics",
+    "OpenTelemetryHook": ".api_client.metrics",
+    "get_metrics_registry": ".api_client.metrics",
+    "call_context": ".api_client.metrics",
+    "APIError": ".api_client.exceptions",
+    "APITimeoutError": ".api_client.exceptions",
+    "APIServerError": ".api_client.exceptions",
+    "APIConnectionError": ".api_client.exceptions",
+    "APIRateLimitError": ".api_client.exceptions",
+    "APICursorExpiredError": ".api_client.exceptions",
+    "chamada_api_get_ids": ".service.get_id_column_monday",
+    "get_settings": ".infra.settings",
+    "ColunaIDMapper": ".mapper.column_map",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Guarda no módulo: os próximos acessos não passam mais por aqui
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
+
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para IDEs e verificadores de tipo
+    from .main import extrair_dados_monday, extrair_dados_quadros, aextrair_dados_quadros, BoardSpec, BoardResult
+    from .main import reprocessar_dados_monday
+    from .service.data_import_monday import create_items_in_group, acreate_items_in_group
+    from .service.creat_group_monday import create_monday_group, acreate_monday_group
+    from .service.get_group_id_monday import get_group_id, get_group_ids, aget_group_id
+    from .service.delete_group_monday import delete_monday_group
+    from .service.get_board_item_count import get_board_item_count, aget_board_item_count
+    from .service.board_setup_monday import get_board_setup, BoardSetup
+    from .service.log_management import copy_log_file
+    from .service.data_export_monday import extrair_dados_paginados, aextrair_dados_paginados
+    from .service.data_export_monday import iter_items_paginados, aiter_items_paginados
+    from .service.data_export_monday import extrair_dados_por_janelas, aextrair_dados_por_janelas
+    from .service.delta_export_monday import extrair_dados_incrementais
+    from .service.page_archive_monday import PageArchive, iter_paginas_arquivadas, extrair_dados_arquivados
+    from .service.page_size import PageSizeController
+    from .utils.flatten import ItemFlattener
+    from .utils.writers import TableWriter, ItemTablesWriter
+    from .infra.settings import load_settings, get_settings
+    from .utils.logger import configure_logging
+    from .api_client.call_api import call_monday_api, acall_monday_api, stream_monday_items
+    from .api_client.client import MondayClient, get_client, set_client
+    from .api_client.async_client import AsyncMondayClient, get_async_client, set_async_client, aclose_async_client
+    from .api_client.rate_limit import ComplexityBudget, get_complexity_budget
+    from .api_client.retry import RetryPolicy, Deadline
+    from .api_client.batching import QueryBatcher, AsyncQueryBatcher
+    from .api_client.cache import ResponseCache, get_response_cache
+    from .api_client.metrics import MetricsRegistry, CallMetrics, OpenTelemetryHook, get_metrics_registry, call_context
+    from .api_client.exceptions import APIError, APITimeoutError, APIServerError, APIConnectionError, APIRateLimitError
+    from .api_client.exceptions import APICursorExpiredError
+    from .service.get_id_column_monday import chamada_api_get_ids
+    from .mapper.column_map import ColunaIDMapper
@@ -0,0 +1,255 @@
+import ssl
+import time
+import asyncio
+import logging
+import weakref
+import httpx
+from ..infra.settings import get_settings
+from .client import _decode_json, _check_response, _split_complexity, _log_api_failure, _finish_metrics
+from .exceptions import APIError, APITimeoutError, APIConnectionError, APIRateLimitError
+from .rate_limit import ComplexityBudget, get_complexity_budget, inject_complexity, operation_key, is_mutation
+from .retry import RetryPolicy, Deadline
+from .cache import ResponseCache, board_ids, get_response_cache
+from . import json_backend
+from .metrics import MetricsRegistry, HttpxTrace, get_metrics_registry, new_call_metrics
+
+
+class AsyncMondayClient:
+    """Versão assíncrona (asyncio) do `MondayClient`, baseada em `httpx.AsyncClient`.
+
+    Permite manter várias requisições em andamento no mesmo processo. O número
+    de requisições simultâneas é limitado por `max_concurrency`, para que a
+    concorrência não estoure os limites da API.
+
+    Args:
+        api_url: URL da API GraphQL.
+        api_token: Token de acesso (str).
+        pem_path: Caminho para o bundle de certificados .pem.
+        pool_size: Número máximo de conexões mantidas abertas no pool.
+        connect_timeout: Tempo máximo (s) para estabelecer a conexão.
+        read_timeout: Tempo máximo (s) aguardando a resposta do servidor.
+        budget: Orçamento de complexidade usado para agendar as chamadas. Por
+            padrão, o orçamento compartilhado do processo (`get_complexity_budget()`).
+        retry_policy: Política de retentativas (`RetryPolicy`).
+        cache: `ResponseCache` para as respostas de queries de leitura. Por
+            padrão, o cache compartilhado do processo (`get_response_cache()`),
+            que guarda só os grupos dos quadros.
+        metrics: Registro onde as métricas de cada chamada são acumuladas.
+        hooks: Funções chamadas com o `CallMetrics` de cada tentativa de chamada.
+        max_concurrency: Número máximo de requisições em andamento ao mesmo tempo.
+
+    Exemplo de Uso:
+        async with AsyncMondayClient(max_concurrency=5) as client:
+            data = await client.execute(QUERY_GET_GROUP_ID, {"boardId": 123})
+    """
+    def __init__(self,
+                 api_url: str = None,
+                 api_token: str = None,
+                 pem_path: str = None,
+                 pool_size: int = None,
+                 connect_timeout: float = None,
+                 read_timeout: float = None,
+                 budget: ComplexityBudget = None,
+                 retry_policy: RetryPolicy = None,
+                 cache: ResponseCache = None,
+                 max_concurrency: int = None,
+                 metrics: MetricsRegistry = None,
+                 hooks: list = None):
+        settings = get_settings()
+
+        self.api_url = str(api_url or settings.MONDAY_API_URL)
+        self.api_token = api_token or settings.MONDAY_API_TOKEN.get_secret_value()
+        self.pem_path = pem_path or settings.PEM_PATH
+        self.pool_size = pool_size or settings.HTTP_POOL_SIZE
+        self.timeout = (connect_timeout or settings.HTTP_CONNECT_TIMEOUT,
+                        read_timeout or settings.HTTP_READ_TIMEOUT)
+        self.max_concurrency = max_concurrency or settings.HTTP_MAX_CONCURRENCY
+
+        self.budget = budget or get_complexity_budget()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache or get_response_cache()
+        self.metrics = metrics or get_metrics_registry()
+        self.hooks = [self.metrics, *(hooks or [])]
+
+        if not self.api_token or not self.api_url:
+            raise EnvironmentError("API_KEY ou MONDAY_API_URL não foram definidos no .env")
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.http = self._build_http_client()
+
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """Cria o cliente httpx com pool de conexões, cabeçalhos fixos e verificação TLS."""
+        verify = ssl.create_default_context(cafile=str(self.pem_path)) if self.pem_path else True
+        return httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {self.api_token}",
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+            },
+            limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+            timeout=httpx.Timeout(self.timeout[1], connect=self.timeout[0]),
+            verify=verify,
+        )
+
+    async def execute(self, query: str, variables: dict, deadline: Deadline = None, use_cache: bool = True,
+                      refresh: bool = False) -> dict:
+        """
+        Envia uma query/mutation GraphQL, respeitando o limite de concorrência e
+        repetindo a chamada em caso de erros transitórios conforme a `retry_policy`.
+
+        :param query: A string da query/mutation GraphQL.
+        :param variables: Um dicionário com as variáveis para a query.
+        :param deadline: (Opcional) Prazo total da operação lógica da qual esta
+            chamada faz parte. Se omitido, usa o `deadline` padrão da política.
+        :param use_cache: Se False, ignora o `cache` do cliente nesta chamada
+            (a resposta também não é guardada).
+        :param refresh: Se True, não usa a resposta em cache, mas guarda a nova
+            (ex: o dado pode ter mudado fora da biblioteca).
+        :return: O dicionário 'data' da resposta JSON da API.
+        :raises APITimeoutError: Em caso de Gateway Timeout (504).
+        :raises APIError: Para qualquer outro erro HTTP ou GraphQL.
+        """
+        mutation = is_mutation(query)
+        cache = self.cache if use_cache else None
+        if cache is not None and not mutation and not refresh:
+            data = cache.get(query, variables)
+            if data is not None:
+                logging.info(f"Resposta de '{operation_key(query)}' obtida do cache.")
+                return data
+
+        try:
+            data = await self._execute_with_retry(query, variables, deadline, mutation)
+        finally:
+            if self.cache is not None and mutation:
+                # Mesmo se falhou, a mutation pode ter sido aplicada no servidor
+                for board_id in board_ids(variables):
+                    self.cache.invalidate_board(board_id)
+
+        if cache is not None and not mutation:
+            cache.set(query, variables, data)
+        return data
+
+    async def _execute_with_retry(self, query: str, variables: dict, deadline: Deadline, mutation: bool) -> dict:
+        """Laço de retentativas da chamada, conforme a `retry_policy`."""
+        deadline = deadline or Deadline(self.retry_policy.deadline)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self._send(query, variables, attempt)
+            except APIError as e:
+                delay = self.retry_policy.next_delay(e, attempt, deadline, mutation)
+                if delay is None:
+                    logging.error(f"Falha na chamada da API após {attempt} tentativa(s). Detalhes salvos em 'logs/api_errors.log'")
+                    raise
+                logging.warning(f"{type(e).__name__} na tentativa {attempt}. Nova tentativa em {delay:.2f}s...")
+                await asyncio.sleep(delay)
+
+    async def _send(self, query: str, variables: dict, attempt: int = 1) -> dict:
+        """Executa uma única tentativa da chamada, dentro do orçamento de complexidade."""
+        key = operation_key(query)
+        complexity = None
+        payload = json_backend.dumps({"query": inject_complexity(query), "variables": variables})
+        response = None
+        metrics = new_call_metrics(key, attempt, len(payload))
+        trace = HttpxTrace()
+        async with self._semaphore:
+            # O orçamento só é reservado com a vaga garantida: quem espera na fila do
+            # semáforo não segura orçamento que as chamadas em andamento poderiam usar
+            reserved = self.budget.estimate(key)
+            await self.budget.aacquire(reserved)
+            start = time.perf_counter()
+            try:
+                try:
+                    response = await self.http.post(self.api_url, content=payload, extensions={"trace": trace})
+                except httpx.ConnectTimeout as e:
+                    raise APIConnectionError(f"Tempo de conexão excedido ({self.timeout[0]}s) com {self.api_url}") from e
+                except httpx.TimeoutException as e:
+                    raise APITimeoutError(f"Tempo de resposta excedido ({self.timeout[1]}s) na chamada para {self.api_url}") from e
+                except httpx.TransportError as e:
+                    raise APIConnectionError(f"Falha de conexão com {self.api_url}: {e}") from e
+
+                decode_start = time.perf_counter()
+                result = _decode_json(response)
+                metrics.decode_time = time.perf_counter() - decode_start
+                data = _check_response(response.status_code, response.headers.get("Retry-After"), result, self.api_url)
+                logging.info(f"Status: {response.status_code}. Chamada API bem-sucedida. Tempo: {response.elapsed}")
+
+                data, complexity = _split_complexity(data, query)
+                return data
+
+            except APIRateLimitError as e:
+                self.budget.exhaust(e.retry_after)
+                metrics.error = f"{type(e).__name__}: {e}"
+                _log_api_failure(e, response, attempt)
+                raise
+
+            except APIError as e:
+                metrics.error = f"{type(e).__name__}: {e}"
+                _log_api_failure(e, response, attempt)
+                raise
+
+            except Exception as e:
+                metrics.error = f"{type(e).__name__}: {e}"
+                _log_api_failure(e, response, attempt)
+                raise APIError(f"Erro inesperado na chamada da API: {e}") from e
+
+            finally:
+                self.budget.settle(key, reserved, complexity)
+                _finish_metrics(self.hooks, metrics, start, response, complexity, trace.connect_time, trace.server_time)
+
+    def add_hook(self, hook):
+        """Registra uma função chamada com o `CallMetrics` de cada tentativa de chamada."""
+        self.hooks.append(hook)
+
+    async def aclose(self):
+        """Fecha todas as conexões abertas do pool."""
+        await self.http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+
+# Um cliente por event loop: conexões do httpx não podem ser reaproveitadas entre loops.
+_default_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncMondayClient]" = weakref.WeakKeyDictionary()
+
+def get_async_client() -> AsyncMondayClient:
+    """
+    Retorna o cliente assíncrono compartilhado do event loop em execução,
+    criando-o na primeira chamada a partir das configurações carregadas.
+    """
+    loop = asyncio.get_running_loop()
+    client = _default_async_clients.get(loop)
+    if client is None:
+        client = AsyncMondayClient()
+        _default_async_clients[loop] = client
+    return client
+
+def set_async_client(client: AsyncMondayClient):
+    """Define o cliente assíncrono compartilhado do event loop em execução."""
+    _default_async_clients[asyncio.get_running_loop()] = client
+
+async def aclose_async_client():
+    """Fecha e descarta o cliente assíncrono compartilhado do event loop em execução (se houver)."""
+    client = _default_async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+def run_closing_async_client(coro):
+    """
+    Executa `coro` em um event loop novo (`asyncio.run`) e, no fim, fecha o
+    cliente assíncrono que o loop criou, mesmo em caso de erro.
+
+    Usado pelas versões síncronas das funções assíncronas: o loop é delas,
+    então o cliente também. Quem roda o próprio loop fecha o cliente com
+    `aclose_async_client()` (ou `set_async_client` + `async with`).
+    """
+    async def run():
+        try:
+            return await coro
+        finally:
+            await aclose_async_client()
+    return asyncio.run(run())
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import threading
+from typing import TYPE_CHECKING
+from concurrent.futures import Future
+from .client import MondayClient, get_client
+from .exceptions import APIError
+from .rate_limit import is_mutation
+from .multiplex import merge_queries, split_response
+
+if TYPE_CHECKING:
+    from .async_client import AsyncMondayClient
+
+
+class QueryBatcher:
+    """Multiplexador de queries: junta várias leituras pequenas em uma única chamada.
+
+    As queries enviadas com `submit` ficam pendentes por uma janela curta
+    (`window` segundos), até juntar `max_batch_size` queries ou até `flush()`
+    ser chamado. Então são reescritas em um único documento GraphQL com
+    aliases (`merge_queries`), enviadas em uma só chamada HTTP, e a resposta é
+    separada de volta para cada chamador.
+
+    Se o cliente tiver um `cache`, queries já em cache são respondidas sem
+    entrar no lote, e cada resposta separada é guardada individualmente.
+
+    Mutations não são agrupadas: são executadas na hora. Se a chamada
+    combinada falhar com um erro GraphQL, cada query é reenviada sozinha,
+    para que apenas a query com problema receba o erro.
+
+    Args:
+        client: `MondayClient` usado nas chamadas. Padrão: `get_client()`.
+        window: Tempo máximo (s) que uma query espera por outras antes do envio.
+        max_batch_size: Número máximo de queries em um mesmo documento.
+
+    Exemplo de Uso:
+        with QueryBatcher() as lote:
+            grupos = lote.submit(QUERY_GET_GROUP_ID, {"boardId": 123})
+            contagem = lote.submit(QUERY_BOARD_ITEM_COUNT, {"boardId": 123})
+            colunas = lote.submit(QUERY_GET_COLUMN_METADATA, {"boardId": 123})
+
+        # Uma única chamada HTTP para as três queries
+        grupos.result()['boards'][0]['groups']
+    """
+    def __init__(self, client: MondayClient = None, window: float = 0.05, max_batch_size: int = 20):
+        self.client = client
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending = []
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def submit(self, query: str, variables: dict) -> Future:
+        """Agenda a query e retorna um `Future` com o dicionário 'data' dela."""
+        future = Future()
+        if is_mutation(query):
+            self._run_single(query, variables, future)
+            return future
+
+        cache = (self.client or get_client()).cache
+        cached = cache.get(query, variables) if cache is not None else None
+        if cached is not None:
+            future.set_result(cached)
+            return future
+
+        with self._lock:
+            self._pending.append((query, variables, future))
+            full = len(self._pending) >= self.max_batch_size
+            if not full and self._timer is None and self.window is not None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+        return future
+
+    def execute(self, query: str, variables: dict) -> dict:
+        """Agenda a query e aguarda o resultado (bloqueia até o envio do lote)."""
+        return self.submit(query, variables).result()
+
+    def flush(self):
+        """Envia imediatamente todas as queries pendentes."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return
+        if len(pending) == 1:
+            query, variables, future = pending[0]
+            self._run_single(query, variables, future)
+            return
+
+        client = self.client or get_client()
+        try:
+            merged_query, merged_vars = merge_queries([(query, variables) for query, variables, _ in pending])
+            logging.info(f"Enviando {len(pending)} queries agrupadas em uma única chamada...")
+            results = split_response(client.execute(merged_query, merged_vars, use_cache=False), len(pending))
+        except (APIError, ValueError) as e:
+            logging.warning(f"Falha na chamada agrupada ({e}). Reenviando as queries individualmente...")
+            for query, variables, future in pending:
+                self._run_single(query, variables, future)
+            return
+
+        for (query, variables, future), result in zip(pending, results):
+            if client.cache is not None:
+                client.cache.set(query, variables, result)
+            future.set_result(result)
+
+    def _run_single(self, query: str, variables: dict, future: Future):
+        try:
+            future.set_result((self.client or get_client()).execute(query, variables))
+        except Exception as e:
+            future.set_exception(e)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+
+class AsyncQueryBatcher:
+    """Versão assíncrona do `QueryBatcher`.
+
+    Cada `await batcher.execute(query, variables)` espera no máximo `window`
+    segundos por outras queries do mesmo event loop antes do envio combinado.
+
+    Exemplo de Uso:
+        lote = AsyncQueryBatcher()
+        grupos, contagem = await asyncio.gather(
+            lote.execute(QUERY_GET_GROUP_ID, {"boardId": 123}),
+            lote.execute(QUERY_BOARD_ITEM_COUNT, {"boardId": 123}),
+        )
+    """
+    def __init__(self, client: "AsyncMondayClient" = None, window: float = 0.05, max_batch_size: int = 20):
+        self.client = client
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending = []
+        self._flush_handle = None
+
+    async def execute(self, query: str, variables: dict) -> dict:
+        """Agenda a query e aguarda o resultado combinado."""
+        # Importado aqui: o QueryBatcher (síncrono) não carrega o httpx
+        from .async_client import get_async_client
+        if is_mutation(query):
+            return await (self.client or get_async_client()).execute(query, variables)
+
+        cache = (self.client or get_async_client()).cache
+        cached = cache.get(query, variables) if cache is not None else None
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((query, variables, future))
+        if len(self._pending) >= self.max_batch_size:
+            await self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, lambda: asyncio.ensure_future(self.flush()))
+        return await future
+
+    async def flush(self):
+        """Envia imediatamente todas as queries pendentes."""
+        pending, self._pending = self._pending, []
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not pending:
+            return
+
+        from .async_client import get_async_client
+        client = self.client or get_async_client()
+        if len(pending) > 1:
+            try:
+                merged_query, merged_vars = merge_queries([(query, variables) for query, variables, _ in pending])
+                logging.info(f"Enviando {len(pending)} queries agrupadas em uma única chamada...")
+                results = split_response(await client.execute(merged_query, merged_vars, use_cache=False), len(pending))
+                for (query, variables, future), result in zip(pending, results):
+                    if client.cache is not None:
+                        client.cache.set(query, variables, result)
+                    future.set_result(result)
+                return
+            except (APIError, ValueError) as e:
+                logging.warning(f"Falha na chamada agrupada ({e}). Reenviando as queries individualmente...")
+
+        for query, variables, future in pending:
+            try:
+                future.set_result(await client.execute(query, variables))
+            except Exception as e:
+                future.set_exception(e)
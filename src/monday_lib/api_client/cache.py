@@ -0,0 +1,194 @@
+import os
+import re
+import copy
+import json
+import time
+import pickle
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from ..infra.settings import get_settings
+from .rate_limit import operation_key
+
+_BOARD_VARIABLE = re.compile(r"board_?ids?$", re.IGNORECASE)
+
+
+class ResponseCache:
+    """Cache de respostas (TTL + LRU) para queries de leitura.
+
+    Usado pelo `MondayClient`/`AsyncMondayClient` (parâmetro `cache=`; sem
+    ele, o cache compartilhado do processo, `get_response_cache()`). As entradas são indexadas pelo hash da query mais
+    as variáveis, expiram após um TTL definido por operação e, ao atingir
+    `max_entries`, as menos usadas recentemente são descartadas.
+
+    Toda mutation que passa pelo cliente invalida as entradas dos quadros
+    presentes nas variáveis dela (ex: `create_monday_group` invalida os grupos
+    em cache do quadro).
+
+    Opcionalmente, mantém uma segunda camada em disco (`disk=True`), em
+    `PERSIST_PATH/cache`, que sobrevive entre execuções do processo.
+
+    Args:
+        max_entries: Número máximo de entradas em memória.
+        default_ttl: TTL (s) para operações sem TTL específico. Padrão: 0, ou
+            seja, só as operações de `ttls` são guardadas (páginas de itens,
+            por exemplo, não ocupam memória).
+        ttls: Dicionário {nome da operação GraphQL: TTL em segundos}.
+            Padrão: `ResponseCache.DEFAULT_TTLS`.
+        disk: Se True, também grava/lê as entradas em disco.
+        disk_path: Pasta da camada em disco. Padrão: `PERSIST_PATH/cache`.
+
+    Exemplo de Uso:
+        cache = ResponseCache(ttls={"getBoardGroups": 600}, disk=True)
+        set_client(MondayClient(cache=cache))
+    """
+    DEFAULT_TTLS = {
+        "getBoardGroups": 300,
+        "getBoardItemCount": 30,
+        "getBoardMetadata": 3600,
+    }
+
+    def __init__(self,
+                 max_entries: int = 512,
+                 default_ttl: float = 0,
+                 ttls: dict = None,
+                 disk: bool = False,
+                 disk_path: str = None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.disk_path = None
+        if disk:
+            self.disk_path = Path(disk_path) if disk_path else get_settings().PERSIST_PATH / "cache"
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(query: str, variables: dict) -> str:
+        """Chave da entrada: hash da query + variáveis (em ordem canônica)."""
+        raw = query + json.dumps(variables or {}, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, query: str) -> float:
+        """TTL (s) configurado para a operação da query."""
+        return self.ttls.get(operation_key(query), self.default_ttl)
+
+    def get(self, query: str, variables: dict) -> dict | None:
+        """Retorna uma cópia da resposta em cache, ou None se ausente/expirada."""
+        key = self.make_key(query, variables)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, _, data = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return copy.deepcopy(data)
+                del self._entries[key]
+
+        entry = self._read_disk(key, board_ids(variables))
+        if entry is None or entry[0] <= now:
+            return None
+        with self._lock:
+            self._store(key, entry)
+        return copy.deepcopy(entry[2])
+
+    def set(self, query: str, variables: dict, data: dict):
+        """Guarda a resposta da query, se a operação tiver TTL maior que zero."""
+        ttl = self.ttl_for(query)
+        if ttl <= 0:
+            return
+        key = self.make_key(query, variables)
+        entry = (time.time() + ttl, board_ids(variables), copy.deepcopy(data))
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+
+    def invalidate_board(self, board_id):
+        """Remove todas as entradas (memória e disco) ligadas ao quadro."""
+        board_id = str(board_id)
+        with self._lock:
+            stale = [key for key, (_, boards, _) in self._entries.items() if board_id in boards]
+            for key in stale:
+                del self._entries[key]
+        if self.disk_path is not None:
+            for folder in (self.disk_path / board_id, self.disk_path / "_multi"):
+                for file in folder.glob("*.pkl") if folder.is_dir() else []:
+                    file.unlink(missing_ok=True)
+        if stale:
+            logging.info(f"Cache: {len(stale)} resposta(s) do quadro {board_id} invalidada(s).")
+
+    def clear(self):
+        """Esvazia o cache em memória e em disco."""
+        with self._lock:
+            self._entries.clear()
+        if self.disk_path is not None:
+            for file in self.disk_path.glob("*/*.pkl"):
+                file.unlink(missing_ok=True)
+
+    def _store(self, key: str, entry: tuple):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_file(self, key: str, boards: frozenset) -> Path:
+        if len(boards) == 1:
+            folder = next(iter(boards))
+        else:
+            folder = "_multi" if boards else "_global"
+        return self.disk_path / folder / f"{key}.pkl"
+
+    def _read_disk(self, key: str, boards: frozenset) -> tuple | None:
+        if self.disk_path is None:
+            return None
+        file = self._disk_file(key, boards)
+        try:
+            with open(file, "rb") as f:
+                return pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _write_disk(self, key: str, entry: tuple):
+        if self.disk_path is None:
+            return
+        file = self._disk_file(key, entry[1])
+        os.makedirs(file.parent, exist_ok=True)
+        # Grava em arquivo temporário e renomeia, para não deixar entradas corrompidas
+        tmp_file = file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(entry, f)
+        os.replace(tmp_file, file)
+
+
+def board_ids(variables: dict) -> frozenset:
+    """IDs de quadro presentes nas variáveis (`boardId`, `board_id`, `boardIds`, `q0_boardId`...)."""
+    found = set()
+    for name, value in (variables or {}).items():
+        if not _BOARD_VARIABLE.search(name) or value is None:
+            continue
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        found.update(str(v) for v in values)
+    return frozenset(found)
+
+
+_default_cache: ResponseCache | None = None
+_default_cache_lock = threading.Lock()
+
+def get_response_cache() -> ResponseCache:
+    """
+    Retorna o cache de respostas compartilhado pelos clientes do processo
+    (`MondayClient` e `AsyncMondayClient` criados sem `cache=`).
+
+    Guarda só os grupos dos quadros (`getBoardGroups`, TTL de
+    `ResponseCache.DEFAULT_TTLS`): as demais leituras vão sempre à API, a não
+    ser que o cliente receba um `ResponseCache` próprio.
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = ResponseCache(ttls={"getBoardGroups": ResponseCache.DEFAULT_TTLS["getBoardGroups"]})
+    return _default_cache
@@ -1,81 +1,72 @@
-import os
-import json
-import inspect
-import logging
-import requests
-from datetime import datetime
-from infra.settings import get_settings
-from ..utils.logger import api_logger
-from .exceptions import APIError, APITimeoutError
-settings = get_settings()
+from typing import TYPE_CHECKING
+from .client import get_client, MondayClient
+from .exceptions import APIError, APITimeoutError, APIServerError, APIConnectionError, APIRateLimitError
+from .retry import Deadline
+from .streaming import ItemsPageStream, ITEMS_PAGE_PREFIX
 
+if TYPE_CHECKING:
+    # httpx só é importado quando a API assíncrona é usada
+    from .async_client import AsyncMondayClient
 
-def call_monday_api(query: str, variables: dict) -> dict:
+
+def call_monday_api(query: str, variables: dict, client: MondayClient = None, deadline: Deadline = None,
+                    refresh: bool = False) -> dict:
     """
     Função centralizada para fazer chamadas à API GraphQL do Monday.com.
 
+    Por padrão usa o cliente compartilhado (`get_client()`), que reaproveita
+    as conexões abertas entre chamadas e repete automaticamente as chamadas
+    que falharem por erros transitórios (429, 5xx, timeouts, conexão perdida).
+
     :param query: A string da query/mutation GraphQL.
     :param variables: Um dicionário com as variáveis para a query.
+    :param client: (Opcional) Um `MondayClient` específico para esta chamada.
+    :param deadline: (Opcional) `Deadline` compartilhado pela operação lógica
+        (ex: todas as páginas de uma exportação), limitando o tempo total de retentativas.
+    :param refresh: (Opcional) Busca na API mesmo que a resposta esteja no cache
+        do cliente (que é atualizado).
     :return: O dicionário 'data' da resposta JSON da API.
-    :raises Exception: Se a chamada HTTP ou a query GraphQL retornarem erros.
+    :raises APIError: Se a chamada HTTP ou a query GraphQL retornarem erros.
     """
-    if not settings.MONDAY_API_TOKEN.get_secret_value() or not settings.MONDAY_API_TOKEN.get_secret_value():
-        raise EnvironmentError("API_KEY ou MONDAY_API_URL não foram definidos no .env")
+    return (client or get_client()).execute(query, variables, deadline=deadline, refresh=refresh)
 
-    headers = {
-        "Authorization": f"Bearer {settings.MONDAY_API_TOKEN.get_secret_value()}",
-        "Content-Type": "application/json"
-    }
-    payload = {"query": query, "variables": variables}
-    try:
-        response = requests.post(
-            url=settings.MONDAY_API_URL,
-            headers=headers,
-            json=payload,
-            verify=str(settings.PEM_PATH) if settings.PEM_PATH else True
-        )
-        
-        response.raise_for_status()
-        logging.info(f"Status: {response.status_code}. Chamada API bem-sucedida. Tempo: {response.elapsed}")
 
-        result = response.json()
-        
-        # Verificacao de erros especificos do GraphQL
-        if "errors" in result:
-            raise Exception(f"Erro na consulta GraphQL: {result['errors']}")
-        
-        if not result.get("data"):
-            raise Exception(f"Resposta inesperada da API: {result}")
-        
-        return result.get("data", {})
-    
+def stream_monday_items(query: str, variables: dict, client: MondayClient = None, deadline: Deadline = None,
+                        page_prefix: str = ITEMS_PAGE_PREFIX) -> ItemsPageStream:
+    """
+    Variante de `call_monday_api` para queries de `items_page`: retorna a página
+    em modo streaming, decodificando e entregando os itens um a um.
+
+    :param query: Query GraphQL com `boards { items_page { cursor items { ... } } }`.
+    :param variables: Um dicionário com as variáveis para a query.
+    :param client: (Opcional) Um `MondayClient` específico para esta chamada.
+    :param deadline: (Opcional) `Deadline` compartilhado pela operação lógica.
+    :param page_prefix: (Opcional) Caminho do `items_page` na resposta, no formato do ijson
+        (ex: `GROUP_ITEMS_PAGE_PREFIX` para o items_page de um grupo).
+    :return: `ItemsPageStream`; após percorrer os itens, `cursor` aponta a próxima página.
+    :raises APIError: Se a chamada HTTP ou a query GraphQL retornarem erros.
+    """
+    return (client or get_client()).stream_items_page(query, variables, deadline=deadline, page_prefix=page_prefix)
 
-    # novo
-    except requests.exceptions.HTTPError as e:
-        if e.response is not None and e.response.status_code == 504:
-            raise APITimeoutError(f"Gateway Timeout (504) na chamada para {e.request.url}") from e
-        else:
-            raise APIError(f"Erro de HTTP: {e}") from e
-        
-        
-        
-    except Exception as e:
-        caller_frame = inspect.stack()[1]
-        caller_filename = os.path.basename(caller_frame.filename)
-        caller_function = caller_frame.function
-        caller_lineno = caller_frame.lineno
 
-        log_data = {
-            "timestamp": datetime.now().isoformat(),
-            "called_from": f"{caller_filename} -> {caller_function}() na linha {caller_lineno}",
-            "status_code": response.status_code if response is not None else "N/A",
-            "elapsed_time": str(response.elapsed) if response is not None else "N/A",
-            "error_type": type(e).__name__,
-            "error_message": str(e),
-            # "request_body": payload 
-        }
-        log_message = json.dumps(log_data, indent=4, ensure_ascii=False)
-        api_logger.error(log_message)
-        logging.error(f"Falha na chamada da API. Detalhes salvos em 'logs/api_errors.log'")
-        raise APIError(f"Erro inesperado na chamada da API: {e}") from e
-            
\ No newline at end of file
+async def acall_monday_api(query: str, variables: dict, client: "AsyncMondayClient" = None, deadline: Deadline = None,
+                           refresh: bool = False) -> dict:
+    """
+    Versão assíncrona de `call_monday_api`.
+
+    Por padrão usa o cliente assíncrono compartilhado do event loop em execução
+    (`get_async_client()`), cujo limite de concorrência vale para todas as
+    chamadas feitas por ele.
+
+    :param query: A string da query/mutation GraphQL.
+    :param variables: Um dicionário com as variáveis para a query.
+    :param client: (Opcional) Um `AsyncMondayClient` específico para esta chamada.
+    :param deadline: (Opcional) `Deadline` compartilhado pela operação lógica.
+    :param refresh: (Opcional) Busca na API mesmo que a resposta esteja no cache do cliente.
+    :return: O dicionário 'data' da resposta JSON da API.
+    :raises APIError: Se a chamada HTTP ou a query GraphQL retornarem erros.
+    """
+    if client is None:
+        from .async_client import get_async_client
+        client = get_async_client()
+    return await client.execute(query, variables, deadline=deadline, refresh=refresh)
@@ -0,0 +1,419 @@
+import os
+import re
+import json
+import time
+import inspect
+import logging
+import threading
+import requests
+from datetime import datetime
+from ..infra.settings import get_settings
+from ..utils.logger import api_logger
+from .exceptions import (APIError, APITimeoutError, APIServerError, APIConnectionError, APIRateLimitError,
+                         APICursorExpiredError)
+from .rate_limit import ComplexityBudget, get_complexity_budget, inject_complexity, operation_key, is_mutation
+from .retry import RetryPolicy, Deadline
+from .cache import ResponseCache, board_ids, get_response_cache
+from .streaming import ItemsPageStream, ITEMS_PAGE_PREFIX
+from . import json_backend
+from .metrics import (MetricsRegistry, CallMetrics, TimedHTTPAdapter, get_metrics_registry, new_call_metrics,
+                      complexity_cost, emit, reset_connect_time, last_connect_time)
+
+# Códigos de erro da API do Monday que indicam limite de taxa (a chamada não foi executada)
+RATE_LIMIT_ERROR_CODES = {
+    "ComplexityException",
+    "COMPLEXITY_BUDGET_EXHAUSTED",
+    "RATE_LIMIT_EXCEEDED",
+    "IP_RATE_LIMIT_EXCEEDED",
+    "FIELD_MINUTE_RATE_LIMIT_EXCEEDED",
+    "CONCURRENCY_LIMIT_EXCEEDED",
+    "maxConcurrencyExceeded",
+}
+# Códigos de erro de cursor de paginação expirado/inválido
+CURSOR_ERROR_CODES = {"CursorExpiredError", "InvalidCursorException"}
+_RESET_IN_SECONDS = re.compile(r"reset in (\d+) seconds?", re.IGNORECASE)
+
+
+class MondayClient:
+    """Cliente HTTP gerenciado para a API GraphQL do Monday.com.
+
+    Mantém uma única `requests.Session` com pool de conexões (keep-alive), de
+    modo que o handshake TCP+TLS e a leitura do bundle de certificados
+    (`PEM_PATH`) acontecem uma única vez por conexão, e não a cada chamada.
+
+    Todos os parâmetros são opcionais; quando omitidos, são lidos das
+    configurações carregadas por `load_settings`.
+
+    Args:
+        api_url: URL da API GraphQL.
+        api_token: Token de acesso (str).
+        pem_path: Caminho para o bundle de certificados .pem.
+        pool_size: Número máximo de conexões mantidas abertas no pool.
+        connect_timeout: Tempo máximo (s) para estabelecer a conexão.
+        read_timeout: Tempo máximo (s) aguardando a resposta do servidor.
+        budget: Orçamento de complexidade usado para agendar as chamadas. Por
+            padrão, o orçamento compartilhado do processo (`get_complexity_budget()`).
+        retry_policy: Política de retentativas (`RetryPolicy`). Por padrão,
+            backoff exponencial com jitter para 429, 5xx, timeouts e conexões perdidas.
+        cache: `ResponseCache` para as respostas de queries de leitura. Por
+            padrão, o cache compartilhado do processo (`get_response_cache()`),
+            que guarda só os grupos dos quadros.
+        metrics: Registro onde as métricas de cada chamada são acumuladas. Por
+            padrão, o registro compartilhado do processo (`get_metrics_registry()`).
+        hooks: Funções chamadas com o `CallMetrics` de cada tentativa de chamada
+            (ex: `OpenTelemetryHook()`).
+
+    Exemplo de Uso:
+        client = MondayClient(pool_size=20, read_timeout=60)
+        data = client.execute(QUERY_GET_GROUP_ID, {"boardId": 123})
+    """
+    def __init__(self,
+                 api_url: str = None,
+                 api_token: str = None,
+                 pem_path: str = None,
+                 pool_size: int = None,
+                 connect_timeout: float = None,
+                 read_timeout: float = None,
+                 budget: ComplexityBudget = None,
+                 retry_policy: RetryPolicy = None,
+                 cache: ResponseCache = None,
+                 metrics: MetricsRegistry = None,
+                 hooks: list = None):
+        settings = get_settings()
+
+        self.api_url = str(api_url or settings.MONDAY_API_URL)
+        self.api_token = api_token or settings.MONDAY_API_TOKEN.get_secret_value()
+        self.pem_path = pem_path or settings.PEM_PATH
+        self.pool_size = pool_size or settings.HTTP_POOL_SIZE
+        self.timeout = (connect_timeout or settings.HTTP_CONNECT_TIMEOUT,
+                        read_timeout or settings.HTTP_READ_TIMEOUT)
+
+        self.budget = budget or get_complexity_budget()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache or get_response_cache()
+        self.metrics = metrics or get_metrics_registry()
+        self.hooks = [self.metrics, *(hooks or [])]
+
+        if not self.api_token or not self.api_url:
+            raise EnvironmentError("API_KEY ou MONDAY_API_URL não foram definidos no .env")
+
+        self.session = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        """Cria a sessão com pool de conexões, cabeçalhos fixos e verificação TLS."""
+        session = requests.Session()
+        adapter = TimedHTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        session.verify = str(self.pem_path) if self.pem_path else True
+        return session
+
+    def execute(self, query: str, variables: dict, deadline: Deadline = None, use_cache: bool = True,
+                refresh: bool = False) -> dict:
+        """
+        Envia uma query/mutation GraphQL usando a sessão compartilhada, repetindo
+        a chamada em caso de erros transitórios conforme a `retry_policy`.
+
+        :param query: A string da query/mutation GraphQL.
+        :param variables: Um dicionário com as variáveis para a query.
+        :param deadline: (Opcional) Prazo total da operação lógica da qual esta
+            chamada faz parte. Se omitido, usa o `deadline` padrão da política.
+        :param use_cache: Se False, ignora o `cache` do cliente nesta chamada
+            (a resposta também não é guardada).
+        :param refresh: Se True, não usa a resposta em cache, mas guarda a nova
+            (ex: o dado pode ter mudado fora da biblioteca).
+        :return: O dicionário 'data' da resposta JSON da API.
+        :raises APITimeoutError: Em caso de Gateway Timeout (504).
+        :raises APIError: Para qualquer outro erro HTTP ou GraphQL.
+        """
+        mutation = is_mutation(query)
+        cache = self.cache if use_cache else None
+        if cache is not None and not mutation and not refresh:
+            data = cache.get(query, variables)
+            if data is not None:
+                logging.info(f"Resposta de '{operation_key(query)}' obtida do cache.")
+                return data
+
+        try:
+            data = self._execute_with_retry(query, variables, deadline, mutation)
+        finally:
+            if self.cache is not None and mutation:
+                # Mesmo se falhou, a mutation pode ter sido aplicada no servidor
+                for board_id in board_ids(variables):
+                    self.cache.invalidate_board(board_id)
+
+        if cache is not None and not mutation:
+            cache.set(query, variables, data)
+        return data
+
+    def _execute_with_retry(self, query: str, variables: dict, deadline: Deadline, mutation: bool) -> dict:
+        """Laço de retentativas da chamada, conforme a `retry_policy`."""
+        deadline = deadline or Deadline(self.retry_policy.deadline)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return self._send(query, variables, attempt)
+            except APIError as e:
+                delay = self.retry_policy.next_delay(e, attempt, deadline, mutation)
+                if delay is None:
+                    logging.error(f"Falha na chamada da API após {attempt} tentativa(s). Detalhes salvos em 'logs/api_errors.log'")
+                    raise
+                logging.warning(f"{type(e).__name__} na tentativa {attempt}. Nova tentativa em {delay:.2f}s...")
+                time.sleep(delay)
+
+    def _send(self, query: str, variables: dict, attempt: int = 1) -> dict:
+        """Executa uma única tentativa da chamada, dentro do orçamento de complexidade."""
+        key = operation_key(query)
+        reserved = self.budget.estimate(key)
+        self.budget.acquire(reserved)
+
+        complexity = None
+        payload = json_backend.dumps({"query": inject_complexity(query), "variables": variables})
+        response = None
+        metrics = new_call_metrics(key, attempt, len(payload))
+        start = time.perf_counter()
+        reset_connect_time()
+        try:
+            try:
+                response = self.session.post(url=self.api_url, data=payload, timeout=self.timeout)
+            except requests.exceptions.ConnectTimeout as e:
+                raise APIConnectionError(f"Tempo de conexão excedido ({self.timeout[0]}s) com {self.api_url}") from e
+            except requests.exceptions.Timeout as e:
+                raise APITimeoutError(f"Tempo de resposta excedido ({self.timeout[1]}s) na chamada para {self.api_url}") from e
+            except requests.exceptions.ConnectionError as e:
+                raise APIConnectionError(f"Falha de conexão com {self.api_url}: {e}") from e
+
+            decode_start = time.perf_counter()
+            result = _decode_json(response)
+            metrics.decode_time = time.perf_counter() - decode_start
+            data = _check_response(response.status_code, response.headers.get("Retry-After"), result, self.api_url)
+            logging.info(f"Status: {response.status_code}. Chamada API bem-sucedida. Tempo: {response.elapsed}")
+
+            data, complexity = _split_complexity(data, query)
+            return data
+
+        except APIRateLimitError as e:
+            self.budget.exhaust(e.retry_after)
+            metrics.error = f"{type(e).__name__}: {e}"
+            _log_api_failure(e, response, attempt)
+            raise
+
+        except APIError as e:
+            metrics.error = f"{type(e).__name__}: {e}"
+            _log_api_failure(e, response, attempt)
+            raise
+
+        except Exception as e:
+            metrics.error = f"{type(e).__name__}: {e}"
+            _log_api_failure(e, response, attempt)
+            raise APIError(f"Erro inesperado na chamada da API: {e}") from e
+
+        finally:
+            self.budget.settle(key, reserved, complexity)
+            server_time = response.elapsed.total_seconds() - last_connect_time() if response is not None else 0.0
+            _finish_metrics(self.hooks, metrics, start, response, complexity, last_connect_time(), server_time)
+
+    def add_hook(self, hook):
+        """Registra uma função chamada com o `CallMetrics` de cada tentativa de chamada."""
+        self.hooks.append(hook)
+
+    def stream_items_page(self, query: str, variables: dict, deadline: Deadline = None,
+                          page_prefix: str = ITEMS_PAGE_PREFIX) -> ItemsPageStream:
+        """
+        Envia uma query de `items_page` e retorna a página em modo streaming:
+        os itens são decodificados e entregues um a um, conforme o corpo da
+        resposta chega, sem montar o dicionário completo da página na memória.
+        O cache do cliente não é usado.
+
+        :param query: Query GraphQL com `items_page { cursor items { ... } }`.
+        :param variables: Um dicionário com as variáveis para a query.
+        :param deadline: (Opcional) Prazo total da operação lógica.
+        :param page_prefix: Caminho da página na resposta, no formato do ijson.
+            Padrão: `data.boards.item.items_page`.
+        :return: `ItemsPageStream` (iterável de itens; `cursor` após o consumo).
+        """
+        return ItemsPageStream(self, query, variables, deadline, page_prefix)
+
+    def close(self):
+        """Fecha todas as conexões abertas do pool."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _decode_json(response) -> dict | None:
+    """Decodifica o corpo JSON da resposta (orjson, se disponível); None se o corpo não for JSON."""
+    try:
+        return json_backend.loads(response.content)
+    except ValueError:
+        return None
+
+def _finish_metrics(hooks: list, metrics: CallMetrics, start: float, response, complexity: dict | None,
+                    connect_time: float, server_time: float):
+    """Completa as métricas de uma tentativa (tempos, bytes, custo) e as entrega aos hooks."""
+    metrics.total_time = time.perf_counter() - start
+    metrics.connect_time = connect_time
+    metrics.server_time = max(server_time, 0.0)
+    metrics.transfer_time = max(metrics.total_time - connect_time - metrics.server_time - metrics.decode_time, 0.0)
+    metrics.complexity_cost = complexity_cost(complexity)
+    if response is not None:
+        metrics.status_code = response.status_code
+        metrics.response_bytes = _wire_bytes(response)
+    emit(hooks, metrics)
+
+def _wire_bytes(response) -> int:
+    """Bytes do corpo recebidos pela rede (comprimidos, se a resposta veio com gzip)."""
+    downloaded = getattr(response, "num_bytes_downloaded", None)  # httpx
+    if downloaded is not None:
+        return downloaded
+    try:
+        return response.raw.tell()  # requests/urllib3
+    except (AttributeError, OSError):
+        return len(response.content or b"")
+
+def _parse_retry_after(value) -> float | None:
+    """Converte o cabeçalho `Retry-After` (em segundos) para float."""
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+def _rate_limit_error(result: dict, retry_after: float = None) -> APIRateLimitError | None:
+    """
+    Procura, no corpo da resposta, erros de limite de taxa da API (formato atual,
+    com `extensions.code`, ou legado, com `error_code`). Retorna a exceção
+    correspondente, ou None se não houver erro de limite.
+    """
+    codes, messages = [], []
+    for error in result.get("errors") or []:
+        extensions = error.get("extensions") or {}
+        codes.append(extensions.get("code"))
+        messages.append(str(error.get("message", "")))
+        if extensions.get("retry_in_seconds") is not None:
+            retry_after = float(extensions["retry_in_seconds"])
+    if result.get("error_code"):
+        codes.append(result.get("error_code"))
+        messages.append(str(result.get("error_message", "")))
+
+    if not any(code in RATE_LIMIT_ERROR_CODES for code in codes):
+        return None
+    if retry_after is None:
+        match = _RESET_IN_SECONDS.search(" ".join(messages))
+        retry_after = float(match.group(1)) if match else None
+    return APIRateLimitError(f"Limite da API atingido: {' | '.join(messages)}", retry_after=retry_after)
+
+def _graphql_error(result: dict, retry_after: float = None) -> APIError | None:
+    """
+    Exceção correspondente aos erros no corpo de uma resposta com status 200
+    (limite de taxa, cursor expirado/inválido ou erro de GraphQL), ou None se
+    não houver erro. Usada na leitura normal e na leitura em streaming.
+    """
+    rate_limit = _rate_limit_error(result, retry_after)
+    if rate_limit is not None:
+        return rate_limit
+    if "errors" in result:
+        if any((error.get("extensions") or {}).get("code") in CURSOR_ERROR_CODES for error in result["errors"]):
+            return APICursorExpiredError(f"Cursor de paginação expirado ou inválido: {result['errors']}")
+        return APIError(f"Erro na consulta GraphQL: {result['errors']}")
+    return None
+
+def _check_response(status_code: int, retry_after: str | None, result: dict | None, url: str) -> dict:
+    """
+    Valida o status HTTP e o JSON de resposta da API e retorna o dicionário 'data'.
+    Levanta a exceção da classe correspondente ao erro encontrado.
+    """
+    retry_after = _parse_retry_after(retry_after)
+    rate_limit = _rate_limit_error(result, retry_after) if isinstance(result, dict) else None
+    if rate_limit is not None:
+        raise rate_limit
+
+    if status_code == 429:
+        raise APIRateLimitError(f"Too Many Requests (429) na chamada para {url}", retry_after=retry_after)
+    if status_code == 504:
+        raise APITimeoutError(f"Gateway Timeout (504) na chamada para {url}")
+    if status_code >= 500:
+        raise APIServerError(f"Erro de HTTP: {status_code} na chamada para {url}")
+    if status_code >= 400:
+        raise APIError(f"Erro de HTTP: {status_code} na chamada para {url}: {result}")
+
+    if result is None:
+        raise APIError(f"Resposta inesperada da API (corpo não é JSON), status {status_code}.")
+
+    # Verificacao de erros especificos do GraphQL
+    error = _graphql_error(result, retry_after)
+    if error is not None:
+        raise error
+
+    if not result.get("data"):
+        raise APIError(f"Resposta inesperada da API: {result}")
+
+    return result.get("data", {})
+
+def _split_complexity(data: dict, query: str) -> tuple[dict, dict | None]:
+    """
+    Separa o bloco `complexity` (adicionado pelo cliente) dos dados da resposta.
+    Se a própria query do usuário pediu `complexity`, o bloco é mantido nos dados.
+    """
+    if inject_complexity(query) is query:
+        return data, data.get("complexity")
+    return data, data.pop("complexity", None)
+
+def _log_api_failure(error: Exception, response, attempt: int = 1):
+    """Registra os detalhes de uma chamada com falha no arquivo 'api_errors.log'."""
+    # Primeiro frame fora do pacote api_client: quem de fato chamou a API
+    client_dir = os.path.dirname(__file__)
+    caller_frame = next(
+        (frame for frame in inspect.stack()[1:] if os.path.dirname(frame.filename) != client_dir),
+        inspect.stack()[1]
+    )
+    caller_filename = os.path.basename(caller_frame.filename)
+
+    log_data = {
+        "timestamp": datetime.now().isoformat(),
+        "called_from": f"{caller_filename} -> {caller_frame.function}() na linha {caller_frame.lineno}",
+        "status_code": response.status_code if response is not None else "N/A",
+        "elapsed_time": str(response.elapsed) if response is not None else "N/A",
+        "attempt": attempt,
+        "error_type": type(error).__name__,
+        "error_message": str(error),
+    }
+    log_message = json.dumps(log_data, indent=4, ensure_ascii=False)
+    api_logger.error(log_message)
+
+
+_default_client: MondayClient | None = None
+_default_client_lock = threading.Lock()
+
+def get_client() -> MondayClient:
+    """
+    Retorna o cliente compartilhado por todos os serviços da biblioteca,
+    criando-o na primeira chamada a partir das configurações carregadas.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = MondayClient()
+    return _default_client
+
+def set_client(client: MondayClient | None):
+    """
+    Substitui o cliente compartilhado (ex: para usar um pool maior ou outros timeouts).
+    Passar None fecha o cliente atual e faz com que um novo seja criado no próximo uso.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is not None and _default_client is not client:
+            _default_client.close()
+        _default_client = client
@@ -4,4 +4,31 @@ class APIError(Exception):
 
 class APITimeoutError(APIError):
     """Exceção específica para erros de Timeout (504)."""
-    pass
\ No newline at end of file
+    pass
+
+class APIServerError(APIError):
+    """Exceção para erros 5xx do servidor (exceto 504, que é um APITimeoutError)."""
+    pass
+
+class APIConnectionError(APIError):
+    """Exceção para falhas de conexão (conexão recusada, resetada, falha de DNS...)."""
+    pass
+
+class APICursorExpiredError(APIError):
+    """
+    Exceção para cursores de paginação expirados ou inválidos (o Monday mantém
+    um cursor de `items_page` válido por 60 minutos). Não é repetida: a
+    paginação precisa recomeçar da primeira página.
+    """
+    pass
+
+class APIRateLimitError(APIError):
+    """
+    Exceção para erros de limite de taxa da API (HTTP 429, orçamento de
+    complexidade esgotado, limite de concorrência...).
+
+    `retry_after` guarda quantos segundos a API pediu para aguardar, se informado.
+    """
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
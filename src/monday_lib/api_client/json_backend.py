@@ -0,0 +1,40 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depende do ambiente
+    ijson = None
+
+# Exceções de JSON inválido/incompleto dos backends disponíveis
+DECODE_ERRORS = (ValueError, ijson.common.JSONError) if ijson is not None else (ValueError,)
+
+# Nome do backend em uso, para logs/diagnóstico
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: bytes | str):
+    """Decodifica JSON com o backend mais rápido disponível (orjson, se instalado)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj) -> bytes:
+    """
+    Codifica `obj` em JSON (bytes UTF-8). Usa orjson quando possível e cai para
+    o `json` da biblioteca padrão se o objeto tiver tipos que o orjson não aceita.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+def streaming_available() -> bool:
+    """Indica se a decodificação incremental (ijson) está disponível."""
+    return ijson is not None
@@ -0,0 +1,378 @@
+import os
+import time
+import logging
+import threading
+import contextlib
+import contextvars
+from dataclasses import dataclass, field, asdict
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Limites (s) dos buckets do histograma de latência total das chamadas
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Contexto da chamada atual (função da biblioteca, página...), visto pelas métricas
+_call_context: contextvars.ContextVar[dict] = contextvars.ContextVar("monday_call_context", default={})
+
+
+@dataclass
+class CallMetrics:
+    """Métricas de uma tentativa de chamada à API.
+
+    Os tempos estão em segundos:
+      - connect_time: abertura da conexão TCP+TLS (0 se a conexão do pool foi reaproveitada);
+      - server_time: espera pela resposta do servidor (até os cabeçalhos);
+      - transfer_time: download do corpo;
+      - decode_time: decodificação do JSON;
+      - total_time: duração total da tentativa.
+    """
+    operation: str
+    attempt: int = 1
+    status_code: int | None = None
+    started_at: float = 0.0
+    connect_time: float = 0.0
+    server_time: float = 0.0
+    transfer_time: float = 0.0
+    decode_time: float = 0.0
+    total_time: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    complexity_cost: float | None = None
+    error: str | None = None
+    function: str | None = None
+    page: int | None = None
+    extra: dict = field(default_factory=dict)
+
+    @property
+    def retries(self) -> int:
+        """Número de retentativas que antecederam esta tentativa."""
+        return self.attempt - 1
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data["retries"] = self.retries
+        return data
+
+
+@contextlib.contextmanager
+def call_context(**values):
+    """
+    Associa informações de contexto (ex: `page=3`, `function="extrair_dados_paginados"`)
+    às métricas de todas as chamadas feitas dentro do bloco `with`.
+    Vale para a thread/tarefa asyncio atual.
+
+    A chave especial `observer` recebe uma função chamada com o `CallMetrics` de
+    cada tentativa feita no bloco (além dos hooks do cliente); ela não vai para
+    as métricas. Ex: o ajuste adaptativo do tamanho de página da exportação.
+    """
+    token = _call_context.set({**_call_context.get(), **values})
+    try:
+        yield
+    finally:
+        _call_context.reset(token)
+
+def iter_in_context(iterable, **values):
+    """
+    Percorre `iterable` aplicando `call_context(**values)` só enquanto ele
+    avança (ex: enquanto um gerador busca a próxima página).
+
+    Um `with call_context(...)` em volta de um `yield` vazaria o contexto para o
+    código de quem consome o gerador; aqui ele vale apenas para as chamadas
+    feitas pelo próprio gerador.
+    """
+    iterator = iter(iterable)
+    try:
+        while True:
+            with call_context(**values):
+                try:
+                    value = next(iterator)
+                except StopIteration:
+                    return
+            yield value
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+async def aiter_in_context(aiterable, **values):
+    """Versão assíncrona de `iter_in_context`, para geradores `async def`."""
+    iterator = aiterable.__aiter__()
+    try:
+        while True:
+            with call_context(**values):
+                try:
+                    value = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield value
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+def current_context() -> dict:
+    """Contexto de chamada ativo (ver `call_context`)."""
+    return _call_context.get()
+
+def new_call_metrics(operation: str, attempt: int, request_bytes: int) -> CallMetrics:
+    """Cria o registro de uma tentativa, já com a função e a página do contexto atual."""
+    context = dict(current_context())
+    context.pop("observer", None)
+    return CallMetrics(
+        operation=operation,
+        attempt=attempt,
+        started_at=time.time(),
+        request_bytes=request_bytes,
+        function=context.pop("function", None),
+        page=context.pop("page", None),
+        extra=context,
+    )
+
+def complexity_cost(complexity: dict | None) -> float | None:
+    """Custo real da chamada, a partir do bloco `complexity` da resposta."""
+    if not complexity or complexity.get("before") is None or complexity.get("after") is None:
+        return None
+    return max(complexity["before"] - complexity["after"], 0)
+
+
+class MetricsRegistry:
+    """Agregador das métricas das chamadas, exportável no formato do Prometheus.
+
+    Por padrão todos os clientes do processo registram suas chamadas no
+    registro compartilhado (`get_metrics_registry()`). O arquivo gerado por
+    `write_textfile` pode ser coletado pelo textfile collector do node_exporter.
+
+    Exemplo de Uso:
+        registry = get_metrics_registry()
+        extrair_dados_paginados("8585814551", "CRI", column_name="Prazo Inicial")
+        registry.write_textfile("/var/lib/node_exporter/monday.prom")
+    """
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Zera todas as métricas acumuladas."""
+        with self._lock:
+            self._calls = {}       # (operation, status) -> quantidade
+            self._retries = {}     # operation -> retentativas
+            self._bytes = {}       # (operation, direction) -> bytes
+            self._complexity = {}  # operation -> custo somado
+            self._phases = {}      # (operation, phase) -> segundos somados
+            self._latency = {}     # operation -> [contagem por bucket..., soma, total]
+            self._functions = {}   # (function, outcome) -> [soma, total]
+
+    def record(self, metrics: CallMetrics):
+        """Acumula as métricas de uma tentativa de chamada."""
+        op = metrics.operation
+        status = str(metrics.status_code) if metrics.status_code is not None else "error"
+        with self._lock:
+            self._calls[(op, status)] = self._calls.get((op, status), 0) + 1
+            if metrics.retries:
+                self._retries[op] = self._retries.get(op, 0) + 1
+            for direction, value in (("request", metrics.request_bytes), ("response", metrics.response_bytes)):
+                self._bytes[(op, direction)] = self._bytes.get((op, direction), 0) + value
+            if metrics.complexity_cost is not None:
+                self._complexity[op] = self._complexity.get(op, 0) + metrics.complexity_cost
+            for phase in ("connect", "server", "transfer", "decode"):
+                key = (op, phase)
+                self._phases[key] = self._phases.get(key, 0.0) + getattr(metrics, f"{phase}_time")
+
+            histogram = self._latency.setdefault(op, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if metrics.total_time <= bound:
+                    histogram[i] += 1
+            histogram[-2] += metrics.total_time
+            histogram[-1] += 1
+
+    def record_function(self, function: str, seconds: float, ok: bool = True):
+        """Acumula a duração de uma função da biblioteca (ver `log_api_errors`)."""
+        key = (function, "success" if ok else "failure")
+        with self._lock:
+            total = self._functions.setdefault(key, [0.0, 0])
+            total[0] += seconds
+            total[1] += 1
+
+    def __call__(self, metrics: CallMetrics):
+        # Permite usar o próprio registro como hook de um cliente
+        self.record(metrics)
+
+    def to_prometheus(self) -> str:
+        """Exporta as métricas acumuladas no formato texto do Prometheus."""
+        lines = []
+
+        def family(name: str, kind: str, help_text: str, samples: list):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                lines.append(f"{name}{suffix}{{{label_text}}} {value}")
+
+        with self._lock:
+            family("monday_api_calls_total", "counter", "Tentativas de chamada à API por operação e status HTTP.",
+                   [("", {"operation": op, "status": status}, n) for (op, status), n in sorted(self._calls.items())])
+            family("monday_api_retries_total", "counter", "Tentativas que foram retentativas de uma chamada anterior.",
+                   [("", {"operation": op}, n) for op, n in sorted(self._retries.items())])
+            family("monday_api_bytes_total", "counter", "Bytes enviados e recebidos por operação.",
+                   [("", {"operation": op, "direction": d}, n) for (op, d), n in sorted(self._bytes.items())])
+            family("monday_api_complexity_total", "counter", "Custo de complexidade consumido por operação.",
+                   [("", {"operation": op}, n) for op, n in sorted(self._complexity.items())])
+            family("monday_api_phase_seconds_total", "counter", "Tempo gasto em cada fase das chamadas (connect, server, transfer, decode).",
+                   [("", {"operation": op, "phase": phase}, round(s, 6)) for (op, phase), s in sorted(self._phases.items())])
+
+            samples = []
+            for op, histogram in sorted(self._latency.items()):
+                for bound, count in zip(self.buckets, histogram):
+                    samples.append(("_bucket", {"operation": op, "le": bound}, count))
+                samples.append(("_bucket", {"operation": op, "le": "+Inf"}, histogram[-1]))
+                samples.append(("_sum", {"operation": op}, round(histogram[-2], 6)))
+                samples.append(("_count", {"operation": op}, histogram[-1]))
+            family("monday_api_latency_seconds", "histogram", "Duração total das tentativas de chamada.", samples)
+
+            samples = []
+            for (function, outcome), (seconds, count) in sorted(self._functions.items()):
+                samples.append(("_sum", {"function": function, "outcome": outcome}, round(seconds, 6)))
+                samples.append(("_count", {"function": function, "outcome": outcome}, count))
+            family("monday_function_duration_seconds", "summary", "Duração das funções da biblioteca.", samples)
+
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str):
+        """
+        Grava as métricas em `path` no formato do Prometheus. A escrita é feita
+        em um arquivo temporário renomeado ao final, como exige o textfile collector.
+        """
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+
+class OpenTelemetryHook:
+    """Hook que exporta cada tentativa de chamada como um span do OpenTelemetry.
+
+    Requer o pacote `opentelemetry-api` (e um SDK/exportador configurado pela
+    aplicação). Os atributos do span seguem os campos de `CallMetrics`.
+
+    Exemplo de Uso:
+        client = MondayClient(hooks=[OpenTelemetryHook()])
+    """
+    def __init__(self, tracer=None):
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError("OpenTelemetryHook requer o pacote 'opentelemetry-api'.") from e
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("monday_lib")
+
+    def __call__(self, metrics: CallMetrics):
+        start_ns = int(metrics.started_at * 1e9)
+        attributes = {
+            f"monday.{key}": value
+            for key, value in metrics.as_dict().items()
+            if key not in ("started_at", "extra") and value is not None
+        }
+        span = self.tracer.start_span(f"monday {metrics.operation}", start_time=start_ns, attributes=attributes)
+        if metrics.error:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, metrics.error))
+        span.end(end_time=start_ns + int(metrics.total_time * 1e9))
+
+
+def emit(hooks: list, metrics: CallMetrics):
+    """
+    Entrega as métricas a cada hook (e ao `observer` do contexto, se houver);
+    uma falha em um hook não interrompe a chamada.
+    """
+    observer = current_context().get("observer")
+    for hook in (*hooks, observer) if observer is not None else hooks:
+        try:
+            hook(metrics)
+        except Exception as e:
+            logging.warning(f"Falha no hook de métricas {hook!r}: {e}")
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# --- Medição do tempo de conexão (requests/urllib3) ---
+
+_connect_timer = threading.local()
+
+def reset_connect_time():
+    """Zera o tempo de conexão medido na thread atual."""
+    _connect_timer.seconds = 0.0
+
+def last_connect_time() -> float:
+    """Tempo (s) gasto abrindo conexões na thread atual desde o último `reset_connect_time`."""
+    return getattr(_connect_timer, "seconds", 0.0)
+
+class _TimedConnectionMixin:
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            _connect_timer.seconds = last_connect_time() + time.perf_counter() - start
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """`HTTPAdapter` cujas conexões medem o tempo de abertura (TCP+TLS)."""
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class HttpxTrace:
+    """
+    Callback do `extensions={"trace": ...}` do httpx: marca o instante de cada
+    evento do httpcore para separar o tempo de conexão do tempo de servidor.
+    """
+    def __init__(self):
+        self.marks = {}
+
+    async def __call__(self, event_name: str, info: dict):
+        self.marks[event_name] = time.perf_counter()
+
+    def _span(self, start_suffix: str, end_suffixes: tuple) -> float:
+        start = next((t for name, t in self.marks.items() if name.endswith(start_suffix)), None)
+        ends = [t for name, t in self.marks.items() if name.endswith(end_suffixes)]
+        if start is None or not ends:
+            return 0.0
+        return max(max(ends) - start, 0.0)
+
+    @property
+    def connect_time(self) -> float:
+        return self._span("connect_tcp.started", ("connect_tcp.complete", "start_tls.complete"))
+
+    @property
+    def server_time(self) -> float:
+        return self._span("send_request_body.complete", ("receive_response_headers.complete",))
+
+
+_default_registry: MetricsRegistry | None = None
+_default_registry_lock = threading.Lock()
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Retorna o registro de métricas compartilhado por todos os clientes do processo."""
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = MetricsRegistry()
+    return _default_registry
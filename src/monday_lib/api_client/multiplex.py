@@ -0,0 +1,122 @@
+"""
+Combinação de várias queries GraphQL em um único documento (e a separação da
+resposta de volta por query). Funções puras, sem cliente HTTP: usadas pelo
+`QueryBatcher` / `AsyncQueryBatcher` e pela busca de subitens em lotes.
+"""
+import re
+
+_IDENTIFIER = re.compile(r"[_A-Za-z]\w*")
+_VARIABLE = re.compile(r"\$([_A-Za-z]\w*)")
+_ROOT_FIELD = re.compile(r"(?:(?P<alias>[_A-Za-z]\w*)\s*:\s*)?(?P<name>[_A-Za-z]\w*)")
+
+
+def _split_definitions(document: str) -> list[str]:
+    """Separa um documento GraphQL em definições de nível superior (operações e fragmentos)."""
+    definitions, depth, start = [], 0, 0
+    for i, char in enumerate(document):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                definitions.append(document[start:i + 1].strip())
+                start = i + 1
+    return definitions
+
+def _split_top_level(text: str, separator: str = ",") -> list[str]:
+    """Divide `text` pelo separador, ignorando os que estão dentro de (), [] ou {}."""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(text):
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+def _parse_operation(operation: str) -> tuple[list[str], str]:
+    """
+    Retorna as definições de variáveis e o corpo (conteúdo entre as chaves
+    externas) de uma operação `query`.
+    """
+    body_start = operation.index("{")
+    header = operation[:body_start]
+    variable_defs = []
+    if "(" in header:
+        variable_defs = _split_top_level(header[header.index("(") + 1:header.rindex(")")])
+    return variable_defs, operation[body_start + 1:operation.rindex("}")]
+
+def _prefix_root_fields(body: str, prefix: str) -> str:
+    """
+    Adiciona um alias com `prefix` a cada campo raiz do corpo da operação:
+    `boards(...)` vira `{prefix}boards: boards(...)` e `main: boards(...)`
+    vira `{prefix}main: boards(...)`.
+    """
+    result, depth, i = [], 0, 0
+    while i < len(body):
+        char = body[i]
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif depth == 0 and body.startswith("...", i):
+            raise ValueError("Fragmentos na raiz da operação não podem ser agrupados.")
+        elif depth == 0 and char == "@":
+            # Diretiva (@include, @skip...): copia o nome sem alterar
+            directive = _IDENTIFIER.match(body, i + 1).group(0)
+            result.append(f"@{directive}")
+            i += len(directive) + 1
+            continue
+        elif depth == 0 and (field := _ROOT_FIELD.match(body, i)):
+            alias, name = field.group("alias"), field.group("name")
+            result.append(f"{prefix}{alias or name}: {name}")
+            i = field.end()
+            continue
+        result.append(char)
+        i += 1
+    return "".join(result)
+
+def merge_queries(entries: list[tuple[str, dict]]) -> tuple[str, dict]:
+    """
+    Reescreve várias queries em um único documento GraphQL.
+
+    Cada query `i` tem as variáveis renomeadas para `$q{i}_nome` e os campos
+    raiz recebem o alias `q{i}__campo`. Fragmentos com o mesmo nome são
+    incluídos uma única vez.
+
+    :param entries: Lista de tuplas (query, variables).
+    :return: Tupla (query combinada, variáveis combinadas).
+    """
+    variable_defs, bodies, variables, fragments = [], [], {}, {}
+    for i, (query, query_vars) in enumerate(entries):
+        operation = None
+        for definition in _split_definitions(query):
+            if definition.startswith("fragment"):
+                fragment_name = definition.split()[1]
+                fragments.setdefault(fragment_name, definition)
+            else:
+                operation = definition
+
+        defs, body = _parse_operation(operation)
+        prefix = f"q{i}_"
+        variable_defs.extend(_VARIABLE.sub(rf"${prefix}\1", d) for d in defs)
+        bodies.append(_prefix_root_fields(_VARIABLE.sub(rf"${prefix}\1", body), f"q{i}__"))
+        variables.update({f"{prefix}{name}": value for name, value in (query_vars or {}).items()})
+
+    header = f"query multiplexed({', '.join(variable_defs)})" if variable_defs else "query multiplexed"
+    merged = f"{header} {{\n" + "\n".join(bodies) + "\n}"
+    if fragments:
+        merged += "\n" + "\n".join(fragments.values())
+    return merged, variables
+
+def split_response(data: dict, count: int) -> list[dict]:
+    """Separa a resposta de uma query combinada por `merge_queries` de volta por query."""
+    results = [{} for _ in range(count)]
+    for key, value in data.items():
+        index, _, original = key.partition("__")
+        if index.startswith("q") and index[1:].isdigit() and int(index[1:]) < count:
+            results[int(index[1:])][original] = value
+    return results
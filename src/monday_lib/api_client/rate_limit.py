@@ -0,0 +1,198 @@
+import re
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from ..infra.settings import get_settings
+
+# Estimativa de custo usada para uma operação que ainda não foi medida
+DEFAULT_COST_ESTIMATE = 10_000
+
+_OPERATION_NAME = re.compile(r"^\s*(query|mutation)\s+(\w+)")
+_COMPLEXITY_FIELD = "complexity { before after reset_in_x_seconds }"
+
+
+class ComplexityBudget:
+    """Agendador (token bucket) do orçamento de complexidade da API do Monday.
+
+    O Monday limita a soma da complexidade das queries por minuto. Esta classe
+    mantém uma estimativa local do orçamento restante, que é recarregada de forma
+    contínua e corrigida a cada resposta com os valores reais do bloco
+    `complexity { before after reset_in_x_seconds }`.
+
+    Antes de cada chamada o cliente reserva o custo estimado da operação
+    (média móvel dos custos medidos para a mesma query):
+      - se há orçamento, a chamada é admitida na hora;
+      - se não há, a chamada espera apenas o tempo necessário para a recarga.
+    Como cada chamada espera de acordo com o próprio custo, chamadas baratas
+    (ex: contagem de itens, busca de grupos) passam à frente de lotes caros que
+    estão aguardando orçamento.
+
+    Uma única instância é compartilhada por padrão entre todos os clientes do
+    processo (síncronos e assíncronos), de modo que importações e exportações
+    simultâneas disputam o mesmo orçamento.
+
+    Args:
+        capacity: Orçamento de complexidade por janela. Se omitido, usa
+            `MONDAY_COMPLEXITY_BUDGET` das configurações.
+        window: Duração da janela de recarga em segundos (padrão: 60).
+    """
+    def __init__(self, capacity: int = None, window: float = 60.0):
+        self.capacity = capacity or get_settings().MONDAY_COMPLEXITY_BUDGET
+        self.window = window
+        self.tokens = float(self.capacity)
+        self.reset_at = None
+        self._blocked_until = 0.0
+        self._in_flight = 0.0
+        self._estimates = {}
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Pontos de complexidade recarregados por segundo."""
+        return self.capacity / self.window
+
+    def _refill(self, now: float):
+        if self.reset_at is not None and now >= self.reset_at:
+            # A janela do servidor virou: orçamento cheio novamente
+            self.tokens = float(self.capacity) - self._in_flight
+            self.reset_at = None
+        else:
+            self.tokens = min(float(self.capacity), self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def estimate(self, key: str) -> float:
+        """Custo estimado para a operação `key` (média móvel dos custos medidos)."""
+        with self._lock:
+            return self._estimates.get(key, DEFAULT_COST_ESTIMATE)
+
+    def reserve(self, cost: float) -> float:
+        """
+        Tenta reservar `cost` pontos do orçamento.
+        Retorna 0 se a reserva foi feita, ou quantos segundos esperar antes de tentar de novo.
+        """
+        cost = min(cost, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            self._refill(now)
+            if self.tokens >= cost:
+                self.tokens -= cost
+                self._in_flight += cost
+                return 0.0
+
+            wait = (cost - self.tokens) / self.rate
+            if self.reset_at is not None:
+                wait = min(wait, self.reset_at - now)
+            return max(wait, 0.05)
+
+    def acquire(self, cost: float):
+        """Bloqueia a thread atual até que `cost` pontos possam ser reservados."""
+        while (wait := self.reserve(cost)) > 0:
+            logging.info(f"Orçamento de complexidade insuficiente. Aguardando {wait:.2f}s...")
+            time.sleep(wait)
+
+    async def aacquire(self, cost: float):
+        """Versão assíncrona de `acquire`: aguarda sem bloquear o event loop."""
+        while (wait := self.reserve(cost)) > 0:
+            logging.info(f"Orçamento de complexidade insuficiente. Aguardando {wait:.2f}s...")
+            await asyncio.sleep(wait)
+
+    def exhaust(self, retry_in: float = None):
+        """
+        Marca o orçamento como esgotado (a API recusou uma chamada por limite de
+        taxa). Nenhuma nova chamada é admitida antes de `retry_in` segundos.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = now + (retry_in if retry_in is not None else self.window)
+            self.reset_at = self._blocked_until
+            self.tokens = 0.0
+            self._last_refill = now
+
+    def settle(self, key: str, reserved: float, complexity: dict = None):
+        """
+        Fecha uma reserva. Com o bloco `complexity` da resposta, corrige o saldo
+        local com o saldo real do servidor e atualiza a estimativa de custo da
+        operação. Sem ele (ex: a chamada falhou), apenas devolve a reserva.
+        """
+        reserved = min(reserved, self.capacity)
+        with self._lock:
+            self._in_flight = max(self._in_flight - reserved, 0.0)
+            now = time.monotonic()
+            self._refill(now)
+
+            if not complexity:
+                self.tokens = min(float(self.capacity), self.tokens + reserved)
+                return
+
+            before, after = complexity.get("before"), complexity.get("after")
+            reset_in = complexity.get("reset_in_x_seconds")
+            if before is not None and after is not None:
+                self.capacity = max(self.capacity, before)
+                # O saldo do servidor é a verdade; descontamos o que ainda está em andamento
+                self.tokens = max(float(after) - self._in_flight, 0.0)
+                cost = max(before - after, 0)
+                previous = self._estimates.get(key)
+                self._estimates[key] = cost if previous is None else 0.7 * previous + 0.3 * cost
+            if reset_in is not None:
+                self.reset_at = now + float(reset_in)
+
+
+def operation_key(query: str) -> str:
+    """Identifica a operação: nome da operação GraphQL, ou hash da query se anônima."""
+    match = _OPERATION_NAME.match(query)
+    if match:
+        return match.group(2)
+    return hashlib.sha1(query.encode("utf-8")).hexdigest()[:12]
+
+def is_mutation(query: str) -> bool:
+    """Indica se o documento GraphQL é uma mutation."""
+    return re.match(r"^\s*mutation\b", query) is not None
+
+def inject_complexity(query: str) -> str:
+    """
+    Adiciona o campo `complexity { before after reset_in_x_seconds }` à seleção
+    raiz da operação (query ou mutation), ignorando definições de fragmentos.
+    """
+    if re.search(r"\bcomplexity\s*{", query):
+        return query
+
+    depth = 0
+    paren = 0
+    definition_start = 0
+    in_string = False
+    for i, char in enumerate(query):
+        if char == '"':
+            in_string = not in_string
+        if in_string:
+            continue
+        if char == "(":
+            paren += 1
+        elif char == ")":
+            paren -= 1
+        elif char == "{" and paren == 0:
+            if depth == 0 and not query[definition_start:i].lstrip().startswith("fragment"):
+                return f"{query[:i + 1]}\n  {_COMPLEXITY_FIELD}{query[i + 1:]}"
+            depth += 1
+        elif char == "}" and paren == 0:
+            depth -= 1
+            if depth == 0:
+                definition_start = i + 1
+    return query
+
+
+_default_budget: ComplexityBudget | None = None
+_default_budget_lock = threading.Lock()
+
+def get_complexity_budget() -> ComplexityBudget:
+    """Retorna o orçamento de complexidade compartilhado por todos os clientes do processo."""
+    global _default_budget
+    if _default_budget is None:
+        with _default_budget_lock:
+            if _default_budget is None:
+                _default_budget = ComplexityBudget()
+    return _default_budget
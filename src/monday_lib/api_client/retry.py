@@ -0,0 +1,105 @@
+import random
+import time
+from .exceptions import APIError, APITimeoutError, APIServerError, APIConnectionError, APIRateLimitError
+
+
+class Deadline:
+    """
+    Prazo total de uma operação lógica (ex: todas as páginas de uma exportação),
+    compartilhado entre todas as chamadas e retentativas que a compõem.
+
+    Args:
+        seconds: Tempo total disponível, em segundos. None = sem prazo.
+    """
+    def __init__(self, seconds: float = None):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds if seconds is not None else None
+
+    def remaining(self) -> float:
+        """Segundos restantes até o prazo (infinito se não houver prazo)."""
+        if self.expires_at is None:
+            return float("inf")
+        return self.expires_at - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+class RetryPolicy:
+    """Política de retentativas com backoff exponencial e jitter.
+
+    Cada classe de erro tem o seu próprio limite de retentativas (`rules`). A
+    espera entre as tentativas segue um backoff exponencial com "full jitter"
+    (valor aleatório entre 0 e `base_delay * 2^tentativa`, limitado a
+    `max_delay`). Quando a API informa quanto tempo aguardar (cabeçalho
+    `Retry-After` ou `retry_in_seconds` nos erros de limite de taxa), esse
+    valor é a espera mínima, mesmo acima de `max_delay`: só o prazo total
+    (`deadline`) a limita, e se ele não comportar a espera a chamada falha.
+
+    Mutations não são idempotentes: um 504 ou uma conexão perdida podem ter
+    criado os itens mesmo assim. Por isso, para mutations só são repetidos os
+    erros em que a API garante que a chamada não foi executada (`mutation_safe`).
+
+    Args:
+        rules: Dicionário {classe de erro: número máximo de retentativas}.
+            A classe mais específica encontrada na hierarquia do erro é usada.
+        base_delay: Espera base (s) do backoff exponencial.
+        max_delay: Espera máxima (s) do backoff exponencial (não limita o `Retry-After`).
+        deadline: Prazo total padrão (s) de uma operação lógica. None = sem prazo.
+        mutation_safe: Classes de erro que podem ser repetidas em mutations.
+
+    Exemplo de Uso:
+        policy = RetryPolicy(rules={APITimeoutError: 5, APIServerError: 2}, deadline=1800)
+        client = MondayClient(retry_policy=policy)
+    """
+    DEFAULT_RULES = {
+        APIRateLimitError: 8,
+        APITimeoutError: 4,
+        APIServerError: 4,
+        APIConnectionError: 4,
+    }
+
+    def __init__(self,
+                 rules: dict = None,
+                 base_delay: float = 1.0,
+                 max_delay: float = 60.0,
+                 deadline: float = None,
+                 mutation_safe: tuple = (APIRateLimitError,)):
+        self.rules = dict(self.DEFAULT_RULES if rules is None else rules)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.mutation_safe = mutation_safe
+
+    def max_retries_for(self, error: Exception) -> int:
+        """Número máximo de retentativas para o tipo de erro (0 se não for repetível)."""
+        for cls in type(error).__mro__:
+            if cls in self.rules:
+                return self.rules[cls]
+        return 0
+
+    def backoff(self, attempt: int, error: Exception = None) -> float:
+        """Tempo de espera antes da tentativa `attempt` + 1."""
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            # Espera mínima pedida pela API (o teto é o Deadline, em `next_delay`), com um
+            # pequeno jitter para que vários clientes não voltem todos no mesmo instante
+            return retry_after + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def next_delay(self, error: Exception, attempt: int, deadline: Deadline, is_mutation: bool = False) -> float | None:
+        """
+        Decide se a chamada que falhou com `error` na tentativa `attempt` (1, 2, ...)
+        deve ser repetida. Retorna o tempo de espera, ou None se não deve.
+        """
+        if not isinstance(error, APIError):
+            return None
+        if is_mutation and not isinstance(error, self.mutation_safe):
+            return None
+        if attempt > self.max_retries_for(error):
+            return None
+
+        delay = self.backoff(attempt - 1, error)
+        if delay >= deadline.remaining():
+            return None
+        return delay
@@ -0,0 +1,213 @@
+import time
+import logging
+import requests
+from . import json_backend
+from .exceptions import APIError, APITimeoutError, APIConnectionError, APIRateLimitError
+from .rate_limit import inject_complexity, operation_key, is_mutation
+from .retry import Deadline
+from .metrics import new_call_metrics, reset_connect_time, last_connect_time
+
+# Caminho (prefixo ijson) da página de itens na resposta de `items_page`
+ITEMS_PAGE_PREFIX = "data.boards.item.items_page"
+# O mesmo, para o `items_page` de um grupo (`boards { groups(ids:) { items_page } }`)
+GROUP_ITEMS_PAGE_PREFIX = "data.boards.item.groups.item.items_page"
+# O mesmo, para as páginas seguintes buscadas pela raiz `next_items_page(cursor:)`
+NEXT_ITEMS_PAGE_PREFIX = "data.next_items_page"
+
+
+class ItemsPageStream:
+    """Página de itens decodificada de forma incremental (streaming).
+
+    Em vez de carregar o corpo inteiro da resposta e convertê-lo em um
+    dicionário, o JSON é lido do socket aos poucos (ijson) e cada item de
+    `items_page.items` é entregue assim que termina de ser lido. Assim, o
+    texto bruto e o dicionário completo da página nunca ficam na memória ao
+    mesmo tempo.
+
+    Depois de percorrer todos os itens, `cursor` contém o cursor da próxima
+    página (ou None). Se o ijson não estiver instalado, a página é
+    decodificada de uma vez (com orjson, se disponível) e os itens são
+    entregues da mesma forma.
+
+    Erros antes do primeiro item seguem a `retry_policy` do cliente. Um erro no
+    meio da página (ex: conexão interrompida) não é repetido, pois parte dos
+    itens já foi entregue: levanta `APIError` e a página deve ser buscada de
+    novo pelo chamador.
+
+    Não é criada diretamente; use `MondayClient.stream_items_page`.
+
+    Exemplo de Uso:
+        pagina = client.stream_items_page(QUERY_PAGINATED_REQUEST, {"boardId": 123})
+        for item in pagina:
+            processar(item)
+        proximo_cursor = pagina.cursor
+    """
+    def __init__(self, client, query: str, variables: dict, deadline: Deadline = None, page_prefix: str = ITEMS_PAGE_PREFIX):
+        self.client = client
+        self.query = query
+        self.variables = variables
+        self.deadline = deadline
+        self.page_prefix = page_prefix
+        self.cursor = None
+        self.item_count = 0
+        self._consumed = False
+
+    def __iter__(self):
+        if self._consumed:
+            raise RuntimeError("A página já foi percorrida; faça uma nova chamada para relê-la.")
+        self._consumed = True
+
+        deadline = self.deadline or Deadline(self.client.retry_policy.deadline)
+        mutation = is_mutation(self.query)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                yield from self._read(attempt)
+                return
+            except APIError as e:
+                delay = None if self.item_count else self.client.retry_policy.next_delay(e, attempt, deadline, mutation)
+                if delay is None:
+                    logging.error(f"Falha na leitura da página após {attempt} tentativa(s). Detalhes salvos em 'logs/api_errors.log'")
+                    raise
+                logging.warning(f"{type(e).__name__} na tentativa {attempt}. Nova tentativa em {delay:.2f}s...")
+                time.sleep(delay)
+
+    def _read(self, attempt: int):
+        """Uma tentativa: envia a query e entrega os itens conforme o corpo chega."""
+        # Importado aqui para evitar importação circular (client importa este módulo)
+        from .client import _check_response, _graphql_error, _parse_retry_after, _log_api_failure, _finish_metrics
+
+        client = self.client
+        key = operation_key(self.query)
+        reserved = client.budget.estimate(key)
+        client.budget.acquire(reserved)
+
+        complexity = None
+        response = None
+        payload = json_backend.dumps({"query": inject_complexity(self.query), "variables": self.variables})
+        metrics = new_call_metrics(key, attempt, len(payload))
+        start = time.perf_counter()
+        reset_connect_time()
+        try:
+            try:
+                response = client.session.post(url=client.api_url, data=payload, timeout=client.timeout, stream=True)
+            except requests.exceptions.ConnectTimeout as e:
+                raise APIConnectionError(f"Tempo de conexão excedido ({client.timeout[0]}s) com {client.api_url}") from e
+            except requests.exceptions.Timeout as e:
+                raise APITimeoutError(f"Tempo de resposta excedido ({client.timeout[1]}s) na chamada para {client.api_url}") from e
+            except requests.exceptions.ConnectionError as e:
+                raise APIConnectionError(f"Falha de conexão com {client.api_url}: {e}") from e
+
+            retry_after = response.headers.get("Retry-After")
+            if response.status_code >= 400:
+                # Respostas de erro são pequenas: decodifica tudo e usa a validação padrão
+                try:
+                    result = json_backend.loads(response.content)
+                except ValueError:
+                    result = None
+                _check_response(response.status_code, retry_after, result, client.api_url)
+
+            captured = {}
+            try:
+                for item in self._iter_events(response, captured):
+                    self.item_count += 1
+                    yield item
+            except (requests.exceptions.RequestException, *json_backend.DECODE_ERRORS) as e:
+                raise APIConnectionError(f"Resposta interrompida ou inválida após {self.item_count} item(ns): {e}") from e
+
+            result = {key: captured[key] for key in ("errors", "error_code", "error_message") if key in captured}
+            # Mesma classificação da leitura normal (limite de taxa, cursor expirado, erro de GraphQL)
+            error = _graphql_error(result, _parse_retry_after(retry_after)) if result else None
+            if error is not None:
+                raise error
+            if not captured.get("data"):
+                raise APIError("Resposta inesperada da API: campo 'data' ausente.")
+
+            complexity = captured.get("data.complexity")
+            logging.info(f"Status: {response.status_code}. Página lida em streaming ({self.item_count} itens). Tempo: {response.elapsed}")
+
+        except APIRateLimitError as e:
+            client.budget.exhaust(e.retry_after)
+            metrics.error = f"{type(e).__name__}: {e}"
+            _log_api_failure(e, response, attempt)
+            raise
+
+        except APIError as e:
+            metrics.error = f"{type(e).__name__}: {e}"
+            _log_api_failure(e, response, attempt)
+            raise
+
+        except Exception as e:
+            metrics.error = f"{type(e).__name__}: {e}"
+            _log_api_failure(e, response, attempt)
+            raise APIError(f"Erro inesperado na chamada da API: {e}") from e
+
+        finally:
+            if response is not None:
+                response.close()
+            client.budget.settle(key, reserved, complexity)
+            # Em streaming, download e decodificação acontecem juntos: ficam em transfer_time
+            server_time = response.elapsed.total_seconds() - last_connect_time() if response is not None else 0.0
+            _finish_metrics(client.hooks, metrics, start, response, complexity, last_connect_time(), server_time)
+
+    def _iter_events(self, response, captured: dict):
+        """
+        Entrega os itens da página e guarda em `captured` o cursor, o bloco
+        `complexity` e eventuais erros da resposta.
+        """
+        item_prefix = f"{self.page_prefix}.items.item"
+        cursor_prefix = f"{self.page_prefix}.cursor"
+
+        if not json_backend.streaming_available():
+            result = json_backend.loads(response.content)
+            if not isinstance(result, dict):
+                raise ValueError("corpo da resposta não é um objeto JSON")
+            captured.update({key: result[key] for key in ("errors", "error_code", "error_message") if key in result})
+            data = result.get("data") or {}
+            captured["data"] = bool(data)
+            captured["data.complexity"] = data.get("complexity")
+            page = _follow(data, self.page_prefix.split(".")[1:]) or {}
+            self.cursor = page.get("cursor")
+            yield from page.get("items") or []
+            return
+
+        ijson = json_backend.ijson
+        response.raw.decode_content = True
+        capture_prefixes = ("errors", "error_code", "error_message", "data.complexity")
+        builder = None
+        builder_prefix = None
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == builder_prefix and event in ("end_map", "end_array"):
+                    if builder_prefix == item_prefix:
+                        yield builder.value
+                    else:
+                        captured[builder_prefix] = builder.value
+                    builder = None
+                continue
+
+            if prefix == "data" and event in ("start_map", "null"):
+                captured["data"] = event == "start_map"
+            elif prefix == cursor_prefix:
+                self.cursor = value
+            elif prefix == item_prefix or prefix in capture_prefixes:
+                if event in ("start_map", "start_array"):
+                    builder = ijson.ObjectBuilder()
+                    builder_prefix = prefix
+                    builder.event(event, value)
+                else:
+                    captured[prefix] = value
+
+
+def _follow(data, path: list[str]):
+    """Percorre `data` seguindo um caminho no formato de prefixo do ijson ('item' = primeiro elemento)."""
+    for part in path:
+        if part == "item":
+            data = data[0] if isinstance(data, list) and data else None
+        else:
+            data = data.get(part) if isinstance(data, dict) else None
+        if data is None:
+            return None
+    return data
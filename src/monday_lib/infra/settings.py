@@ -21,6 +21,18 @@ class Settings(BaseSettings):
     MONDAY_API_URL: HttpUrl = "https://api.monday.com/v2"
     PEM_PATH: Optional[FilePath] = None
 
+    # --- Conexão HTTP (opcionais, com valores padrão) ---
+    HTTP_POOL_SIZE: int = 10
+    HTTP_CONNECT_TIMEOUT: float = 10.0
+    HTTP_READ_TIMEOUT: float = 120.0
+    HTTP_MAX_CONCURRENCY: int = 10
+
+    # --- Orçamento de complexidade da API (pontos por minuto) ---
+    MONDAY_COMPLEXITY_BUDGET: int = 10_000_000
+
+    # --- Exportação: itens por página do items_page (máximo da API: 500) ---
+    ITEMS_PAGE_SIZE: int = 100
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra='ignore')
 
     @property
@@ -50,14 +62,17 @@ def load_settings(env_path: str):
     Esta função DEVE ser chamada pelo usuário no início de seu script.
     """
     global _settings_instance
+    # A configuração do console fica aqui (e não na importação do pacote)
+    from ..utils.logger import configure_logging
+    configure_logging()
+
     if _settings_instance is not None:
         logging.warning("As configurações já foram carregadas. Ignorando chamada duplicada.")
         return
 
     try:
         # Pydantic carrega e valida as configurações do arquivo .env especificado
-        config = SettingsConfigDict(env_file=env_path, env_file_encoding="utf-8", extra='ignore')
-        _settings_instance = Settings.model_validate({}, _env_file=env_path)
+        _settings_instance = Settings(_env_file=env_path)
 
         # Garante que os diretórios existam após o carregamento
         _settings_instance.LOGS_PATH.mkdir(parents=True, exist_ok=True)
@@ -1,6 +1,16 @@
-from .service.data_export_monday import extrair_dados_paginados
-from .utils.handler import filtrar_itens_grupo, list2dfs
+from .service.data_export_monday import (iter_items_paginados, extrair_dados_por_janelas, aextrair_dados_paginados,
+                                         aextrair_dados_por_janelas)
+from .service.delta_export_monday import extrair_dados_incrementais
+from .service.page_archive_monday import PageArchive, iter_paginas_arquivadas
+from .utils.flatten import ItemFlattener
+from .utils.writers import ItemTablesWriter, TableWriter, writer_class
+from .service.board_setup_monday import get_board_setup
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 import pandas as pd
+import asyncio
+import logging
+import time
 import os
 
 def extrair_dados_monday(   
@@ -10,16 +20,28 @@ def extrair_dados_monday(
         caminho_arquivos: str,
         data_inicio: str = None,
         data_fim: str = None,
-        filtrar_grupo: str = None,
-        filtrar_por_data: bool = True
+        filtrar_grupo: str | list[str] = None,
+        filtrar_por_data: bool = True,
+        janela_dias: int = None,
+        incremental: bool = False,
+        colunas: list[str] = None,
+        tamanho_pagina: int | str = None,
+        subitens: str = "inline",
+        job_id: str = None,
+        tipado: bool = False,
+        formato: str | type[TableWriter] = "xlsx",
+        retornar_dataframes: bool = True,
+        arquivar_em: str = None,
+        formato_arquivo: str = "jsonl"
         ) -> tuple[pd.DataFrame | pd.DataFrame | str | str]:
     """Extrai, processa e salva itens e subitens de um quadro do Monday.com.
 
 Esta função orquestra o processo completo de extração de dados. Ela se conecta
 a um quadro específico do Monday, busca os itens (e seus respectivos subitens)
 com base em filtros de data e/ou grupo, processa esses dados e os salva
-localmente em dois arquivos .xlsx separados (um para itens principais e outro
-para subitens).
+localmente em dois arquivos separados (um para itens principais e outro
+para subitens), em .xlsx ou no `formato` escolhido. Os arquivos são gravados
+página a página, conforme os itens chegam da API.
 
 Args:
     nome_subsetor (str): Nome do subsetor, usado tanto para organizar o arquivo
@@ -33,17 +55,57 @@ Args:
         Se não fornecida, o padrão é o primeiro dia do mês anterior.
     data_fim (str, optional): Data de fim do filtro ("AAAA-MM-DD").
         Se não fornecida, o padrão é o último dia do mês anterior.
-    filtrar_grupo (str, optional): Nome exato de um grupo para filtrar os resultados.
-        Se não fornecido, a busca será feita em todos os grupos do quadro.
+    filtrar_grupo (str | list[str], optional): Nome exato de um grupo (ou lista de
+        grupos) para filtrar os resultados. O filtro é feito na API: só os itens
+        desses grupos são paginados. Se não fornecido, a busca será feita em todos
+        os grupos do quadro.
     filtrar_por_data (bool, optional): Se True (padrão), aplica o filtro de data.
         Se False, busca todos os itens do quadro, ignorando as datas.
+    janela_dias (int, optional): Com o filtro de data, divide o período em
+        janelas de N dias buscadas em paralelo (`extrair_dados_por_janelas`).
+        Recomendado para períodos longos (ex: um ano inteiro com janela_dias=7).
+    incremental (bool, optional): Se True, busca apenas os itens alterados desde
+        a última execução e os mescla com o resultado salvo anteriormente
+        (`extrair_dados_incrementais`).
+    colunas (list[str], optional): Títulos das colunas dos itens a extrair
+        (ex: ["Status", "Horas"]). Só essas colunas são pedidas à API e aparecem
+        no DataFrame de elementos. Se não fornecido, traz todas as colunas.
+    tamanho_pagina (int | str, optional): Itens por página pedidos à API (1 a 500),
+        ou "auto" para ajustar o tamanho conforme a latência, o custo e os 504 de
+        cada página. Se não fornecido, usa `ITEMS_PAGE_SIZE` das configurações.
+    subitens (str, optional): "inline" (padrão) traz os subitens em cada página;
+        "none" não busca subitens (o DataFrame de subelementos fica vazio);
+        "deferred" busca os subitens depois, em lotes de até 100 itens.
+    job_id (str, optional): Identificador para retomar a extração após uma falha
+        (checkpoint em disco; ver `extrair_dados_paginados`). Vale para a busca
+        paginada (sem `janela_dias` e sem `incremental`).
+    tipado (bool, optional): Se True, as colunas dos DataFrames são convertidas
+        pelo tipo da coluna no Monday: datas em datetime64 com fuso UTC (no .xlsx,
+        em UTC sem o fuso), números em float64 (rating em Int64), status e grupo em
+        category e checkbox em bool. O `value` bruto de cada coluna também é pedido
+        à API, e datas, números e checkbox são lidos dele. Se False (padrão),
+        todos os valores ficam como o texto exibido no Monday.
+    formato (str, optional): Formato dos arquivos: "xlsx" (padrão), "parquet",
+        "feather", "arrow", "csv" ou "jsonl" (JSON Lines com gzip). Parquet,
+        Feather e Arrow requerem o pacote `pyarrow`. Também aceita uma
+        subclasse de `TableWriter` (ver `utils/writers.py`).
+    retornar_dataframes (bool, optional): Se True (padrão), devolve os DataFrames
+        completos. Com False, cada página sai da memória depois de gravada e os
+        DataFrames do retorno ficam None (recomendado para quadros grandes: a
+        memória fica limitada ao tamanho da página, inclusive no .xlsx).
+    arquivar_em (str, optional): Pasta onde as páginas brutas da API são
+        arquivadas (`PageArchive`), para reprocessá-las depois sem chamar a API
+        (`reprocessar_dados_monday`). Só na extração paginada (sem `incremental`
+        e sem `janela_dias`).
+    formato_arquivo (str, optional): Formato do arquivo de páginas: "jsonl"
+        (padrão, JSON Lines com gzip) ou "arrow" (Arrow IPC, requer `pyarrow`).
 
 Returns:
     tuple[pd.DataFrame, str, pd.DataFrame, str]: Uma tupla contendo quatro elementos:
     - pd.DataFrame: Um DataFrame com os dados dos itens principais (elementos).
-    - str: O caminho completo para o arquivo Excel dos elementos salvo.
+    - str: O caminho completo para o arquivo dos elementos salvo.
     - pd.DataFrame: Um DataFrame com os dados de todos os subitens encontrados.
-    - str: O caminho completo para o arquivo Excel dos subitens salvo.
+    - str: O caminho completo para o arquivo dos subitens salvo.
 
 Exemplo de Uso:
     
@@ -77,26 +139,272 @@ Nota sobre o Ambiente:
     $ pip install -e .
 """
     
-    # 1 Requisição API para o Monday, puxando os itens do quadro, e filtrando os elementos por data de inicio e fim.
-    dados = extrair_dados_paginados(board_id=id_board, column_name=nome_coluna_data, subsetor=nome_subsetor, init_date=data_inicio, end_date=data_fim, filtrar_por_data=filtrar_por_data)
+    # 1 Requisição API para o Monday, puxando os itens do quadro, e filtrando os elementos por data de inicio e fim
+    #   e pelo grupo (o filtro de grupo é feito na API, paginando só o items_page do grupo).
+    #   Os itens chegam página a página (gerador): o quadro inteiro não fica duplicado na memória.
+    writer_class(formato)  # valida o formato antes de qualquer chamada à API
+    if arquivar_em is not None and (incremental or (janela_dias and filtrar_por_data)):
+        raise ValueError("arquivar_em só é suportado na extração paginada (sem incremental e sem janela_dias).")
+    # Mapa de colunas (itens e subitens) e grupos em uma única chamada: a extração reaproveita os dois
+    mapper = get_board_setup(id_board, nome_subsetor, filtrar_grupo).mapper
+    if incremental:
+        paginas = [extrair_dados_incrementais(board_id=id_board, subsetor=nome_subsetor, column_name=nome_coluna_data, init_date=data_inicio, end_date=data_fim, filtrar_por_data=filtrar_por_data, colunas=colunas, grupos=filtrar_grupo, tamanho_pagina=tamanho_pagina, subitens=subitens, valores_brutos=tipado)]
+    elif janela_dias and filtrar_por_data:
+        paginas = [extrair_dados_por_janelas(board_id=id_board, subsetor=nome_subsetor, column_name=nome_coluna_data, init_date=data_inicio, end_date=data_fim, janela_dias=janela_dias, colunas=colunas, grupos=filtrar_grupo, tamanho_pagina=tamanho_pagina, subitens=subitens, valores_brutos=tipado)]
+    else:
+        paginas = iter_items_paginados(board_id=id_board, column_name=nome_coluna_data, subsetor=nome_subsetor, init_date=data_inicio, end_date=data_fim, filtrar_por_data=filtrar_por_data, colunas=colunas, grupos=filtrar_grupo, tamanho_pagina=tamanho_pagina, subitens=subitens, job_id=job_id, valores_brutos=tipado, por_pagina=True, arquivar_em=arquivar_em, formato_arquivo=formato_arquivo)
+
+    # 2 e 3: DataFrames e arquivos
+    return _salvar_dados(paginas, nome_subsetor, caminho_arquivos, mapper.coluna_map, mapper.subitem_map, tipado,
+                         formato, retornar_dataframes, colunas)[:4]
+
+def reprocessar_dados_monday(
+        caminho_arquivo: str,
+        caminho_arquivos: str,
+        filtrar_grupo: str = None,
+        tipado: bool = False,
+        formato: str | type[TableWriter] = "xlsx",
+        retornar_dataframes: bool = True
+        ) -> tuple[pd.DataFrame | pd.DataFrame | str | str]:
+    """Refaz as tabelas e os arquivos de uma extração arquivada, sem chamar a API.
+
+As páginas gravadas com `extrair_dados_monday(arquivar_em=...)` (ou
+`extrair_dados_paginados(arquivar_em=...)`) passam pelo mesmo caminho de uma
+extração nova: filtro de grupo, `ItemFlattener` (com o esquema de colunas
+salvo no arquivo) e gravação página a página. Serve para aplicar uma mudança
+no achatamento, nos tipos ou nos filtros a dados que já foram baixados.
+
+Args:
+    caminho_arquivo (str): Pasta do arquivo de páginas (o `arquivar_em` da extração).
+    caminho_arquivos (str): Pasta de saída, como em `extrair_dados_monday`.
+    filtrar_grupo (str, optional): Mantém só os itens desse grupo (`filtrar_itens_grupo`).
+    tipado (bool, optional): Converte as colunas pelo tipo no Monday (ver
+        `extrair_dados_monday`). O `value` (e, com ele, a hora em UTC das colunas
+        de data) só está no arquivo se a extração foi feita com `tipado=True`;
+        sem ele, as colunas são convertidas a partir do texto (datas sem fuso).
+    formato (str, optional): Formato dos arquivos de saída (ver `extrair_dados_monday`).
+    retornar_dataframes (bool, optional): Ver `extrair_dados_monday`.
 
-    # 1.1 se necessário, filtrar os elementos por grupo.
-    itens = filtrar_itens_grupo(dados, filtrar_grupo) if filtrar_grupo else dados
+Returns:
+    tuple: Os mesmos quatro elementos de `extrair_dados_monday`.
+
+Exemplo de Uso:
+    extrair_dados_monday("CRI", "8585814551", "Prazo Inicial", "dados", arquivar_em="arquivo/CRI/2025-06")
+
+    # Depois de mudar o processamento, sem baixar o quadro de novo:
+    elementos_df, subelementos_df, arq_elem, arq_sub = reprocessar_dados_monday("arquivo/CRI/2025-06", "dados")
+"""
+    writer_class(formato)
+    manifest = PageArchive(caminho_arquivo).manifest
+    if manifest is None:
+        raise FileNotFoundError(f"Nenhum arquivo de páginas em '{caminho_arquivo}'.")
+    paginas = iter_paginas_arquivadas(caminho_arquivo, filtrar_grupo)
+    return _salvar_dados(paginas, manifest["subsetor"], caminho_arquivos, manifest["esquema"],
+                         manifest.get("esquema_subitens"), tipado, formato, retornar_dataframes,
+                         manifest["parametros"].get("colunas"))[:4]
 
-    # 2 Transforma a lista para Data Frames
-    elemento, subelemento = list2dfs(itens)
+def _salvar_dados(paginas, nome_subsetor: str, caminho_arquivos: str, esquema: dict, esquema_subitens: dict = None,
+                  tipado: bool = False, formato: str | type[TableWriter] = "xlsx", retornar_dataframes: bool = True,
+                  colunas: list[str] = None) -> tuple:
+    """
+    Transforma as páginas de itens em tabelas e grava os arquivos de elementos e subelementos,
+    página a página. Retorna (elementos, subelementos, arquivo_elementos, arquivo_subelementos,
+    total_elementos, total_subelementos); os DataFrames ficam None com `retornar_dataframes=False`.
+    `esquema` e `esquema_subitens` são os mapas de colunas dos itens e dos subitens
+    (`ColunaIDMapper.coluna_map` e `subitem_map`, já carregados pela extração).
+    Com `colunas` (a projeção da extração), só essas colunas do esquema vão para os arquivos.
+    """
+    # 2 Transforma os itens em tabelas (as colunas seguem a ordem do quadro, pelo mapa de colunas)
+    if colunas:
+        colunas = {colunas} if isinstance(colunas, str) else set(colunas)
+        esquema = {titulo: info for titulo, info in esquema.items() if titulo in colunas}
+    # Todas as colunas dos esquemas desde a primeira página: o cabeçalho dos arquivos é fixado por ela
+    flattener = ItemFlattener(esquema, tipado, acumular=retornar_dataframes, todas_colunas=True,
+                              esquema_subitens=esquema_subitens)
 
     pasta_subsetor = os.path.join(caminho_arquivos, nome_subsetor)
     os.makedirs(pasta_subsetor, exist_ok=True)
 
-    arquivo_elementos = os.path.join(caminho_arquivos, nome_subsetor,f"{nome_subsetor}_elementos.xlsx")
-    arquivo_subelementos = os.path.join(caminho_arquivos, nome_subsetor, f"{nome_subsetor}_subelementos.xlsx")
+    # 3 Cada página é gravada (elementos e subelementos ao mesmo tempo) enquanto a próxima é buscada
+    with ItemTablesWriter(formato,
+                          os.path.join(pasta_subsetor, f"{nome_subsetor}_elementos"),
+                          os.path.join(pasta_subsetor, f"{nome_subsetor}_subelementos")) as writer:
+        for pagina in paginas:
+            flattener.add_page(pagina)
+            writer.write(*flattener.take_frames())
+
+    # Pronto!
+    print(f"Arquivo Elementos salvo em: {writer.elementos.path}")
+    print(f"Arquivo Subelementos salvo em: {writer.subelementos.path}")
+
+    elemento, subelemento = flattener.to_frames() if retornar_dataframes else (None, None)
+    return (elemento, subelemento, writer.elementos.path, writer.subelementos.path,
+            writer.elementos.rows, writer.subelementos.rows)
+
+
+@dataclass
+class BoardSpec:
+    """
+    Um quadro a ser extraído por `extrair_dados_quadros`.
+
+    Os campos têm o mesmo nome e significado dos parâmetros de `extrair_dados_monday`.
+    """
+    nome_subsetor: str
+    id_board: str
+    nome_coluna_data: str
+    caminho_arquivos: str
+    data_inicio: str = None
+    data_fim: str = None
+    filtrar_grupo: str | list[str] = None
+    filtrar_por_data: bool = True
+    janela_dias: int = None
+    incremental: bool = False
+    colunas: list[str] = None
+    tamanho_pagina: int | str = None
+    subitens: str = "inline"
+    tipado: bool = False
+    formato: str = "xlsx"
+
+
+@dataclass
+class BoardResult:
+    """
+    Resultado da extração de um quadro em `extrair_dados_quadros`.
+
+    Os tempos estão em segundos: `tempo_extracao` (chamadas à API) e
+    `tempo_gravacao` (DataFrames e arquivos). Se a extração do quadro falhou,
+    `erro` tem a descrição do erro e os arquivos ficam None.
+    """
+    spec: BoardSpec
+    arquivo_elementos: str = None
+    arquivo_subelementos: str = None
+    total_elementos: int = 0
+    total_subelementos: int = 0
+    tempo_extracao: float = 0.0
+    tempo_gravacao: float = 0.0
+    erro: str = None
+    excecao: BaseException = field(default=None, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.erro is None
+
+    @property
+    def tempo_total(self) -> float:
+        return self.tempo_extracao + self.tempo_gravacao
+
+
+def extrair_dados_quadros(specs: list[BoardSpec | dict],
+                          max_quadros: int = 4,
+                          max_workers: int = None,
+                          executor: Executor = None) -> list[BoardResult]:
+    """Extrai vários quadros ao mesmo tempo, cada um como em `extrair_dados_monday`.
+
+    As extrações rodam em paralelo pelo cliente assíncrono compartilhado, então
+    todas disputam o mesmo limite de concorrência (`HTTP_MAX_CONCURRENCY`) e o
+    mesmo orçamento de complexidade da API. A transformação em DataFrames e a
+    gravação dos arquivos de cada quadro vão para um pool de workers, enquanto
+    os outros quadros continuam sendo baixados.
+
+    Uma falha em um quadro não interrompe os demais: o erro fica registrado no
+    `BoardResult` do quadro (e no log).
+
+    Args:
+        specs: Quadros a extrair (`BoardSpec` ou dicionários com os mesmos campos).
+        max_quadros: Quantos quadros são extraídos ao mesmo tempo.
+        max_workers: Tamanho do pool de gravação (padrão: `max_quadros`).
+        executor: Pool próprio para a gravação (ex: um `ProcessPoolExecutor`);
+            não é encerrado ao final.
+
+    Returns:
+        list[BoardResult]: Um resultado por quadro, na ordem de `specs`.
+
+    Não pode ser chamada de dentro de um event loop em execução; nesse caso
+    use `aextrair_dados_quadros`.
+
+    Exemplo de Uso:
+        resultados = extrair_dados_quadros([
+            BoardSpec("CRI", "8585814551", "Prazo Inicial", r"C:\dados"),
+            BoardSpec("ARQ", "9382984170", "Data de Entrega", r"C:\dados", filtrar_grupo="Feito"),
+        ])
+        for r in resultados:
+            print(r.spec.nome_subsetor, "ok" if r.ok else r.erro, f"{r.tempo_total:.1f}s")
+    """
+    # O loop é criado aqui, então o cliente assíncrono dele também é fechado aqui
+    from .api_client.async_client import run_closing_async_client
+    return run_closing_async_client(aextrair_dados_quadros(specs, max_quadros, max_workers, executor))
+
+async def aextrair_dados_quadros(specs: list[BoardSpec | dict],
+                                 max_quadros: int = 4,
+                                 max_workers: int = None,
+                                 executor: Executor = None) -> list[BoardResult]:
+    """Versão assíncrona de `extrair_dados_quadros`, com os mesmos parâmetros e retorno."""
+    specs = [spec if isinstance(spec, BoardSpec) else BoardSpec(**spec) for spec in specs]
+    semaforo = asyncio.Semaphore(max_quadros)
+    proprio = executor is None
+    executor = executor or ThreadPoolExecutor(max_workers=max_workers or max_quadros,
+                                              thread_name_prefix="monday_gravacao")
+    try:
+        resultados = await asyncio.gather(*(_aextrair_quadro(spec, semaforo, executor) for spec in specs))
+    finally:
+        if proprio:
+            executor.shutdown(wait=True)
+
+    falhas = [r for r in resultados if not r.ok]
+    logging.info(f"Extração de {len(resultados)} quadro(s) concluída: {len(resultados) - len(falhas)} ok, {len(falhas)} com falha.")
+    return resultados
+
+async def _aextrair_quadro(spec: BoardSpec, semaforo: asyncio.Semaphore, executor: Executor) -> BoardResult:
+    """Extrai e grava um quadro; qualquer erro fica no resultado, sem afetar os outros quadros."""
+    resultado = BoardResult(spec)
+    async with semaforo:
+        inicio = time.perf_counter()
+        try:
+            # Mapa de colunas e grupos em uma única chamada (síncrona, fora do event loop)
+            setup = await asyncio.to_thread(get_board_setup, spec.id_board, spec.nome_subsetor, spec.filtrar_grupo)
+            dados = await _abuscar_itens(spec)
+            resultado.tempo_extracao = time.perf_counter() - inicio
 
-    # 3 Pronto!
-    elemento.to_excel(arquivo_elementos, index=False)
-    print(f"Arquivo Elementos salvo em: {arquivo_elementos}")
+            inicio = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            # Os DataFrames não são devolvidos: as páginas saem da memória conforme são gravadas
+            (_, _, resultado.arquivo_elementos, resultado.arquivo_subelementos,
+             resultado.total_elementos, resultado.total_subelementos) = await loop.run_in_executor(
+                executor, _salvar_dados, [dados], spec.nome_subsetor, spec.caminho_arquivos, setup.mapper.coluna_map,
+                setup.mapper.subitem_map, spec.tipado, spec.formato, False, spec.colunas)
+            resultado.tempo_gravacao = time.perf_counter() - inicio
+        except Exception as e:
+            tempo = time.perf_counter() - inicio
+            if resultado.tempo_extracao:
+                resultado.tempo_gravacao = tempo
+            else:
+                resultado.tempo_extracao = tempo
+            resultado.erro = f"{type(e).__name__}: {e}"
+            resultado.excecao = e
+            logging.error(f"Falha na extração do quadro {spec.id_board} ({spec.nome_subsetor}): {resultado.erro}")
+            return resultado
 
-    subelemento.to_excel(arquivo_subelementos, index=False)
-    print(f"Arquivo Subelementos salvo em: {arquivo_subelementos}")
+    logging.info(f"Quadro {spec.id_board} ({spec.nome_subsetor}): {resultado.total_elementos} elemento(s) em "
+                 f"{resultado.tempo_extracao:.1f}s de extração e {resultado.tempo_gravacao:.1f}s de gravação.")
+    return resultado
 
-    return elemento, subelemento, arquivo_elementos, arquivo_subelementos
+async def _abuscar_itens(spec: BoardSpec) -> list:
+    """Busca os itens de um quadro com o mesmo roteamento de `extrair_dados_monday`."""
+    if spec.incremental:
+        # A extração incremental é síncrona (estado salvo em disco); roda fora do event loop
+        return await asyncio.to_thread(
+            extrair_dados_incrementais, board_id=spec.id_board, subsetor=spec.nome_subsetor,
+            column_name=spec.nome_coluna_data, init_date=spec.data_inicio, end_date=spec.data_fim,
+            filtrar_por_data=spec.filtrar_por_data, colunas=spec.colunas, grupos=spec.filtrar_grupo,
+            tamanho_pagina=spec.tamanho_pagina, subitens=spec.subitens, valores_brutos=spec.tipado)
+    if spec.janela_dias and spec.filtrar_por_data:
+        return await aextrair_dados_por_janelas(
+            board_id=spec.id_board, subsetor=spec.nome_subsetor, column_name=spec.nome_coluna_data,
+            init_date=spec.data_inicio, end_date=spec.data_fim, janela_dias=spec.janela_dias, colunas=spec.colunas,
+            grupos=spec.filtrar_grupo, tamanho_pagina=spec.tamanho_pagina, subitens=spec.subitens,
+            valores_brutos=spec.tipado)
+    return await aextrair_dados_paginados(
+        board_id=spec.id_board, subsetor=spec.nome_subsetor, filtrar_por_data=spec.filtrar_por_data,
+        column_name=spec.nome_coluna_data, init_date=spec.data_inicio, end_date=spec.data_fim, colunas=spec.colunas,
+        grupos=spec.filtrar_grupo, tamanho_pagina=spec.tamanho_pagina, subitens=spec.subitens,
+        valores_brutos=spec.tipado)
@@ -1,10 +1,10 @@
 import logging
 import os
+import json
 import pickle
-from infra.settings import get_settings
+from ..infra.settings import get_settings
 from ..utils.logger import api_logger
 from ..service.get_id_column_monday import chamada_api_get_ids
-settings = get_settings()
 
 class ColunaIDMapper:
     """Gerencia o mapeamento entre nomes de colunas e seus metadados (ID, tipo).
@@ -28,6 +28,10 @@ class ColunaIDMapper:
         board_id (str): O ID do quadro do Monday.com que está sendo gerenciado.
         coluna_map (dict): O dicionário principal que armazena o mapeamento.
             O formato é: `{'Nome da Coluna': {'id': 'id_da_coluna', 'type': 'tipo_da_coluna'}}`
+        subitem_map (dict): O mesmo mapeamento para as colunas dos subitens (que
+            ficam em outro quadro, indicado pela coluna `subtasks`). É buscado
+            uma única vez, no primeiro acesso, e salvo junto. Vazio se o quadro
+            não tem subitens.
 
     Exemplo de Uso:
         ## Instancia o mapper para um quadro específico
@@ -44,20 +48,37 @@ class ColunaIDMapper:
         ### get_type -> `str`
         tipo_responsavel = mapper.get_type("Responsável")
          tipo_responsavel -> 'people'
+
+    Com `api_data` (a resposta de `QUERY_GET_COLUMN_METADATA` já buscada, por
+    exemplo em uma chamada agrupada), o mapa é montado e salvo sem chamar a API.
     """
-    def __init__(self, board_id: str = None, board_name: str = None):
+    def __init__(self, board_id: str = None, board_name: str = None, api_data: dict = None):
 
         if not (board_id and board_name):
             raise ValueError("É obrigatório informar board_id e board_name.")
         
         self.board_id = board_id
-        self.persist_path = settings.PERSIST_PATH / board_name / f"{self.board_id}.pkl"
+        self.persist_path = self._persist_file(board_id, board_name)
         self.coluna_map = {}
+        self.subitem_board_id = None
+        self._subitem_map = {}
         
-        if os.path.exists(self.persist_path):
-            self._load()
+        if api_data is not None:
+            self._create_map(api_data)
+            self._save()
+        elif os.path.exists(self.persist_path) and self._load():
+            pass
         else:
             self.refresh_map() 
+
+    @staticmethod
+    def _persist_file(board_id: str, board_name: str):
+        return get_settings().PERSIST_PATH / board_name / f"{board_id}.pkl"
+
+    @classmethod
+    def has_persisted_map(cls, board_id: str, board_name: str) -> bool:
+        """Indica se o mapa do quadro já está salvo em disco (a instanciação não chamará a API)."""
+        return os.path.exists(cls._persist_file(board_id, board_name))
     
     def _create_map(self, api_response_data: dict):
         """
@@ -69,38 +90,56 @@ class ColunaIDMapper:
         if not board_data:
             raise ValueError(f"Nenhum item encontrado no quadro {self.board_id} para mapear colunas.")
         
-        main_columns = board_data.get("main_columns", [])
-        sub_columns = board_data.get("sub_columns", [])
-        coluna_map_temp = {}
-        
-        # Items
-        for coluna in main_columns:
+        self.coluna_map = self._columns_map(board_data.get("main_columns", []))
+
+        # Subitens: as colunas ficam no quadro indicado no settings_str da coluna `subtasks`
+        self.subitem_board_id = None
+        for coluna in board_data.get("sub_columns") or []:
+            board_ids = json.loads(coluna.get("settings_str") or "{}").get("boardIds") or []
+            if board_ids:
+                self.subitem_board_id = str(board_ids[0])
+                break
+        # O mapa dos subitens só é buscado quando for usado (ver `subitem_map`)
+        self._subitem_map = None if self.subitem_board_id else {}
+
+    @property
+    def subitem_map(self) -> dict:
+        if self._subitem_map is None:
+            logging.info(f"Buscando metadados das colunas dos subitens do quadro {self.board_id}...")
+            sub_board = chamada_api_get_ids(self.subitem_board_id).get("boards", [{}])[0] or {}
+            self._subitem_map = self._columns_map(sub_board.get("main_columns", []))
+            self._save()
+        return self._subitem_map
+
+    @staticmethod
+    def _columns_map(columns: list) -> dict:
+        """{'Nome': {'id': ID, 'type': TIPO}} a partir da lista de colunas da API."""
+        coluna_map = {}
+        for coluna in columns:
             titulo = coluna.get("title")
             id_col = coluna.get("id")
             type_col = coluna.get("type")
             if titulo and id_col and type_col:
-                coluna_map_temp[titulo] = {'id': id_col, 'type': type_col}
-
-        # Subitens
-        for coluna in sub_columns:
-            titulo = coluna.get("column", {}).get("title")
-            id_col = coluna.get("id")
-            type_col = coluna.get("type")
-            if titulo and id_col and type_col:
-                coluna_map_temp[titulo] = {'id': id_col, 'type': type_col}
-
-        self.coluna_map = coluna_map_temp
+                coluna_map[titulo] = {'id': id_col, 'type': type_col}
+        return coluna_map
 
     def _save(self):
         """Cria o arquivo de persistência e salva os dados"""
         os.makedirs(os.path.dirname(self.persist_path), exist_ok=True)
         with open(self.persist_path, 'wb') as f:
-            pickle.dump(self.coluna_map, f)
+            pickle.dump((self.coluna_map, self.subitem_board_id, self._subitem_map), f)
 
-    def _load(self):
-        """Carrega os dados do arquivo de persistência"""
+    def _load(self) -> bool:
+        """
+        Carrega os dados do arquivo de persistência. Retorna False se o arquivo
+        for de uma versão anterior (só o mapa das colunas dos itens), que precisa ser refeito.
+        """
         with open(self.persist_path, 'rb') as f:
-            self.coluna_map = pickle.load(f)
+            data = pickle.load(f)
+        if not isinstance(data, tuple):
+            return False
+        self.coluna_map, self.subitem_board_id, self._subitem_map = data
+        return True
 
     def refresh_map(self):
         """Força a atualização do mapa de colunas a partir da API e salva em disco."""
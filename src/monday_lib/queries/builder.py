@@ -0,0 +1,180 @@
+"""
+Geração das queries de exportação (`items_page`) a partir das opções da extração.
+
+Os templates .gql cobrem a primeira página no caso padrão (todas as colunas,
+quadro inteiro). Quando a extração pede só algumas colunas
+(`column_values(ids: $columnIds)`) ou só um grupo
+(`groups(ids: [$groupId]) { items_page }`), a query é gerada aqui, com os
+mesmos campos de item dos templates.
+
+As páginas seguintes sempre usam a raiz `next_items_page(cursor:, limit:)`,
+que não precisa resolver o quadro (nem o grupo e as regras) a cada página: o
+cursor já carrega esse estado. Todas as queries compartilham o fragmento
+`ItemFields`.
+
+Com `subitems=False` os subitens ficam fora da seleção (modos `none` e
+`deferred` da extração); no modo `deferred` eles são buscados depois, em lotes,
+por `build_subitems_query`.
+
+Com `values=True` cada valor de coluna traz também o `value` (JSON bruto da
+coluna), usado pela conversão de tipos (`tipado=True`) onde o `text` perde
+informação (ex: a hora, em UTC, das colunas de data).
+
+O nome da operação muda conforme as opções (ex: `getItemsPageProjected`), para
+que o orçamento de complexidade aprenda o custo de cada formato separadamente.
+"""
+import functools
+
+# Máximo de IDs aceito por `items(ids:)` em uma chamada
+ITEMS_BY_ID_LIMIT = 100
+
+# Campos de cada valor de coluna (iguais aos dos templates)
+COLUMN_VALUE_FIELDS = """id
+type
+text
+column {title}
+... on MirrorValue {display_value}
+... on FormulaValue {display_value}
+... on DependencyValue {display_value}
+... on BoardRelationValue {display_value}"""
+
+
+def _indent(text: str, spaces: int) -> str:
+    return "\n".join(" " * spaces + line for line in text.splitlines())
+
+
+def _column_value_fields(values: bool = False) -> str:
+    return COLUMN_VALUE_FIELDS.replace("text\n", "text\nvalue\n", 1) if values else COLUMN_VALUE_FIELDS
+
+
+def _subitems_selection(values: bool = False) -> str:
+    return (
+        "subitems {\n"
+        "  id\n"
+        "  name\n"
+        "  columns: column_values {\n"
+        f"{_indent(_column_value_fields(values), 4)}\n"
+        "  }\n"
+        "}"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def item_fragment(columns: bool = False, subitems: bool = True, values: bool = False) -> str:
+    """
+    Fragmento `ItemFields` com a seleção de cada item (e dos seus subitens).
+    Com `columns=True`, os valores de coluna do item ficam restritos a `$columnIds`.
+    Com `subitems=False`, os subitens não são pedidos.
+    Com `values=True`, cada valor de coluna traz também o `value` (JSON bruto).
+    """
+    column_args = "(ids: $columnIds)" if columns else ""
+    return (
+        "fragment ItemFields on Item {\n"
+        "  id\n"
+        "  name\n"
+        "  group {\n"
+        "    title\n"
+        "  }\n"
+        f"  columns: column_values{column_args} {{\n"
+        f"{_indent(_column_value_fields(values), 4)}\n"
+        "  }\n"
+        + (f"{_indent(_subitems_selection(values), 2)}\n" if subitems else "")
+        + "}"
+    )
+
+
+def _operation_name(base: str, rules: bool = False, columns: bool = False, subitems: bool = True,
+                    values: bool = False) -> str:
+    return (base + ("Filtered" if rules else "") + ("Projected" if columns else "") + ("" if subitems else "NoSubitems")
+            + ("Raw" if values else ""))
+
+
+@functools.lru_cache(maxsize=None)
+def build_items_page_query(rules: bool = False, columns: bool = False, group: bool = False,
+                           subitems: bool = True, values: bool = False) -> str:
+    """
+    Query da primeira página do `items_page` de um quadro, com `$limit` itens por página.
+    As páginas seguintes usam `build_next_items_page_query`.
+
+    Args:
+        rules: inclui `query_params: {rules: $rules}` (filtros de data, `__last_updated__`...).
+        columns: restringe as colunas dos itens a `$columnIds` (lista de IDs de coluna).
+        group: pagina só os itens do grupo `$groupId` (`boards[0].groups[0].items_page`).
+        subitems: inclui os subitens de cada item na página.
+        values: inclui o `value` (JSON bruto) de cada valor de coluna.
+    """
+    name = _operation_name("getGroupItemsPage" if group else "getItemsPage", rules, columns, subitems, values)
+    params = ["$boardId: ID!", "$limit: Int"]
+    if group:
+        params.append("$groupId: String!")
+    if rules:
+        params.append("$rules: [ItemsQueryRule!]")
+    if columns:
+        params.append("$columnIds: [String!]")
+    page_args = "limit: $limit" + (", query_params: {rules: $rules}" if rules else "")
+
+    items_page = (
+        f"items_page({page_args}) {{\n"
+        "  cursor\n"
+        "  items {\n"
+        "    ...ItemFields\n"
+        "  }\n"
+        "}"
+    )
+    if group:
+        items_page = f"groups(ids: [$groupId]) {{\n{_indent(items_page, 2)}\n}}"
+
+    return (
+        f"query {name}({', '.join(params)}) {{\n"
+        "  boards(ids: [$boardId]) {\n"
+        f"{_indent(items_page, 4)}\n"
+        "  }\n"
+        "}\n"
+        f"{item_fragment(columns, subitems, values)}"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def build_next_items_page_query(columns: bool = False, subitems: bool = True, values: bool = False) -> str:
+    """
+    Query de continuação: a próxima página de um `items_page` a partir do `$cursor`
+    (`next_items_page`), com `$limit` itens e a mesma seleção de item da primeira página.
+
+    Args:
+        columns: restringe as colunas dos itens a `$columnIds` (deve ser igual à primeira página).
+        subitems: inclui os subitens de cada item na página.
+        values: inclui o `value` (JSON bruto) de cada valor de coluna.
+    """
+    name = _operation_name("getNextItemsPage", columns=columns, subitems=subitems, values=values)
+    params = ["$cursor: String!", "$limit: Int"]
+    if columns:
+        params.append("$columnIds: [String!]")
+
+    return (
+        f"query {name}({', '.join(params)}) {{\n"
+        "  next_items_page(cursor: $cursor, limit: $limit) {\n"
+        "    cursor\n"
+        "    items {\n"
+        "      ...ItemFields\n"
+        "    }\n"
+        "  }\n"
+        "}\n"
+        f"{item_fragment(columns, subitems, values)}"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def build_subitems_query(values: bool = False) -> str:
+    """
+    Query dos subitens de um lote de itens (`$itemIds`, até `ITEMS_BY_ID_LIMIT`),
+    com a mesma seleção de subitem do fragmento `ItemFields` (e o `value` das
+    colunas, com `values=True`).
+    """
+    return (
+        f"query {_operation_name('getSubitems', values=values)}($itemIds: [ID!]) {{\n"
+        f"  items(ids: $itemIds, limit: {ITEMS_BY_ID_LIMIT}) {{\n"
+        "    id\n"
+        f"{_indent(_subitems_selection(values), 4)}\n"
+        "  }\n"
+        "}"
+    )
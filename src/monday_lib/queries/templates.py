@@ -1,6 +1,21 @@
 import os
 import logging
-from ..utils.logger import api_logger
+import functools
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), '..', 'templ')
+
+# Nome da constante -> nome do arquivo .gql (sem extensão, em maiúsculas)
+QUERY_NAMES = {
+    'QUERY_DELETE_GROUP': 'DELETE_GROUP',
+    'QUERY_CREATE_GROUP': 'CREATE_GROUP',
+    'QUERY_GET_GROUP_ID': 'GET_BOARD_GROUPS',
+    'QUERY_INITIAL_REQUEST': 'INITIAL_REQUEST',
+    'QUERY_PAGINATED_REQUEST': 'PAGINATED_REQUEST',
+    'QUERY_BOARD_ITEM_COUNT': 'GET_BOARD_ITEM_COUNT',
+    'QUERY_GET_COLUMN_METADATA': 'GET_COLUMN_METADATA',
+    'QUERY_GET_ACTIVITY_LOGS': 'GET_ACTIVITY_LOGS',
+}
+
 
 def load_queries_from_directory(directory_path: str) -> dict:
     """
@@ -8,31 +23,51 @@ def load_queries_from_directory(directory_path: str) -> dict:
     A chave do dicionário é o nome do arquivo (sem a extensão .gql) em maiúsculas.
     """
     queries = {}
-    # print(f"Carregando queries do diretório: {directory_path}")
     try:
         for filename in os.listdir(directory_path):
             if filename.endswith(".gql"):
                 query_name = os.path.splitext(filename)[0].upper()
-                file_path = os.path.join(directory_path, filename)
-                
-                with open(file_path, "r", encoding="utf-8") as file:
-                    queries[query_name] = file.read()
+                queries[query_name] = get_query(query_name, directory_path)
 
     except FileNotFoundError:
-        error_message = f"Diretório de templates GQL não foi encontrado no caminho esperado: '{directory_path}'"
-        logging.critical(error_message)
-        api_logger.error(error_message)
+        _log_missing(f"Diretório de templates GQL não foi encontrado no caminho esperado: '{directory_path}'")
         raise
-    
+
     return queries
 
-TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), '..', 'templ')
-_queries_dict = load_queries_from_directory(TEMPLATES_DIR)
-
-QUERY_DELETE_GROUP = _queries_dict.get('DELETE_GROUP', None)
-QUERY_CREATE_GROUP = _queries_dict.get('CREATE_GROUP', None)   
-QUERY_GET_GROUP_ID = _queries_dict.get('GET_BOARD_GROUPS', None)
-QUERY_INITIAL_REQUEST = _queries_dict.get('INITIAL_REQUEST', None)
-QUERY_PAGINATED_REQUEST = _queries_dict.get('PAGINATED_REQUEST', None)
-QUERY_BOARD_ITEM_COUNT = _queries_dict.get('GET_BOARD_ITEM_COUNT', None)
-QUERY_GET_COLUMN_METADATA = _queries_dict.get('GET_COLUMN_METADATA', None)
\ No newline at end of file
+
+@functools.lru_cache(maxsize=None)
+def get_query(name: str, directory_path: str = TEMPLATES_DIR) -> str | None:
+    """
+    Lê (uma única vez) o template `<name>.gql` e devolve o texto da query.
+    Retorna None se o arquivo não existir.
+    """
+    file_path = os.path.join(directory_path, f"{name.lower()}.gql")
+    if not os.path.isfile(file_path):
+        if not os.path.isdir(directory_path):
+            _log_missing(f"Diretório de templates GQL não foi encontrado no caminho esperado: '{directory_path}'")
+            raise FileNotFoundError(directory_path)
+        return None
+
+    with open(file_path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+def _log_missing(error_message: str):
+    from ..utils.logger import api_logger
+    logging.critical(error_message)
+    api_logger.error(error_message)
+
+
+def __getattr__(name: str) -> str | None:
+    """
+    Carrega os templates sob demanda: `QUERY_*` só lê o arquivo .gql
+    correspondente no primeiro acesso.
+    """
+    if name in QUERY_NAMES:
+        return get_query(QUERY_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *QUERY_NAMES])
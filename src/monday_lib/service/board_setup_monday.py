@@ -0,0 +1,62 @@
+import logging
+from dataclasses import dataclass, field
+from ..api_client.batching import QueryBatcher
+from ..mapper.column_map import ColunaIDMapper
+from ..queries.templates import QUERY_GET_COLUMN_METADATA, QUERY_GET_GROUP_ID, QUERY_BOARD_ITEM_COUNT
+from .get_group_id_monday import _board_groups, _parse_groups, _select_groups
+from .get_board_item_count import read_item_count
+
+@dataclass
+class BoardSetup:
+    """Leituras de preparação de um quadro (ver `get_board_setup`)."""
+    mapper: ColunaIDMapper = None
+    group_ids: dict[str, str] = field(default_factory=dict)
+    item_count: int = None
+
+def get_board_setup(board_id: str,
+                    board_name: str = None,
+                    grupos: list[str] = None,
+                    contagem: bool = False) -> BoardSetup:
+    """
+    Faz as leituras de preparação de um quadro em uma única chamada à API.
+
+    Os metadados das colunas (só se o mapa ainda não estiver salvo em disco),
+    os grupos e a contagem de itens são enviados juntos pelo `QueryBatcher`;
+    os grupos já em cache no cliente nem entram no lote.
+
+    Args:
+        board_id: ID do quadro.
+        board_name: Nome do quadro/subsetor do `ColunaIDMapper`. Sem ele, o mapper não é montado.
+        grupos: Nomes dos grupos a converter em IDs.
+        contagem: Se True, também busca o número de itens do quadro.
+
+    Returns:
+        `BoardSetup` com `mapper`, `group_ids` ({nome: id}, na ordem de `grupos`)
+        e `item_count` (None quando `contagem=False`).
+
+    Raises:
+        ValueError: Se algum grupo de `grupos` não existir no quadro.
+    """
+    if isinstance(grupos, str):
+        grupos = [grupos]
+    variables = {"boardId": board_id}
+    with QueryBatcher(window=None) as lote:
+        colunas = None
+        if board_name and not ColunaIDMapper.has_persisted_map(board_id, board_name):
+            colunas = lote.submit(QUERY_GET_COLUMN_METADATA, variables)
+        resposta_grupos = lote.submit(QUERY_GET_GROUP_ID, variables) if grupos else None
+        resposta_contagem = lote.submit(QUERY_BOARD_ITEM_COUNT, variables) if contagem else None
+
+    setup = BoardSetup()
+    if board_name:
+        setup.mapper = ColunaIDMapper(board_id, board_name, api_data=colunas.result() if colunas else None)
+    if grupos:
+        groups = _parse_groups(resposta_grupos.result())
+        if not all(name in groups for name in grupos):
+            # O grupo pode ter sido criado depois da resposta em cache
+            groups = _board_groups(board_id, grupos)
+        setup.group_ids = _select_groups(board_id, groups, list(grupos))
+    if contagem:
+        setup.item_count = read_item_count(resposta_contagem.result())
+        logging.info(f"O quadro {board_id} contém {setup.item_count} itens.")
+    return setup
@@ -0,0 +1,113 @@
+import os
+import gzip
+import time
+import shutil
+import logging
+from typing import Iterator
+from ..infra.settings import get_settings
+from ..api_client import json_backend
+
+# O Monday mantém um cursor válido por 60 minutos; a margem evita retomar com um cursor prestes a expirar
+CURSOR_TTL = 55 * 60
+
+
+class ExportCheckpoint:
+    """Checkpoint em disco de uma exportação paginada, para retomá-la após uma falha.
+
+    Fica em `PERSIST_PATH/checkpoints/<job_id>/`:
+      - `state.json`: parâmetros da exportação e, para cada parte (shard), o
+        cursor da próxima página, o número de páginas gravadas e a hora em que
+        o cursor foi recebido;
+      - `<shard>/<página>.json.gz`: os itens de cada página já buscada.
+
+    Cada página é gravada (de forma atômica) antes de o cursor seguinte ser
+    registrado, então o checkpoint sempre aponta para uma página já salva.
+
+    Se os parâmetros salvos forem diferentes dos atuais, o checkpoint é
+    descartado e a exportação recomeça do zero.
+
+    Args:
+        job_id: Identificador da exportação (o mesmo nas execuções que devem retomar).
+        params: Parâmetros que definem a exportação (serializáveis em JSON).
+    """
+    def __init__(self, job_id: str, params: dict):
+        self.job_id = job_id
+        self.params = params
+        self.path = get_settings().PERSIST_PATH / "checkpoints" / job_id
+        self.state = self._load()
+        if self.state is not None and self.state.get("params") != params:
+            logging.warning(f"Checkpoint '{job_id}' tem outros parâmetros de exportação; descartando e recomeçando.")
+            self.discard()
+            self.state = None
+        if self.state is None:
+            self.state = {"params": params, "shards": {}}
+        elif self.state["shards"]:
+            logging.info(f"Checkpoint '{job_id}' encontrado: retomando a exportação.")
+
+    def shard(self, key: str) -> dict:
+        """Estado de uma parte: {"cursor", "pages", "cursor_at", "done"} (vazio se ainda não começou)."""
+        return self.state["shards"].get(key, {"cursor": None, "pages": 0, "cursor_at": None, "done": False})
+
+    def resume_cursor(self, key: str) -> str | None:
+        """
+        Cursor para retomar a parte `key`, ou None se ela deve (re)começar da
+        primeira página. Uma parte com cursor vencido é reiniciada.
+        """
+        shard = self.shard(key)
+        if shard["done"] or not shard["cursor"]:
+            return None
+        if time.time() - shard["cursor_at"] > CURSOR_TTL:
+            logging.info(f"Checkpoint '{self.job_id}': cursor da parte {key} venceu; refazendo só essa parte.")
+            self.restart(key)
+            return None
+        return shard["cursor"]
+
+    def pages(self, key: str) -> Iterator[list]:
+        """Páginas já gravadas da parte `key`, em ordem."""
+        for number in range(1, self.shard(key)["pages"] + 1):
+            with gzip.open(self._page_path(key, number), "rb") as f:
+                yield json_backend.loads(f.read())
+
+    def save_page(self, key: str, items: list, cursor: str | None):
+        """Grava uma página da parte `key` e registra o cursor da página seguinte (None = parte concluída)."""
+        shard = self.shard(key)
+        number = shard["pages"] + 1
+        path = self._page_path(key, number)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(f"{path}.tmp", "wb", compresslevel=1) as f:
+            f.write(json_backend.dumps(items))
+        os.replace(f"{path}.tmp", path)
+
+        self.state["shards"][key] = {"cursor": cursor, "pages": number, "cursor_at": time.time(), "done": cursor is None}
+        self._save()
+
+    def restart(self, key: str):
+        """Descarta as páginas gravadas da parte `key` (ex: o cursor expirou)."""
+        self.state["shards"].pop(key, None)
+        shutil.rmtree(self.path / key, ignore_errors=True)
+        self._save()
+
+    def discard(self):
+        """Apaga o checkpoint (chamado ao fim de uma exportação concluída)."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _page_path(self, key: str, number: int) -> str:
+        return str(self.path / key / f"{number:06d}.json.gz")
+
+    def _load(self) -> dict | None:
+        try:
+            with open(self.path / "state.json", "rb") as f:
+                return json_backend.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Checkpoint ilegível em '{self.path}' ({e}); recomeçando a exportação.")
+            return None
+
+    def _save(self):
+        """Grava o estado de forma atômica (arquivo temporário + os.replace)."""
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = self.path / "state.json.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json_backend.dumps(self.state))
+        os.replace(tmp_path, self.path / "state.json")
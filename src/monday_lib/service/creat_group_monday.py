@@ -1,6 +1,6 @@
 import logging
 from ..utils.decorators import log_api_errors
-from ..api_client.call_api import call_monday_api
+from ..api_client.call_api import call_monday_api, acall_monday_api
 from ..queries.templates import QUERY_CREATE_GROUP
 
 @log_api_errors
@@ -16,7 +16,29 @@ def create_monday_group(board_id: int, group_name: str) -> str:
 
     group_vars = {"boardId": board_id, "groupName": group_name}
     
+    # A mutation invalida os grupos do quadro no cache do cliente
     response_data = call_monday_api(QUERY_CREATE_GROUP, group_vars)
+    return _read_new_group_id(response_data, group_name)
+
+@log_api_errors
+async def acreate_monday_group(board_id: int, group_name: str) -> str:
+    """
+    Versão assíncrona de `create_monday_group`.
+
+    :param board_id: ID do quadro onde o grupo será criado.
+    :param group_name: Nome do novo grupo.
+    :return: O ID do grupo recém-criado.
+    """
+    logging.info(f"Criando grupo '{group_name}' no quadro {board_id}...")
+
+    group_vars = {"boardId": board_id, "groupName": group_name}
+
+    # A mutation invalida os grupos do quadro no cache do cliente
+    response_data = await acall_monday_api(QUERY_CREATE_GROUP, group_vars)
+    return _read_new_group_id(response_data, group_name)
+
+def _read_new_group_id(response_data: dict, group_name: str) -> str:
+    """Extrai o ID do grupo criado da resposta da mutation."""
     new_group_id = response_data.get('create_group', {}).get('id')
 
     if not new_group_id:
@@ -25,5 +47,3 @@ def create_monday_group(board_id: int, group_name: str) -> str:
     logging.info(f"Grupo '{group_name}' (ID: {new_group_id}) criado com sucesso!")
     
     return new_group_id
-    
-        
\ No newline at end of file
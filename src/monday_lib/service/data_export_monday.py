@@ -1,9 +1,24 @@
+import asyncio
 import logging
+from contextlib import closing
+from datetime import date, timedelta
+from typing import Iterator, AsyncIterator
 from ..utils.decorators import log_api_errors
 from ..utils.get_last_date import get_date
 from ..mapper.column_map import ColunaIDMapper
-from ..api_client.call_api import call_monday_api
+from ..api_client.call_api import call_monday_api, acall_monday_api, stream_monday_items
+from ..api_client.retry import Deadline
+from ..api_client.metrics import call_context, iter_in_context
+from ..api_client.exceptions import APICursorExpiredError
+from ..api_client.streaming import ITEMS_PAGE_PREFIX, GROUP_ITEMS_PAGE_PREFIX, NEXT_ITEMS_PAGE_PREFIX
 from ..queries.templates import QUERY_INITIAL_REQUEST, QUERY_PAGINATED_REQUEST
+from ..queries.builder import build_items_page_query, build_next_items_page_query
+from .board_setup_monday import get_board_setup
+from .page_size import PageSizeController, page_size_option
+from .checkpoint_monday import ExportCheckpoint
+from .page_archive_monday import PageArchive
+from .subitems_monday import (SUBITEMS_INLINE, SUBITEMS_DEFERRED, subitems_mode, fetch_subitems,
+                              afetch_subitems, attach_subitems)
 
 @log_api_errors
 def extrair_dados_paginados(board_id: str, 
@@ -11,7 +26,17 @@ def extrair_dados_paginados(board_id: str,
                             filtrar_por_data: bool = True,
                             column_name: str = None, 
                             init_date: str = None, 
-                            end_date: str = None) -> list:
+                            end_date: str = None,
+                            deadline: float = None,
+                            streaming: bool = False,
+                            colunas: list[str] = None,
+                            grupos: list[str] = None,
+                            tamanho_pagina: int | str = None,
+                            subitens: str = "inline", subitens_paralelos: int = 1,
+                            job_id: str = None,
+                            valores_brutos: bool = False,
+                            arquivar_em: str = None,
+                            formato_arquivo: str = "jsonl") -> list:
     """
     Chamada API para o servidor da Monday com a query de 'request.gql', 
     aqui extrai os elementos e sub_elementos.
@@ -28,6 +53,35 @@ def extrair_dados_paginados(board_id: str,
     Opcionais:
         init_date= format:"AAAA-MM-DD" -> str
         end_date= format:"AAAA-MM-DD" -> str
+        deadline= prazo total em segundos para toda a extração -> float
+        streaming= decodifica cada página aos poucos, item a item -> bool
+            (menor pico de memória em quadros com muitos subitens/colunas)
+        colunas= títulos das colunas a trazer, ex: ["Status", "Horas"] -> list[str]
+            (os demais valores de coluna dos itens não são pedidos à API;
+            menor resposta, menor custo de complexidade e decodificação mais rápida)
+        grupos= nomes dos grupos a extrair, ex: ["Feito"] -> list[str]
+            (filtrado no servidor: só o items_page desses grupos é paginado)
+        tamanho_pagina= itens por página, de 1 a 500, ou "auto" -> int | str
+            (padrão: ITEMS_PAGE_SIZE das configurações; páginas maiores = menos
+            idas e voltas à API. Com "auto", o tamanho cresce ou diminui conforme
+            a latência, o custo de complexidade e os 504 de cada página)
+        subitens= "inline" (padrão), "none" ou "deferred" -> str
+            ("none" não pede os subitens; "deferred" pede as páginas sem subitens
+            e busca os subitens depois, em lotes de até 100 itens por `items(ids:)`)
+        subitens_paralelos= lotes de subitens buscados por vez no modo "deferred" -> int
+        job_id= identificador da exportação para retomá-la após uma falha -> str
+            (as páginas e o cursor ficam salvos em PERSIST_PATH/checkpoints/<job_id>;
+            uma nova chamada com o mesmo job_id e os mesmos parâmetros continua do
+            último cursor, se ele ainda for válido, ou refaz só a parte (grupo) cujo
+            cursor expirou. O checkpoint é apagado quando a exportação termina)
+        valores_brutos= inclui o `value` (JSON bruto) de cada valor de coluna -> bool
+            (usado pela conversão de tipos de `list2dfs(..., tipado=True)`)
+        arquivar_em= pasta onde as páginas brutas da extração são arquivadas -> str
+            (com o manifest: parâmetros, esquema de colunas e totais. O arquivo pode
+            ser reprocessado depois, sem chamar a API, por `extrair_dados_arquivados`,
+            `iter_paginas_arquivadas` ou `reprocessar_dados_monday`)
+        formato_arquivo= "jsonl" (padrão, JSON Lines com gzip) ou "arrow" -> str
+            (Arrow IPC, requer `pyarrow`)
     
     Se não passar os opcionais, será definido pelo codigo:
         init_date= "primeiro_dia_mes_anterior" -> str
@@ -36,69 +90,608 @@ def extrair_dados_paginados(board_id: str,
     Se {filtrar_por_data: bool = False} & '{init_date} and {end_date} and {column_name} = None' -> os items não sao filtrados por data.
         (Não recomendado, pois escala 'N+D' .:.(dias corridos do ano em atividades))
 
+    Erros transitórios (429, 5xx, timeouts) são repetidos pelo cliente com o
+    MESMO cursor, então uma falha na página 300 não reinicia o quadro do zero.
+    O `deadline` limita o tempo total dessas retentativas somadas.
+
     'raise' caso fortuito.
     """
 
-    all_items = []
-    variables = {
-        "boardId": board_id,
-    }
+    all_items = list(_iter_items_paginados(board_id, subsetor, filtrar_por_data, column_name, init_date, end_date,
+                                           deadline, streaming, colunas=colunas, grupos=grupos,
+                                           tamanho_pagina=tamanho_pagina, subitens=subitens,
+                                           subitens_paralelos=subitens_paralelos, job_id=job_id,
+                                           valores_brutos=valores_brutos, arquivar_em=arquivar_em,
+                                           formato_arquivo=formato_arquivo))
+    if all_items:
+        logging.info(f"Busca concluída. Total de itens encontrados: {len(all_items)}. Contém mais items? - Não")
+    return all_items
 
-    if filtrar_por_data:
-        if init_date is None and end_date is None:
-            init_date, end_date = get_date()
-        if not column_name:
-            raise Exception("Não foi passado o Nome da Coluna de Data a ser filtrada.")     
+@log_api_errors
+def iter_items_paginados(board_id: str,
+                         subsetor: str,
+                         filtrar_por_data: bool = True,
+                         column_name: str = None,
+                         init_date: str = None,
+                         end_date: str = None,
+                         deadline: float = None,
+                         streaming: bool = False,
+                         por_pagina: bool = False,
+                         colunas: list[str] = None,
+                         grupos: list[str] = None,
+                         tamanho_pagina: int | str = None,
+                         subitens: str = "inline", subitens_paralelos: int = 1,
+                         job_id: str = None,
+                         valores_brutos: bool = False,
+                         arquivar_em: str = None,
+                         formato_arquivo: str = "jsonl") -> Iterator[dict] | Iterator[list]:
+    """
+    Versão geradora de `extrair_dados_paginados`, com os mesmos parâmetros.
+
+    Entrega os itens conforme cada página do cursor chega, em vez de montar a
+    lista do quadro inteiro. Quem consome pode filtrar, transformar e gravar os
+    itens aos poucos, com memória limitada ao tamanho da página (ou ao item,
+    com `streaming=True`).
+
+    Opcionais (além dos de `extrair_dados_paginados`):
+        por_pagina= entrega uma lista por página em vez de item a item -> bool
+
+    A próxima página só é buscada quando o consumidor pede o próximo item.
+    Interromper a iteração (break, close()) não faz mais chamadas à API.
+
+    Exemplo de Uso:
+        for item in iter_items_paginados("8585814551", "CRI", column_name="Prazo Inicial"):
+            if item["group"]["title"] == "Feito":
+                gravar(item)
+    """
+    yield from _iter_items_paginados(board_id, subsetor, filtrar_por_data, column_name, init_date, end_date,
+                                     deadline, streaming, por_pagina, colunas=colunas, grupos=grupos,
+                                     tamanho_pagina=tamanho_pagina, subitens=subitens,
+                                     subitens_paralelos=subitens_paralelos, job_id=job_id,
+                                     valores_brutos=valores_brutos, arquivar_em=arquivar_em,
+                                     formato_arquivo=formato_arquivo)
 
+def _iter_items_paginados(board_id: str, subsetor: str, filtrar_por_data: bool, column_name: str, init_date: str,
+                          end_date: str, deadline: float, streaming: bool, por_pagina: bool = False,
+                          rules: list = None, colunas: list[str] = None, grupos: list[str] = None,
+                          tamanho_pagina: int | str = None,
+                          subitens: str = "inline", subitens_paralelos: int = 1, job_id: str = None,
+                          valores_brutos: bool = False, arquivar_em: str = None, formato_arquivo: str = "jsonl"):
+    """
+    Gerador comum a `extrair_dados_paginados` e `iter_items_paginados` (sem o decorador).
+    `rules` são regras extras do items_page, somadas ao filtro de data (ex: `__last_updated__`).
+    Com `job_id`, cada requisição (uma por grupo) é uma parte do checkpoint.
+    Com `arquivar_em`, as páginas passam pelo `PageArchive` antes de serem entregues.
+    """
+    if filtrar_por_data and init_date is None and end_date is None:
+        init_date, end_date = get_date()
+    params = {
+        "board_id": str(board_id), "filtrar_por_data": filtrar_por_data, "column_name": column_name,
+        "init_date": init_date, "end_date": end_date, "rules": rules, "colunas": colunas,
+        "grupos": [grupos] if isinstance(grupos, str) else grupos, "subitens": subitens,
+        "valores_brutos": valores_brutos,
+    }
+    if arquivar_em is not None:
+        pages = _iter_items_paginados(board_id, subsetor, filtrar_por_data, column_name, init_date, end_date,
+                                      deadline, streaming, True, rules, colunas, grupos, tamanho_pagina,
+                                      subitens, subitens_paralelos, job_id, valores_brutos)
+        # Os esquemas vão junto: o reprocessamento monta as tabelas sem consultar a API
         mapper = ColunaIDMapper(board_id, subsetor)
-        id_date_col = mapper.get_id(column_name)
-
-        regras_de_filtro = [{
-            "column_id": id_date_col,
-            "compare_value": [init_date, end_date],
-            "operator": "between"
-        }]
-        variables["rules"] = regras_de_filtro
+        archive = PageArchive(arquivar_em).record(pages, formato_arquivo, board_id, subsetor, params,
+                                                  mapper.coluna_map, mapper.subitem_map)
+        with closing(archive):
+            for items in archive:
+                yield from _deliver(items, por_pagina)
+        return
+
+    prazo = Deadline(deadline) if deadline is not None else None
+    checkpoint = ExportCheckpoint(job_id, params) if job_id else None
+    requests = _prepare_requests(board_id, subsetor, filtrar_por_data, column_name, init_date, end_date,
+                                 rules=rules, colunas=colunas, grupos=grupos, tamanho_pagina=tamanho_pagina,
+                                 subitens=subitens, valores_brutos=valores_brutos)
+    deferred = subitens == SUBITEMS_DEFERRED
+
+    page = 0
+    total = 0
+    for shard, request in enumerate(requests):
+        key = f"parte_{shard:03d}"
+        query, variables = request.first()
+        resume = None
+        if checkpoint is not None:
+            if checkpoint.shard(key)["done"]:
+                # Parte concluída em uma execução anterior: as páginas vêm do disco
+                for items in checkpoint.pages(key):
+                    page += 1
+                    total += len(items)
+                    yield from _deliver(items, por_pagina)
+                continue
+            resume = checkpoint.resume_cursor(key)
+            if resume:
+                query, variables = request.next(resume)
+                page += checkpoint.shard(key)["pages"]
+
+        while True:
+            page += 1
+            try:
+                if streaming:
+                    # Os itens são lidos do socket conforme o consumidor avança
+                    stream = stream_monday_items(query, variables, deadline=prazo, page_prefix=request.page_prefix)
+                    items = iter_in_context(stream, page=page, observer=request.observer)
+                    if checkpoint is not None:
+                        # Com checkpoint a página precisa estar inteira para ser gravada
+                        items = list(items)
+                        cursor = stream.cursor
+                else:
+                    with call_context(page=page, observer=request.observer):
+                        response_data = call_monday_api(query, variables, deadline=prazo)
+                    items, cursor = request.read(response_data)
+            except APICursorExpiredError:
+                if not resume:
+                    raise
+                logging.info(f"Checkpoint '{job_id}': a API recusou o cursor salvo da parte {key}; refazendo só essa parte.")
+                page -= checkpoint.shard(key)["pages"] + 1
+                checkpoint.restart(key)
+                resume = None
+                query, variables = request.first()
+                continue
+
+            if resume:
+                # O cursor salvo ainda vale: as páginas já gravadas são entregues antes da nova
+                for saved in checkpoint.pages(key):
+                    total += len(saved)
+                    yield from _deliver(saved, por_pagina)
+                resume = None
+
+            if deferred:
+                # A página (já sem subitens) é lida inteira e completada com os subitens em lotes
+                items = list(items)
+                with call_context(page=page):
+                    attach_subitems(items, fetch_subitems([item["id"] for item in items], subitens_paralelos, prazo,
+                                                          valores_brutos))
+
+            if checkpoint is not None:
+                checkpoint.save_page(key, items, cursor)
+
+            if por_pagina:
+                items = list(items)
+                total += len(items)
+                yield items
+            else:
+                for item in items:
+                    total += 1
+                    yield item
+
+            if streaming and checkpoint is None:
+                cursor = stream.cursor
+
+            logging.info(f"Página {page} lida. Itens até agora: {total}. Contém mais items? - {'Sim' if cursor else 'Não'}")
+            if cursor is None:
+                break
+
+            query, variables = request.next(cursor)
+
+    if checkpoint is not None:
+        checkpoint.discard()
+
+def _deliver(items: list, por_pagina: bool):
+    """Entrega uma página já lida: a lista inteira (`por_pagina`) ou item a item."""
+    if por_pagina:
+        yield items
+    else:
+        yield from items
+
+class _ItemsPageRequest:
+    """
+    Query e variáveis das páginas de uma extração: a primeira página (com as
+    regras do items_page) e as continuações pelo cursor (`next_items_page`).
+
+    A primeira página, sem projeção de colunas, sem grupo, com subitens e sem `value`, usa os templates
+    .gql; caso contrário, usa as queries geradas por `queries.builder`
+    (`column_values(ids: ...)`, `groups(ids: [...]) { items_page }`). As
+    continuações vêm sempre de `build_next_items_page_query`.
+
+    `page_size` é o `limit` de cada página: um número fixo ou um
+    `PageSizeController`, consultado a cada página (ver `observer`).
+    Com `subitems=False` as páginas vêm sem os subitens dos itens; com
+    `values=True` os valores de coluna trazem também o `value` (JSON bruto).
+    """
+    def __init__(self, board_id: str, rules: list = None, column_ids: list[str] = None, group_id: str = None,
+                 page_size: int | PageSizeController = None, subitems: bool = True, values: bool = False):
+        self.board_id = board_id
+        self.rules = rules or None
+        self.column_ids = column_ids or None
+        self.group_id = group_id
+        self.page_size = page_size
+        self.subitems = subitems
+        self.values = values
+        self._continuing = False
+
+    @property
+    def observer(self) -> PageSizeController | None:
+        """Observador das métricas das chamadas (para o `call_context`), se o tamanho de página for adaptativo."""
+        return self.page_size if isinstance(self.page_size, PageSizeController) else None
+
+    @property
+    def page_prefix(self) -> str:
+        """Caminho da página na resposta da última query montada (para a leitura em streaming)."""
+        if self._continuing:
+            return NEXT_ITEMS_PAGE_PREFIX
+        return GROUP_ITEMS_PAGE_PREFIX if self.group_id else ITEMS_PAGE_PREFIX
+
+    def first(self) -> tuple[str, dict]:
+        self._continuing = False
+        variables = {"boardId": self.board_id}
+        if self.rules:
+            variables["rules"] = self.rules
+        if self.group_id:
+            variables["groupId"] = self.group_id
+        return self._query(rules=bool(self.rules)), self._with_options(variables)
+
+    def next(self, cursor: str) -> tuple[str, dict]:
+        """
+        Página seguinte, pela raiz `next_items_page`: o cursor já guarda o quadro,
+        o grupo e as regras, então só o `limit` e as colunas são reenviados.
+        """
+        self._continuing = True
+        query = build_next_items_page_query(columns=bool(self.column_ids), subitems=self.subitems, values=self.values)
+        return query, self._with_options({"cursor": cursor})
+
+    def read(self, response_data: dict) -> tuple[list, str | None]:
+        """Itens e cursor da próxima página de uma resposta desta requisição."""
+        if "next_items_page" in response_data:
+            page_data = response_data["next_items_page"] or {}
+            return page_data.get("items", []) or [], page_data.get("cursor")
+        if self.group_id:
+            groups = (response_data.get("boards") or [{}])[0].get("groups") or [{}]
+            return _read_page({"boards": [groups[0]]})
+        return _read_page(response_data)
+
+    def _query(self, rules: bool) -> str:
+        if self.column_ids or self.group_id or not self.subitems or self.values:
+            return build_items_page_query(rules=rules, columns=bool(self.column_ids), group=bool(self.group_id),
+                                          subitems=self.subitems, values=self.values)
+        return QUERY_INITIAL_REQUEST if rules else QUERY_PAGINATED_REQUEST
+
+    def _with_options(self, variables: dict) -> dict:
+        if self.page_size is not None:
+            variables["limit"] = self.observer.limit if self.observer else self.page_size
+        if self.column_ids:
+            variables["columnIds"] = self.column_ids
+        return variables
+
+def _prepare_requests(board_id: str, subsetor: str, filtrar_por_data: bool, column_name: str, init_date: str,
+                      end_date: str, rules: list = None, colunas: list[str] = None,
+                      grupos: list[str] = None, tamanho_pagina: int | str = None,
+                      subitens: str = SUBITEMS_INLINE, valores_brutos: bool = False) -> list[_ItemsPageRequest]:
+    """
+    Monta as requisições da extração: filtro de data, regras extras, projeção de
+    colunas, tamanho de página e uma requisição por grupo (ou uma só, para o quadro inteiro).
+    O mapa de colunas e os grupos vêm de uma única chamada (`get_board_setup`).
+    """
+    page_size = page_size_option(tamanho_pagina)
+    subitems = subitems_mode(subitens) == SUBITEMS_INLINE
+    setup = get_board_setup(board_id, subsetor if filtrar_por_data or colunas else None, grupos)
+    mapper = setup.mapper
+    rules = list(rules or [])
+    if filtrar_por_data:
+        rules += _build_date_rules(mapper, column_name, init_date, end_date)
         logging.info(f"Filtro de data ativado. Buscando primeira página COM FILTRO...")
-        # Chamada API
-        response_data = call_monday_api(QUERY_INITIAL_REQUEST, variables)
+    elif rules:
+        logging.info("Busca com regras do items_page. Buscando primeira página...")
     else:
         logging.info("Busca SEM FILTRO. Buscando primeira página...")
-        # Chamada API
-        response_data = call_monday_api(QUERY_PAGINATED_REQUEST, variables)
 
-    page_data = response_data.get("boards", [{}])[0].get("items_page", {})
-    items = page_data.get("items", [])
-    if items:
-        all_items.extend(items)
-    
-    cursor = page_data.get("cursor")
-    logging.info(f"Primeira página buscada. Itens até agora: {len(all_items)}. Contém mais items? - {"Sim" if bool(cursor)==True else "Não"}")
+    column_ids = _resolve_column_ids(mapper, colunas) if colunas else None
+    group_ids = _resolve_group_ids(grupos, setup.group_ids) if grupos else [None]
+    return [_ItemsPageRequest(board_id, rules, column_ids, group_id, page_size, subitems, valores_brutos)
+            for group_id in group_ids]
 
-    while cursor is not None:
+def _resolve_group_ids(grupos: list[str] | str, ids_por_nome: dict[str, str]) -> list[str]:
+    """IDs dos grupos (de `BoardSetup.group_ids`), sem repetições."""
+    if isinstance(grupos, str):
+        grupos = [grupos]
+    group_ids = list(dict.fromkeys(ids_por_nome.values()))
+    logging.info(f"Filtro de grupo no servidor: {', '.join(grupos)} ({', '.join(group_ids)}).")
+    return group_ids
 
-        variables_paginadas = {
-            "boardId": board_id,
-            "cursor": cursor
-        }
+def _resolve_column_ids(mapper: ColunaIDMapper, colunas: list[str]) -> list[str]:
+    """Converte os títulos das colunas em IDs (via `ColunaIDMapper`), sem repetições."""
+    if isinstance(colunas, str):
+        colunas = [colunas]
+    column_ids = list(dict.fromkeys(mapper.get_id(titulo) for titulo in colunas))
+    logging.info(f"Projeção de colunas: {len(column_ids)} coluna(s) por item ({', '.join(column_ids)}).")
+    return column_ids
 
-        # Chamada API
-        response_data = call_monday_api(QUERY_PAGINATED_REQUEST, variables_paginadas)
+@log_api_errors
+async def aextrair_dados_paginados(board_id: str,
+                                   subsetor: str,
+                                   filtrar_por_data: bool = True,
+                                   column_name: str = None,
+                                   init_date: str = None,
+                                   end_date: str = None,
+                                   deadline: float = None,
+                                   colunas: list[str] = None,
+                                   grupos: list[str] = None,
+                                   tamanho_pagina: int | str = None,
+                                   subitens: str = "inline", subitens_paralelos: int = 1,
+                                   valores_brutos: bool = False) -> list:
+    """
+    Versão assíncrona de `extrair_dados_paginados`, com os mesmos parâmetros
+    e o mesmo retorno.
+
+    As páginas de um mesmo quadro continuam sendo buscadas em sequência (cada
+    cursor depende da página anterior), mas o event loop fica livre para
+    extrair outros quadros ao mesmo tempo:
+
+        resultados = await asyncio.gather(
+            aextrair_dados_paginados("8585814551", "CRI", column_name="Prazo Inicial"),
+            aextrair_dados_paginados("8235017384", "ARQ", column_name="Data de Entrega"),
+        )
+    """
+    all_items = [item async for item in _aiter_items_paginados(board_id, subsetor, filtrar_por_data, column_name,
+                                                               init_date, end_date, deadline, colunas=colunas,
+                                                               grupos=grupos, tamanho_pagina=tamanho_pagina,
+                                                               subitens=subitens,
+                                                               subitens_paralelos=subitens_paralelos,
+                                                               valores_brutos=valores_brutos)]
+    logging.info(f"Quadro {board_id}: busca concluída com {len(all_items)} itens.")
+    return all_items
+
+@log_api_errors
+async def aiter_items_paginados(board_id: str,
+                                subsetor: str,
+                                filtrar_por_data: bool = True,
+                                column_name: str = None,
+                                init_date: str = None,
+                                end_date: str = None,
+                                deadline: float = None,
+                                por_pagina: bool = False,
+                                colunas: list[str] = None,
+                                grupos: list[str] = None,
+                                tamanho_pagina: int | str = None,
+                                subitens: str = "inline", subitens_paralelos: int = 1,
+                                valores_brutos: bool = False) -> AsyncIterator[dict] | AsyncIterator[list]:
+    """
+    Versão assíncrona de `iter_items_paginados`:
+
+        async for item in aiter_items_paginados("8585814551", "CRI", column_name="Prazo Inicial"):
+            ...
+    """
+    async for value in _aiter_items_paginados(board_id, subsetor, filtrar_por_data, column_name, init_date, end_date,
+                                              deadline, por_pagina, colunas=colunas, grupos=grupos,
+                                              tamanho_pagina=tamanho_pagina, subitens=subitens,
+                                              subitens_paralelos=subitens_paralelos, valores_brutos=valores_brutos):
+        yield value
+
+async def _aiter_items_paginados(board_id: str, subsetor: str, filtrar_por_data: bool, column_name: str,
+                                 init_date: str, end_date: str, deadline: float, por_pagina: bool = False,
+                                 colunas: list[str] = None, grupos: list[str] = None,
+                                 tamanho_pagina: int | str = None,
+                                 subitens: str = "inline", subitens_paralelos: int = 1,
+                                 valores_brutos: bool = False):
+    """Gerador assíncrono comum a `aextrair_dados_paginados` e `aiter_items_paginados`."""
+    prazo = Deadline(deadline) if deadline is not None else None
+    # O mapper e a busca dos grupos podem precisar de chamadas síncronas à API; rodam fora do event loop
+    requests = await asyncio.to_thread(_prepare_requests, board_id, subsetor, filtrar_por_data, column_name,
+                                       init_date, end_date, colunas=colunas, grupos=grupos,
+                                       tamanho_pagina=tamanho_pagina, subitens=subitens,
+                                       valores_brutos=valores_brutos)
+    deferred = subitens == SUBITEMS_DEFERRED
+
+    page = 0
+    total = 0
+    for request in requests:
+        query, variables = request.first()
+        while True:
+            page += 1
+            with call_context(page=page, observer=request.observer):
+                response_data = await acall_monday_api(query, variables, deadline=prazo)
+
+            items, cursor = request.read(response_data)
+            if deferred:
+                with call_context(page=page):
+                    attach_subitems(items, await afetch_subitems([item["id"] for item in items], subitens_paralelos,
+                                                                 prazo, valores_brutos))
+            total += len(items)
+            if por_pagina:
+                yield items
+            else:
+                for item in items:
+                    yield item
+
+            logging.info(f"Quadro {board_id}: itens até agora: {total}. Contém mais items? - {'Sim' if cursor else 'Não'}")
+            if cursor is None:
+                break
+
+            query, variables = request.next(cursor)
+
+@log_api_errors
+def extrair_dados_por_janelas(board_id: str,
+                              subsetor: str,
+                              column_name: str,
+                              init_date: str = None,
+                              end_date: str = None,
+                              janela_dias: int = 7,
+                              max_paginas_janela: int = 20,
+                              deadline: float = None,
+                              colunas: list[str] = None,
+                              grupos: list[str] = None,
+                              tamanho_pagina: int | str = None,
+                              subitens: str = "inline", subitens_paralelos: int = 1,
+                              valores_brutos: bool = False) -> list:
+    """
+    Extração com filtro de data dividida em janelas buscadas em paralelo.
+
+    O intervalo `[init_date, end_date]` é dividido em janelas de `janela_dias`
+    dias, e cada janela tem a sua própria regra 'between' e o seu próprio
+    cursor. As janelas são buscadas ao mesmo tempo pelo cliente assíncrono
+    compartilhado, respeitando o limite de concorrência (`HTTP_MAX_CONCURRENCY`)
+    e o orçamento de complexidade do processo.
+
+    Uma janela que passar de `max_paginas_janela` páginas deixa de ser
+    paginada e é dividida ao meio (recursivamente, até 1 dia), para que
+    nenhuma janela muito cheia vire o gargalo da extração. Os itens já lidos
+    da janela continuam no resultado.
+
+    O resultado é a lista de itens de todas as janelas, em ordem de data das
+    janelas e sem itens repetidos (deduplicado pelo `id`).
+
+    Com `grupos`, cada janela é buscada em cada grupo (uma tarefa por janela e grupo).
+
+    Com `tamanho_pagina="auto"`, todas as janelas compartilham o mesmo ajuste
+    adaptativo do tamanho de página. Com `subitens="deferred"`, os subitens de
+    todos os itens encontrados são buscados no fim, em lotes de `items(ids:)`
+    (`subitens_paralelos` lotes ao mesmo tempo).
 
-        page_data = response_data.get("boards", [{}])[0].get("items_page", {})
-        if not page_data:
-            break
+    Recebe os mesmos parâmetros de data (e `colunas`, `grupos`, `tamanho_pagina`, `subitens`, `valores_brutos`)
+    de `extrair_dados_paginados`,
+    com o filtro de data sempre ativo, e:
+        janela_dias= tamanho de cada janela em dias -> int
+        max_paginas_janela= páginas a partir das quais a janela é dividida -> int
 
-        items = page_data.get("items", [])
-        if items:
-            all_items.extend(items)
-        
-        cursor = page_data.get("cursor")
+    Não pode ser chamada de dentro de um event loop em execução; nesse caso
+    use `aextrair_dados_por_janelas`.
+    """
+    # Importado aqui: a extração síncrona não carrega o httpx
+    from ..api_client.async_client import run_closing_async_client
+    return run_closing_async_client(_aextrair_dados_por_janelas(board_id, subsetor, column_name, init_date, end_date,
+                                                                janela_dias, max_paginas_janela, deadline, colunas,
+                                                                grupos, tamanho_pagina, subitens, subitens_paralelos,
+                                                                valores_brutos))
+
+@log_api_errors
+async def aextrair_dados_por_janelas(board_id: str,
+                                     subsetor: str,
+                                     column_name: str,
+                                     init_date: str = None,
+                                     end_date: str = None,
+                                     janela_dias: int = 7,
+                                     max_paginas_janela: int = 20,
+                                     deadline: float = None,
+                                     colunas: list[str] = None,
+                                     grupos: list[str] = None,
+                                     tamanho_pagina: int | str = None,
+                                     subitens: str = "inline", subitens_paralelos: int = 1,
+                                     valores_brutos: bool = False) -> list:
+    """Versão assíncrona de `extrair_dados_por_janelas`, com os mesmos parâmetros e retorno."""
+    return await _aextrair_dados_por_janelas(board_id, subsetor, column_name, init_date, end_date,
+                                             janela_dias, max_paginas_janela, deadline, colunas, grupos,
+                                             tamanho_pagina, subitens, subitens_paralelos, valores_brutos)
+
+async def _aextrair_dados_por_janelas(board_id: str, subsetor: str, column_name: str, init_date: str, end_date: str,
+                                      janela_dias: int, max_paginas_janela: int, deadline: float,
+                                      colunas: list[str] = None, grupos: list[str] = None,
+                                      tamanho_pagina: int | str = None,
+                                      subitens: str = "inline", subitens_paralelos: int = 1,
+                                      valores_brutos: bool = False) -> list:
+    if janela_dias < 1:
+        raise ValueError("janela_dias deve ser maior ou igual a 1.")
+    if init_date is None and end_date is None:
+        init_date, end_date = get_date()
+    if not (init_date and end_date):
+        raise ValueError("Informe init_date e end_date (ou nenhum dos dois, para usar o mês anterior).")
+
+    prazo = Deadline(deadline) if deadline is not None else None
+    page_size = page_size_option(tamanho_pagina)
+    subitems = subitems_mode(subitens) == SUBITEMS_INLINE
+    # Mapa de colunas e grupos em uma única chamada (síncrona, fora do event loop)
+    setup = await asyncio.to_thread(get_board_setup, board_id, subsetor, grupos)
+    mapper = setup.mapper
+    # Valida a coluna de data e resolve a projeção uma vez, antes de disparar as janelas
+    _build_date_rules(mapper, column_name, init_date, end_date)
+    column_ids = _resolve_column_ids(mapper, colunas) if colunas else None
+    group_ids = _resolve_group_ids(grupos, setup.group_ids) if grupos else [None]
+
+    janelas = _split_date_range(date.fromisoformat(init_date), date.fromisoformat(end_date), janela_dias)
+    logging.info(f"Quadro {board_id}: {init_date} a {end_date} dividido em {len(janelas)} janela(s) de até {janela_dias} dia(s).")
+
+    resultados = await asyncio.gather(*(
+        _aextrair_janela(board_id, mapper, column_name, inicio, fim, max_paginas_janela, prazo, column_ids, group_id,
+                         page_size, subitems, valores_brutos)
+        for inicio, fim in janelas
+        for group_id in group_ids
+    ))
+
+    # Deduplica pelo id mantendo a ordem das janelas
+    unicos = {}
+    for items in resultados:
+        for item in items:
+            unicos.setdefault(item["id"], item)
+
+    if subitens == SUBITEMS_DEFERRED:
+        attach_subitems(unicos.values(), await afetch_subitems(list(unicos), subitens_paralelos, prazo, valores_brutos))
+
+    logging.info(f"Quadro {board_id}: busca por janelas concluída. Total de itens encontrados: {len(unicos)}.")
+    return list(unicos.values())
+
+async def _aextrair_janela(board_id: str, mapper: ColunaIDMapper, column_name: str, inicio: date, fim: date,
+                           max_paginas: int, prazo: Deadline, column_ids: list[str] = None,
+                           group_id: str = None, page_size: int | PageSizeController = None,
+                           subitems: bool = True, values: bool = False) -> list:
+    """
+    Busca todas as páginas de uma janela; divide a janela ao meio se ela passar de `max_paginas`.
+    Na divisão, os itens já lidos são mantidos e vêm antes dos das metades (que também os trazem:
+    quem chama deduplica pelo `id`).
+    """
+    request = _ItemsPageRequest(board_id, _build_date_rules(mapper, column_name, inicio.isoformat(), fim.isoformat()),
+                                column_ids, group_id, page_size, subitems, values)
+    query, variables = request.first()
+    janela = f"{inicio}..{fim}"
+    items = []
+    page = 0
+    while True:
+        page += 1
+        with call_context(page=page, janela=janela, observer=request.observer):
+            response_data = await acall_monday_api(query, variables, deadline=prazo)
+
+        page_items, cursor = request.read(response_data)
+        items.extend(page_items)
         if cursor is None:
-            break
+            return items
 
-        logging.info(f"Itens até agora: {len(all_items)}. Contém mais items? - Sim")
+        if page >= max_paginas and fim > inicio:
+            # Janela cheia demais: as metades são buscadas em paralelo (e podem ser divididas de novo)
+            meio = inicio + (fim - inicio) // 2
+            logging.info(f"Quadro {board_id}: janela {janela} passou de {max_paginas} páginas; dividindo em duas.")
+            primeira, segunda = await asyncio.gather(
+                _aextrair_janela(board_id, mapper, column_name, inicio, meio, max_paginas, prazo, column_ids,
+                                 group_id, page_size, subitems, values),
+                _aextrair_janela(board_id, mapper, column_name, meio + timedelta(days=1), fim, max_paginas, prazo,
+                                 column_ids, group_id, page_size, subitems, values),
+            )
+            return items + primeira + segunda
 
-    if all_items:
-        logging.info(f"Busca concluída. Total de itens encontrados: {len(all_items)}. Contém mais items? - Não")
-    return all_items
\ No newline at end of file
+        query, variables = request.next(cursor)
+
+def _split_date_range(inicio: date, fim: date, dias: int) -> list[tuple[date, date]]:
+    """Divide `[inicio, fim]` (inclusivo) em janelas consecutivas de até `dias` dias."""
+    if fim < inicio:
+        raise ValueError(f"Data final ({fim}) anterior à data inicial ({inicio}).")
+    janelas = []
+    while inicio <= fim:
+        fim_janela = min(inicio + timedelta(days=dias - 1), fim)
+        janelas.append((inicio, fim_janela))
+        inicio = fim_janela + timedelta(days=1)
+    return janelas
+
+def _build_date_rules(mapper: ColunaIDMapper, column_name: str, init_date: str = None, end_date: str = None) -> list:
+    """Monta a regra 'between' do items_page para a coluna de data informada."""
+    if init_date is None and end_date is None:
+        init_date, end_date = get_date()
+    if not column_name:
+        raise Exception("Não foi passado o Nome da Coluna de Data a ser filtrada.")
+
+    id_date_col = mapper.get_id(column_name)
+
+    return [{
+        "column_id": id_date_col,
+        "compare_value": [init_date, end_date],
+        "operator": "between"
+    }]
+
+def _read_page(response_data: dict) -> tuple[list, str | None]:
+    """Extrai a lista de itens e o cursor da próxima página de uma resposta do items_page."""
+    page_data = response_data.get("boards", [{}])[0].get("items_page", {})
+    if not page_data:
+        return [], None
+    return page_data.get("items", []) or [], page_data.get("cursor")
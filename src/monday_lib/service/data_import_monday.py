@@ -1,9 +1,12 @@
 import pandas as pd
 import json
 import time
+import asyncio
 import logging
-from ..api_client.call_api import call_monday_api, APITimeoutError, APIError
-from .get_board_item_count import get_board_item_count
+from ..api_client.call_api import call_monday_api, acall_monday_api, APITimeoutError, APIError
+from .get_board_item_count import read_item_count
+from ..queries.templates import QUERY_BOARD_ITEM_COUNT
+from .board_setup_monday import get_board_setup
 from ..mapper.column_map import ColunaIDMapper
 from ..utils.formatters import DEFAULT_FORMATTER, COLUMN_FORMATTERS, ID_SPECIFIC_FORMATTERS
 from ..utils.decorators import log_api_errors
@@ -92,7 +95,8 @@ def create_items_in_group(board_id: int,
                           column_map: dict = None) -> dict: 
     """
     Cria múltiplos itens em um grupo em lotes (batches) para otimizar a performance,
-    respeitando os limites da API e pausando entre os lotes.
+    respeitando os limites da API. O ritmo entre os lotes é controlado pelo
+    orçamento de complexidade compartilhado do cliente (`ComplexityBudget`).
 
     Args:
         board_id: ID do quadro onde os itens serão criados.
@@ -112,11 +116,56 @@ def create_items_in_group(board_id: int,
 
     logging.info(f"Iniciando upload de {len(df)} itens em lotes de {batch_size} para o grupo '{group_id}'...")
     
-    # Prepara o mapper e o mapa de colunas uma única vez
-    mapper = ColunaIDMapper(board_id, board_name)
-    auto_map, item_name_col = _build_auto_column_map(df, mapper, column_map or {})
-    
-    # Prepara as listas de resultados
+    # Prepara o mapper e o mapa de colunas uma única vez (com a contagem inicial, na mesma chamada)
+    setup = get_board_setup(board_id, board_name, contagem=True)
+    auto_map, item_name_col = _build_auto_column_map(df, setup.mapper, column_map or {})
+
+    steps = _upload_batches(df, board_id, group_id, auto_map, item_name_col, setup.mapper, batch_size, setup.item_count)
+    return _run_upload(steps, call_monday_api)
+
+@log_api_errors
+async def acreate_items_in_group(board_id: int,
+                                 group_id: str,
+                                 df: pd.DataFrame,
+                                 board_name: str,
+                                 batch_size: int = 100,
+                                 column_map: dict = None) -> dict:
+    """
+    Versão assíncrona de `create_items_in_group`, com os mesmos parâmetros
+    e o mesmo resumo de retorno.
+
+    Os lotes de um mesmo upload continuam em sequência, mas a espera por
+    orçamento de complexidade não bloqueia o event loop, que fica livre para
+    outras extrações/importações no mesmo processo.
+    """
+    if df.empty or len(df.columns) == 0:
+        raise ValueError("O DataFrame está vazio ou não possui colunas.")
+
+    logging.info(f"Iniciando upload de {len(df)} itens em lotes de {batch_size} para o grupo '{group_id}'...")
+
+    # O mapper e a contagem inicial vêm de uma chamada síncrona à API; roda fora do event loop
+    setup = await asyncio.to_thread(get_board_setup, board_id, board_name, contagem=True)
+    auto_map, item_name_col = _build_auto_column_map(df, setup.mapper, column_map or {})
+
+    steps = _upload_batches(df, board_id, group_id, auto_map, item_name_col, setup.mapper, batch_size, setup.item_count)
+    return await _arun_upload(steps, acall_monday_api)
+
+def _upload_batches(df: pd.DataFrame,
+                    board_id: int,
+                    group_id: str,
+                    auto_map: dict,
+                    item_name_col: str,
+                    mapper: ColunaIDMapper,
+                    batch_size: int,
+                    initial_count: int):
+    """
+    Lotes do upload, comuns a `create_items_in_group` e `acreate_items_in_group`.
+
+    Não chama a API: gera a (query, variáveis) de cada chamada e recebe de volta
+    a resposta (`send`) ou o erro (`throw`), ver `_run_upload` e `_arun_upload`.
+    Lotes com Timeout (504) levam à verificação final da contagem de itens do
+    quadro (comparada com `initial_count`). Retorna o resumo do upload.
+    """
     created_item_ids = []
     batches_with_504_timeout = []
     failed_critical_batches = []
@@ -126,19 +175,19 @@ def create_items_in_group(board_id: int,
 
     for i, batch_df in enumerate(list_of_batches):
         batch_start_time = time.monotonic()
-        
+
         try:
             full_mutation_str, batch_vars = _prepare_batch_request(batch_df, board_id, group_id, auto_map, item_name_col, mapper)
-            
+
             logging.info(f"Enviando lote {i+1}/{total_batches} com {len(batch_df)} itens...")
-            response_data = call_monday_api(full_mutation_str, batch_vars)
-            
+            response_data = yield full_mutation_str, batch_vars
+
             for item_alias, result in response_data.items():
                 if result and 'id' in result:
                     created_item_ids.append(result['id'])
 
             # --- exception da chamada api ---
-        except APITimeoutError as e:
+        except APITimeoutError:
             logging.warning(f"Lote {i+1} encontrou um Timeout (504). Os itens podem ter sido criados. Verificação será feita no final.")
             batches_with_504_timeout.append({"batch_number": i+1, "item_count": len(batch_df)})
 
@@ -146,46 +195,78 @@ def create_items_in_group(board_id: int,
         except APIError as e:
             logging.error(f"Falha crítica no lote {i+1}. O lote não foi processado.")
             failed_critical_batches.append({"batch_number": i+1, "error": str(e), "item_count": len(batch_df)})
-            
+
             # ----- TERMINO DA CHAMADA API -----
-        # Pausa dinâmica
-        if i < total_batches - 1:
-            batch_duration = time.monotonic() - batch_start_time
-            pause_duration = 60 - batch_duration
-            if pause_duration > 0:
-                logging.info(f"Lote processado em {batch_duration:.2f}s. Pausando por {pause_duration:.2f}s...")
-                time.sleep(pause_duration)
-            else:
-                logging.info(f"Lote processado em {batch_duration:.2f}s. Prosseguindo imediatamente.")
+        # O próximo lote só é admitido quando houver orçamento de complexidade (ver ComplexityBudget)
+        batch_duration = time.monotonic() - batch_start_time
+        logging.info(f"Lote processado em {batch_duration:.2f}s.")
 
     # --- VERIFICAÇÃO PÓS-EXECUÇÃO ---
-    try:
-        total_items_failed_in_504 = 0
-        if batches_with_504_timeout:
-            logging.info("\n--- Verificando a quantidade de itens recebidos pelo Monday (erros: 504) ---")
-            
-            # Conta quantos itens deveriam ter sido criados nos lotes que NÃO falharam criticamente
-            items_in_critical_failed_batches = sum(batch['item_count'] for batch in failed_critical_batches)
-            
-            # Chama a API para ver quantos itens realmente existem no grupo agora
-            items_on_monday = get_board_item_count(board_id)
-            
-            total_items_failed_in_504 = len(df) - items_on_monday - items_in_critical_failed_batches
-            
-            if total_items_failed_in_504 > 0:
-                logging.error(f"Verificação indica que {total_items_failed_in_504} itens de lotes com Timeout (504) realmente não foram criados.")
-            else:
-                logging.info("Verificação indica que todos os itens foram criados com SUCESSO no Monday.")
-                total_items_failed_in_504 = 0
-
-        total_failed_critical = sum(batch['item_count'] for batch in failed_critical_batches)
-        total_failed = total_failed_critical + total_items_failed_in_504
-
-    except Exception:
-        logging.error(f"Erro na verificação de quantidade de itens recebidos.")
-        raise
-             
-    
+    items_on_monday = None
+    if batches_with_504_timeout:
+        logging.info("\n--- Verificando a quantidade de itens recebidos pelo Monday (erros: 504) ---")
+        try:
+            # Chama a API para ver quantos itens o upload realmente criou no quadro
+            response_data = yield QUERY_BOARD_ITEM_COUNT, {"boardId": board_id}
+        except Exception:
+            logging.error(f"Erro na verificação de quantidade de itens recebidos.")
+            raise
+        items_on_monday = read_item_count(response_data) - initial_count
+
+    return _build_upload_summary(df, created_item_ids, batches_with_504_timeout, failed_critical_batches, items_on_monday)
+
+def _run_upload(steps, call) -> dict:
+    """Faz as chamadas de `_upload_batches` com `call` (ex: `call_monday_api`) e retorna o resumo."""
+    send, value = steps.send, None
+    while True:
+        try:
+            query, variables = send(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            send, value = steps.send, call(query, variables)
+        except Exception as e:
+            send, value = steps.throw, e
+
+async def _arun_upload(steps, acall) -> dict:
+    """Versão assíncrona de `_run_upload` (ex: com `acall_monday_api`)."""
+    send, value = steps.send, None
+    while True:
+        try:
+            query, variables = send(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            send, value = steps.send, await acall(query, variables)
+        except Exception as e:
+            send, value = steps.throw, e
+
+def _build_upload_summary(df: pd.DataFrame,
+                          created_item_ids: list,
+                          batches_with_504_timeout: list,
+                          failed_critical_batches: list,
+                          items_on_monday: int = None) -> dict:
+    """
+    Monta o resumo do upload. Se houve lotes com Timeout (504), usa o número de
+    itens criados no quadro durante o upload (`items_on_monday`, contagem final
+    menos a inicial) para descobrir quantos não foram criados.
+    """
+    total_items_failed_in_504 = 0
+    if batches_with_504_timeout:
+        # Conta quantos itens deveriam ter sido criados nos lotes que NÃO falharam criticamente
+        items_in_critical_failed_batches = sum(batch['item_count'] for batch in failed_critical_batches)
+
+        total_items_failed_in_504 = len(df) - items_on_monday - items_in_critical_failed_batches
+
+        if total_items_failed_in_504 > 0:
+            logging.error(f"Verificação indica que {total_items_failed_in_504} itens de lotes com Timeout (504) realmente não foram criados.")
+        else:
+            logging.info("Verificação indica que todos os itens foram criados com SUCESSO no Monday.")
+            total_items_failed_in_504 = 0
+
+    total_failed_critical = sum(batch['item_count'] for batch in failed_critical_batches)
+    total_failed = total_failed_critical + total_items_failed_in_504
+
     summary = {
         "total_rows": len(df),
         "success_count": len(df) - total_failed,
@@ -198,4 +279,4 @@ def create_items_in_group(board_id: int,
     }
     
     logging.info(f"Upload concluído. {summary['success_count']} itens criados, {summary['failed_count']} falhas, {summary['critical_erros_count']} erros criticos.")
-    return summary
\ No newline at end of file
+    return summary
@@ -24,6 +24,7 @@ def delete_monday_group(board_id: int, group_id: str) -> bool:
             "groupId": group_id
         }
         
+        # A mutation invalida os grupos do quadro no cache do cliente
         response_data = call_monday_api(QUERY_DELETE_GROUP, variables)
         
         # Verificação da resposta para confirmar a exclusão
@@ -0,0 +1,225 @@
+import os
+import json
+import pickle
+import logging
+from datetime import datetime, timezone
+from ..utils.decorators import log_api_errors
+from ..utils.get_last_date import get_date
+from ..infra.settings import get_settings
+from ..mapper.column_map import ColunaIDMapper
+from ..api_client.call_api import call_monday_api
+from ..queries.templates import QUERY_GET_ACTIVITY_LOGS
+from .data_export_monday import _iter_items_paginados, _build_date_rules
+
+# Coluna interna do Monday com a data da última alteração do item
+LAST_UPDATED_COLUMN = "__last_updated__"
+# Eventos do activity log que tiram um item do quadro
+REMOVAL_EVENTS = {"delete_pulse", "archive_pulse", "move_pulse_from_board"}
+# Evento de item movido para outro grupo do mesmo quadro
+GROUP_MOVE_EVENT = "move_pulse_into_group"
+# Eventos que tiram um grupo inteiro (com os seus itens) do quadro
+GROUP_REMOVAL_EVENTS = {"delete_group", "archive_group"}
+ACTIVITY_LOGS_PAGE_SIZE = 1000
+
+
+@log_api_errors
+def extrair_dados_incrementais(board_id: str,
+                               subsetor: str,
+                               filtrar_por_data: bool = False,
+                               column_name: str = None,
+                               init_date: str = None,
+                               end_date: str = None,
+                               completo: bool = False,
+                               deadline: float = None,
+                               colunas: list[str] = None,
+                               grupos: list[str] = None,
+                               tamanho_pagina: int | str = None,
+                               subitens: str = "inline",
+                               subitens_paralelos: int = 1,
+                               valores_brutos: bool = False) -> list:
+    """
+    Extração incremental: busca apenas os itens alterados desde a última execução.
+
+    Na primeira execução (ou com `completo=True`) o quadro é extraído inteiro,
+    como em `extrair_dados_paginados`. O resultado e a marca d'água (data/hora
+    em que a extração começou) ficam salvos em
+    `PERSIST_PATH/<subsetor>/<board_id>_incremental.pkl`.
+
+    Nas execuções seguintes:
+      - busca só os itens com `__last_updated__` a partir do dia da marca d'água
+        (itens novos e alterados);
+      - consulta o activity log do quadro desde a marca d'água e remove os
+        itens excluídos, arquivados ou movidos para outro quadro (e, com
+        `grupos`, os movidos para um grupo fora do filtro);
+      - se um grupo foi excluído ou arquivado (um dos `grupos`, ou qualquer
+        grupo quando não há filtro de grupo), refaz a extração completa, pois
+        o activity log não lista os itens que saíram com ele. Se o grupo era
+        um dos `grupos`, a busca falha com ValueError (grupo não encontrado),
+        como em `extrair_dados_paginados`, e o resultado salvo não muda até
+        que o filtro seja corrigido;
+      - com `filtrar_por_data=True`, remove os itens cuja data saiu do período;
+      - mescla tudo no resultado salvo e atualiza a marca d'água.
+
+    O custo de cada execução é proporcional ao número de alterações, e não ao
+    tamanho do quadro. Se o período (`init_date`/`end_date`/`column_name`), as
+    `colunas`, os `grupos`, o modo de `subitens` ou `valores_brutos` mudarem em relação à execução anterior, a extração completa é refeita.
+
+    OBS: alterar um subitem nem sempre atualiza o `__last_updated__` do item pai;
+    use `completo=True` periodicamente se os subitens forem importantes.
+
+    Recebe os mesmos parâmetros de `extrair_dados_paginados`, mais:
+        completo= ignora a marca d'água e refaz a extração completa -> bool
+
+    Retorna a lista completa e atualizada de itens (no mesmo formato de
+    `extrair_dados_paginados`).
+    """
+    if filtrar_por_data and init_date is None and end_date is None:
+        init_date, end_date = get_date()
+    if colunas and filtrar_por_data and column_name not in colunas:
+        # A coluna de data é necessária para tirar do resultado os itens que saíram do período
+        colunas = [*colunas, column_name]
+    params = {"filtrar_por_data": filtrar_por_data, "column_name": column_name,
+              "init_date": init_date, "end_date": end_date, "colunas": colunas,
+              "grupos": [grupos] if isinstance(grupos, str) else grupos, "subitens": subitens,
+              "valores_brutos": valores_brutos}
+
+    state_path = get_settings().PERSIST_PATH / subsetor / f"{board_id}_incremental.pkl"
+    state = None if completo else _load_state(state_path)
+    if state is not None and state["params"] != params:
+        logging.info(f"Quadro {board_id}: período de extração mudou desde a última execução; refazendo a extração completa.")
+        state = None
+
+    # A marca d'água é o início desta execução: alterações feitas durante a busca entram na próxima
+    inicio = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    items = None
+    if state is not None:
+        items = state["items"]
+        if not _apply_changes(items, board_id, subsetor, params, state["watermark"], deadline, tamanho_pagina,
+                              subitens_paralelos):
+            logging.info(f"Quadro {board_id}: grupo excluído ou arquivado desde a última execução; "
+                         f"refazendo a extração completa.")
+            items = None
+
+    if items is None:
+        if state is None:
+            logging.info(f"Quadro {board_id}: extração incremental sem marca d'água salva; buscando o quadro inteiro...")
+        items = {item["id"]: item for item in _iter_items_paginados(board_id, subsetor, filtrar_por_data, column_name,
+                                                                      init_date, end_date, deadline, False,
+                                                                      colunas=colunas, grupos=params["grupos"],
+                                                                      tamanho_pagina=tamanho_pagina, subitens=subitens,
+                                                                      subitens_paralelos=subitens_paralelos,
+                                                                      valores_brutos=valores_brutos)}
+
+    _save_state(state_path, {"watermark": inicio, "params": params, "items": items})
+    logging.info(f"Quadro {board_id}: extração incremental concluída. Total de itens: {len(items)}. Marca d'água: {inicio}")
+    return list(items.values())
+
+def _apply_changes(items: dict, board_id: str, subsetor: str, params: dict, watermark: str, deadline: float,
+                   tamanho_pagina: int | str = None, subitens_paralelos: int = 1) -> bool:
+    """
+    Mescla em `items` os itens alterados desde `watermark` e remove os excluídos
+    (e, com filtro de grupo, os movidos para fora dos `grupos`).
+    Retorna False, sem alterar `items`, se um grupo acompanhado foi excluído ou
+    arquivado: os itens dele não aparecem no activity log e a extração precisa ser completa.
+    """
+    grupos = params["grupos"]
+    removed_ids, moved_to, removed_groups = _activity_changes(board_id, watermark)
+    if removed_groups and (not grupos or None in removed_groups or removed_groups & set(grupos)):
+        return False
+
+    removidos = 0
+    if grupos:
+        # Itens movidos para um grupo fora do filtro não voltam na busca por alterações
+        for item_id, group_title in moved_to.items():
+            if group_title not in grupos:
+                removidos += items.pop(item_id, None) is not None
+
+    rules = [{
+        "column_id": LAST_UPDATED_COLUMN,
+        "compare_value": ["EXACT", watermark[:10]],
+        "operator": "greater_than_or_equals",
+        "compare_attribute": "UPDATED_AT",
+    }]
+
+    date_col_id = None
+    if params["filtrar_por_data"]:
+        mapper = ColunaIDMapper(board_id, subsetor)
+        date_col_id = _build_date_rules(mapper, params["column_name"], params["init_date"], params["end_date"])[0]["column_id"]
+
+    atualizados = 0
+    for item in _iter_items_paginados(board_id, subsetor, False, None, None, None, deadline, False, rules=rules,
+                                      colunas=params["colunas"], grupos=params["grupos"],
+                                      tamanho_pagina=tamanho_pagina, subitens=params["subitens"],
+                                      subitens_paralelos=subitens_paralelos, valores_brutos=params["valores_brutos"]):
+        if date_col_id and not _in_period(item, date_col_id, params["init_date"], params["end_date"]):
+            removidos += items.pop(item["id"], None) is not None
+            continue
+        items[item["id"]] = item
+        atualizados += 1
+
+    for item_id in removed_ids:
+        removidos += items.pop(item_id, None) is not None
+
+    logging.info(f"Quadro {board_id}: {atualizados} item(ns) novo(s)/alterado(s) e {removidos} removido(s) desde {watermark}.")
+    return True
+
+def _activity_changes(board_id: str, since: str) -> tuple[set, dict, set]:
+    """
+    Alterações do quadro desde `since`, pelo activity log: (IDs dos itens
+    excluídos, arquivados ou movidos para outro quadro, {ID do item movido de
+    grupo: título do grupo de destino}, títulos dos grupos excluídos ou arquivados).
+    """
+    removed, moved_to, removed_groups = set(), {}, set()
+    page = 1
+    while True:
+        response_data = call_monday_api(QUERY_GET_ACTIVITY_LOGS, {
+            "boardId": board_id, "from": since, "page": page, "limit": ACTIVITY_LOGS_PAGE_SIZE,
+        })
+        logs = (response_data.get("boards") or [{}])[0].get("activity_logs") or []
+        for log in logs:
+            event = log.get("event")
+            if event not in REMOVAL_EVENTS and event != GROUP_MOVE_EVENT and event not in GROUP_REMOVAL_EVENTS:
+                continue
+            try:
+                data = json.loads(log.get("data") or "{}")
+            except ValueError:
+                continue
+            if event in GROUP_REMOVAL_EVENTS:
+                removed_groups.add(data.get("group_title"))
+            elif data.get("pulse_id") is None:
+                continue
+            elif event == GROUP_MOVE_EVENT:
+                # O log vem do mais recente para o mais antigo: vale o último destino
+                moved_to.setdefault(str(data["pulse_id"]), (data.get("dest_group") or {}).get("title"))
+            else:
+                removed.add(str(data["pulse_id"]))
+        if len(logs) < ACTIVITY_LOGS_PAGE_SIZE:
+            return removed, moved_to, removed_groups
+        page += 1
+
+def _in_period(item: dict, column_id: str, init_date: str, end_date: str) -> bool:
+    """Se a coluna de data do item está dentro de [init_date, end_date]."""
+    for col in item.get("columns", []):
+        if col.get("id") == column_id:
+            text = (col.get("text") or "")[:10]
+            return bool(text) and init_date <= text <= end_date
+    return False
+
+def _load_state(path) -> dict | None:
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError) as e:
+        logging.warning(f"Estado incremental ilegível em '{path}' ({e}); refazendo a extração completa.")
+        return None
+
+def _save_state(path, state: dict):
+    """Grava o estado de forma atômica (arquivo temporário + os.replace)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
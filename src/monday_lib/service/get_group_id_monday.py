@@ -1,5 +1,5 @@
 import logging
-from ..api_client.call_api import call_monday_api
+from ..api_client.call_api import call_monday_api, acall_monday_api
 from ..queries.templates import QUERY_GET_GROUP_ID
 from ..utils.logger import api_logger
 from ..utils.decorators import log_api_errors
@@ -9,6 +9,11 @@ def get_group_id(board_id: int, group_name: str) -> str | None:
     """
     Busca o ID de um grupo em um quadro específico pelo seu nome.
 
+    Os grupos de cada quadro ficam no cache de respostas do cliente
+    (`get_response_cache()`, operação `getBoardGroups`), invalidado pelas
+    mutations do quadro; um nome que não estiver no cache força uma nova
+    busca na API.
+
     Args:
         board_id: O ID do quadro onde o grupo será procurado.
         group_name: O nome exato (case-sensitive) do grupo a ser encontrado.
@@ -18,23 +23,87 @@ def get_group_id(board_id: int, group_name: str) -> str | None:
     """
     logging.info(f"Buscando ID do grupo '{group_name}' no quadro ID: {board_id}...")
     
+    try:
+        group_id = _board_groups(board_id, [group_name]).get(group_name)
+        return _log_group_lookup(group_id, board_id, group_name)
+
+    except Exception as e:
+        error_message = f"Falha ao buscar grupos para o quadro {board_id}."
+        api_logger.error(f"{error_message} Causa: {e}")
+        raise
+
+@log_api_errors
+async def aget_group_id(board_id: int, group_name: str) -> str | None:
+    """
+    Versão assíncrona de `get_group_id`.
+
+    Args:
+        board_id: O ID do quadro onde o grupo será procurado.
+        group_name: O nome exato (case-sensitive) do grupo a ser encontrado.
+
+    Returns:
+        A string do ID do grupo se encontrado, caso contrário, None.
+    """
+    logging.info(f"Buscando ID do grupo '{group_name}' no quadro ID: {board_id}...")
+
     try:
         variables = {"boardId": board_id}
-        
-        response_data = call_monday_api(QUERY_GET_GROUP_ID, variables)
-        
-        groups_list = response_data.get('boards', [{}])[0].get('groups', [])
-        
-        for group in groups_list:
-            if group.get('title') == group_name:
-                group_id_found = group.get('id')
-                logging.info(f"Grupo '{group_name}' encontrado com o ID: {group_id_found}.")
-                return group_id_found
-        
-        logging.warning(f"Grupo com o nome '{group_name}' não foi encontrado no quadro {board_id}.")
-        return None
+
+        groups = _parse_groups(await acall_monday_api(QUERY_GET_GROUP_ID, variables))
+        if group_name not in groups:
+            groups = _parse_groups(await acall_monday_api(QUERY_GET_GROUP_ID, variables, refresh=True))
+        return _log_group_lookup(groups.get(group_name), board_id, group_name)
 
     except Exception as e:
         error_message = f"Falha ao buscar grupos para o quadro {board_id}."
         api_logger.error(f"{error_message} Causa: {e}")
-        raise
\ No newline at end of file
+        raise
+
+def get_group_ids(board_id: int, group_names: list[str]) -> dict[str, str]:
+    """
+    Converte vários nomes de grupo em IDs (usando os grupos do quadro em cache).
+
+    Args:
+        board_id: O ID do quadro.
+        group_names: Nomes exatos (case-sensitive) dos grupos.
+
+    Returns:
+        Dicionário {nome: id}, na ordem de `group_names`.
+
+    Raises:
+        ValueError: Se algum grupo não existir no quadro.
+    """
+    return _select_groups(board_id, _board_groups(board_id, group_names), group_names)
+
+def _board_groups(board_id: int, required: list[str] = ()) -> dict[str, str]:
+    """Mapa {título: id} dos grupos do quadro; se faltar algum nome de `required`, ignora o cache."""
+    variables = {"boardId": board_id}
+    groups = _parse_groups(call_monday_api(QUERY_GET_GROUP_ID, variables))
+    if not all(name in groups for name in required):
+        # O grupo pode ter sido criado fora da biblioteca depois da resposta em cache
+        groups = _parse_groups(call_monday_api(QUERY_GET_GROUP_ID, variables, refresh=True))
+    return groups
+
+def _select_groups(board_id: int, groups: dict[str, str], group_names: list[str]) -> dict[str, str]:
+    """{nome: id} dos grupos pedidos, na ordem de `group_names`; ValueError se faltar algum."""
+    missing = [name for name in group_names if name not in groups]
+    if missing:
+        raise ValueError(f"Grupo(s) não encontrado(s) no quadro {board_id}: {', '.join(missing)}")
+    return {name: groups[name] for name in group_names}
+
+def _parse_groups(response_data: dict) -> dict[str, str]:
+    """Mapa {título: id} da resposta da query de grupos do quadro."""
+    groups_list = response_data.get('boards', [{}])[0].get('groups', [])
+    groups = {}
+    for group in groups_list:
+        # Títulos repetidos: vale o primeiro, como na busca original
+        groups.setdefault(group.get('title'), group.get('id'))
+    return groups
+
+def _log_group_lookup(group_id: str | None, board_id: int, group_name: str) -> str | None:
+    if group_id is not None:
+        logging.info(f"Grupo '{group_name}' encontrado com o ID: {group_id}.")
+        return group_id
+
+    logging.warning(f"Grupo com o nome '{group_name}' não foi encontrado no quadro {board_id}.")
+    return None
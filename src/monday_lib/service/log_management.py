@@ -3,7 +3,6 @@ import shutil
 from pathlib import Path
 from ..infra.settings import get_settings
 from ..utils.decorators import log_api_errors
-settings = get_settings()
 
 @log_api_errors
 def copy_log_file(destination_path: str) -> bool:
@@ -21,7 +20,7 @@ def copy_log_file(destination_path: str) -> bool:
         Qualquer exceção durante a operação será capturada e logada pelo
         decorador @log_api_errors.
     """
-    source_log_file = settings.LOGS_PATH / "api_errors.log"
+    source_log_file = get_settings().LOGS_PATH / "api_errors.log"
     
     if not source_log_file.is_file():
         logging.warning(f"Arquivo de log de origem não encontrado em: {source_log_file}")
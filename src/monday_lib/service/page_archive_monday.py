@@ -0,0 +1,203 @@
+import os
+import gzip
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+from ..api_client import json_backend
+
+# Formatos do arquivo de páginas -> nome do arquivo na pasta da execução
+ARCHIVE_FILES = {
+    "jsonl": "paginas.jsonl.gz",
+    "arrow": "paginas.arrow",
+}
+MANIFEST_FILE = "manifest.json"
+
+
+class PageArchive:
+    """Arquivo das páginas brutas de uma extração, para reprocessá-las sem chamar a API.
+
+    Fica na pasta da execução (`path`):
+      - `manifest.json`: quadro, subsetor, parâmetros da extração, esquemas de
+        colunas dos itens e dos subitens (`ColunaIDMapper.coluna_map` e
+        `subitem_map`), formato, totais de páginas e
+        itens e se a extração chegou ao fim (`concluido`);
+      - `paginas.jsonl.gz` ("jsonl"): uma linha por página, com a lista de itens
+        exatamente como veio da API (JSON), comprimida com gzip;
+      - `paginas.arrow` ("arrow"): Arrow IPC (compressão zstd), um record batch
+        por página e uma linha por item, com o item em JSON na coluna `item`.
+        Requer `pyarrow`.
+
+    Como os itens são guardados crus, qualquer mudança no achatamento
+    (`ItemFlattener`), na conversão de tipos ou nos filtros pode ser aplicada
+    de novo às mesmas páginas (`pages`, `reprocessar_dados_monday`).
+
+    Args:
+        path: Pasta da execução (criada se não existir).
+
+    Exemplo de Uso:
+        itens = extrair_dados_paginados("8585814551", "CRI", column_name="Prazo Inicial",
+                                        arquivar_em="arquivo/CRI/2025-06")
+        ...
+        for pagina in PageArchive("arquivo/CRI/2025-06").pages():
+            ...
+    """
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+
+    @property
+    def manifest(self) -> dict | None:
+        """Conteúdo do `manifest.json` (None se a pasta ainda não tem um arquivo)."""
+        try:
+            with open(self.path / MANIFEST_FILE, "rb") as f:
+                return json_backend.loads(f.read())
+        except FileNotFoundError:
+            return None
+
+    def record(self, pages: Iterable[list], formato: str = "jsonl", board_id: str = None, subsetor: str = None,
+               params: dict = None, esquema: dict = None, esquema_subitens: dict = None) -> Iterator[list]:
+        """
+        Grava cada página de `pages` conforme ela passa e a entrega em seguida.
+
+        O manifest é gravado no início e atualizado no fim; se a iteração for
+        interrompida (erro ou `close()`), o arquivo fica com as páginas já
+        gravadas e `concluido: false`. Um arquivo concluído não é sobrescrito.
+        """
+        if formato not in ARCHIVE_FILES:
+            raise ValueError(f"formato_arquivo deve ser um de {', '.join(ARCHIVE_FILES)}; recebido: {formato!r}.")
+        previous = self.manifest
+        if previous is not None:
+            if previous.get("concluido"):
+                raise FileExistsError(f"Já existe um arquivo de páginas concluído em '{self.path}'.")
+            logging.warning(f"Arquivo de páginas incompleto em '{self.path}'; gravando por cima.")
+            for name in ARCHIVE_FILES.values():
+                (self.path / name).unlink(missing_ok=True)
+
+        os.makedirs(self.path, exist_ok=True)
+        manifest = {
+            "board_id": str(board_id) if board_id is not None else None, "subsetor": subsetor,
+            "parametros": params or {}, "esquema": esquema or {}, "esquema_subitens": esquema_subitens or {},
+            "formato": formato,
+            "criado_em": datetime.now().isoformat(timespec="seconds"),
+            "paginas": 0, "itens": 0, "concluido": False,
+        }
+        self._save_manifest(manifest)
+
+        writer = _ARCHIVE_WRITERS[formato](self.path / ARCHIVE_FILES[formato])
+        try:
+            for items in pages:
+                items = list(items)
+                writer.write(items)
+                manifest["paginas"] += 1
+                manifest["itens"] += len(items)
+                yield items
+            manifest["concluido"] = True
+        finally:
+            writer.close()
+            self._save_manifest(manifest)
+            logging.info(f"Arquivo de páginas em '{self.path}': {manifest['paginas']} página(s), "
+                         f"{manifest['itens']} item(ns){'' if manifest['concluido'] else ' (incompleto)'}.")
+
+    def pages(self) -> Iterator[list]:
+        """Páginas arquivadas, em ordem (uma lista de itens por página)."""
+        manifest = self.manifest
+        if manifest is None:
+            raise FileNotFoundError(f"Nenhum arquivo de páginas em '{self.path}' ({MANIFEST_FILE} não encontrado).")
+        if not manifest.get("concluido"):
+            logging.warning(f"Arquivo de páginas em '{self.path}' incompleto: a extração não chegou ao fim.")
+        formato = manifest["formato"]
+        yield from _ARCHIVE_READERS[formato](self.path / ARCHIVE_FILES[formato])
+
+    def _save_manifest(self, manifest: dict):
+        """Grava o manifest de forma atômica (arquivo temporário + os.replace)."""
+        tmp_path = self.path / f"{MANIFEST_FILE}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json_backend.dumps(manifest))
+        os.replace(tmp_path, self.path / MANIFEST_FILE)
+
+
+class _JsonlPageWriter:
+    def __init__(self, path: Path):
+        self._file = gzip.open(path, "wb", compresslevel=6)
+
+    def write(self, items: list):
+        self._file.write(json_backend.dumps(items) + b"\n")
+
+    def close(self):
+        self._file.close()
+
+
+class _ArrowPageWriter:
+    def __init__(self, path: Path):
+        self.pa = _import_pyarrow()
+        self.schema = self.pa.schema([("item", self.pa.string())])
+        options = self.pa.ipc.IpcWriteOptions(compression="zstd")
+        self._writer = self.pa.ipc.new_file(str(path), self.schema, options=options)
+
+    def write(self, items: list):
+        column = self.pa.array([json_backend.dumps(item).decode("utf-8") for item in items], type=self.pa.string())
+        self._writer.write_batch(self.pa.record_batch([column], schema=self.schema))
+
+    def close(self):
+        self._writer.close()
+
+
+def _read_jsonl_pages(path: Path) -> Iterator[list]:
+    with gzip.open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield json_backend.loads(line)
+
+def _read_arrow_pages(path: Path) -> Iterator[list]:
+    pa = _import_pyarrow()
+    with pa.memory_map(str(path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        for index in range(reader.num_record_batches):
+            yield [json_backend.loads(item) for item in reader.get_batch(index).column(0).to_pylist()]
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401 - carrega o submódulo usado por pyarrow.ipc.new_file
+    except ImportError as e:
+        raise ImportError("O formato de arquivo 'arrow' requer o pacote 'pyarrow'.") from e
+    return pyarrow
+
+
+_ARCHIVE_WRITERS = {"jsonl": _JsonlPageWriter, "arrow": _ArrowPageWriter}
+_ARCHIVE_READERS = {"jsonl": _read_jsonl_pages, "arrow": _read_arrow_pages}
+
+
+def iter_paginas_arquivadas(caminho_arquivo: str, grupo: str = None) -> Iterator[list]:
+    """
+    Páginas de um arquivo gravado com `arquivar_em=...`, sem nenhuma chamada à API.
+
+    Recebe obrigatoriamente:
+        caminho_arquivo= pasta da execução arquivada -> str
+
+    Opcionais:
+        grupo= mantém só os itens desse grupo (`filtrar_itens_grupo`) -> str
+
+    Exemplo de Uso:
+        for pagina in iter_paginas_arquivadas("arquivo/CRI/2025-06", grupo="Feito"):
+            flattener.add_page(pagina)
+    """
+    # Importado aqui: o handler carrega o pandas, que a extração em si não usa
+    from ..utils.handler import filtrar_itens_grupo
+    for items in PageArchive(caminho_arquivo).pages():
+        yield filtrar_itens_grupo(items, grupo) if grupo else items
+
+def extrair_dados_arquivados(caminho_arquivo: str, grupo: str = None) -> list:
+    """
+    Equivalente offline de `extrair_dados_paginados`: a lista de itens de um
+    arquivo gravado com `arquivar_em=...`, lida do disco.
+
+    Recebe obrigatoriamente:
+        caminho_arquivo= pasta da execução arquivada -> str
+
+    Opcionais:
+        grupo= mantém só os itens desse grupo (`filtrar_itens_grupo`) -> str
+    """
+    all_items = [item for items in iter_paginas_arquivadas(caminho_arquivo, grupo) for item in items]
+    logging.info(f"Arquivo '{caminho_arquivo}' lido. Total de itens: {len(all_items)}.")
+    return all_items
@@ -0,0 +1,112 @@
+import logging
+import threading
+from ..infra.settings import get_settings
+from ..api_client.metrics import CallMetrics
+
+# Maior `limit` aceito pelo items_page / next_items_page da API do Monday
+MAX_PAGE_SIZE = 500
+# Valor de `tamanho_pagina` que liga o ajuste adaptativo
+AUTO_PAGE_SIZE = "auto"
+
+
+class PageSizeController:
+    """Ajuste adaptativo do tamanho de página (`limit`) do items_page.
+
+    Observa as métricas de cada tentativa de chamada das páginas (ver o
+    `observer` de `call_context`) e recalcula o `limit` das próximas páginas:
+      - 504 (Gateway Timeout): a página era pesada demais; o tamanho cai pela metade;
+      - latência acima de `target_latency` ou custo de complexidade acima de
+        `max_complexity`: o tamanho é reduzido na proporção do excesso;
+      - página rápida e barata, sem 504 recentes: o tamanho cresce 50%, até `maximum`.
+
+    A taxa de 504 é uma média móvel exponencial por tentativa; enquanto ela
+    estiver acima de `max_timeout_rate` o tamanho não cresce.
+
+    Uma mesma instância pode ser compartilhada por várias tarefas da mesma
+    extração (ex: as janelas de `extrair_dados_por_janelas`).
+
+    Args:
+        initial: Tamanho da primeira página.
+        minimum: Menor tamanho usado.
+        maximum: Maior tamanho usado (no máximo `MAX_PAGE_SIZE`).
+        target_latency: Duração (s) desejada de cada chamada.
+        max_complexity: Custo de complexidade máximo desejado por página.
+        max_timeout_rate: Taxa de 504 a partir da qual o tamanho para de crescer.
+    """
+    def __init__(self,
+                 initial: int = 100,
+                 minimum: int = 25,
+                 maximum: int = MAX_PAGE_SIZE,
+                 target_latency: float = 10.0,
+                 max_complexity: float = 1_000_000,
+                 max_timeout_rate: float = 0.05):
+        if not 1 <= minimum <= maximum <= MAX_PAGE_SIZE:
+            raise ValueError(f"Tamanhos de página inválidos: mínimo {minimum}, máximo {maximum} (limite da API: {MAX_PAGE_SIZE}).")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.max_complexity = max_complexity
+        self.max_timeout_rate = max_timeout_rate
+        self.timeout_rate = 0.0
+        self._limit = min(max(initial, minimum), maximum)
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """Tamanho de página a usar na próxima chamada."""
+        return self._limit
+
+    def __call__(self, metrics: CallMetrics):
+        timeout = metrics.status_code == 504
+        with self._lock:
+            self.timeout_rate = 0.8 * self.timeout_rate + 0.2 * timeout
+            previous = self._limit
+            if timeout:
+                factor = 0.5
+            elif metrics.status_code != 200:
+                return
+            else:
+                factor = self._factor(metrics)
+            self._limit = min(max(int(self._limit * factor), self.minimum), self.maximum)
+            limit = self._limit
+
+        if limit != previous:
+            logging.info(f"Tamanho de página ajustado de {previous} para {limit} "
+                         f"(latência {metrics.total_time:.2f}s, custo {metrics.complexity_cost}, "
+                         f"taxa de 504 {self.timeout_rate:.0%}).")
+
+    def _factor(self, metrics: CallMetrics) -> float:
+        """Fator de ajuste do tamanho a partir de uma página bem-sucedida."""
+        shrink = 1.0
+        if metrics.total_time > self.target_latency:
+            shrink = min(shrink, self.target_latency / metrics.total_time)
+        if metrics.complexity_cost and metrics.complexity_cost > self.max_complexity:
+            shrink = min(shrink, self.max_complexity / metrics.complexity_cost)
+        if shrink < 1.0:
+            return max(shrink, 0.5)
+
+        fast = metrics.total_time < self.target_latency / 2
+        cheap = not metrics.complexity_cost or metrics.complexity_cost < self.max_complexity / 2
+        if fast and cheap and self.timeout_rate <= self.max_timeout_rate:
+            return 1.5
+        return 1.0
+
+
+def page_size_option(tamanho_pagina: int | str | PageSizeController | None) -> int | PageSizeController:
+    """
+    Valida o parâmetro `tamanho_pagina` das funções de extração.
+
+    Aceita um número de itens por página (1 a `MAX_PAGE_SIZE`), `"auto"` (cria
+    um `PageSizeController` com os valores padrão), um `PageSizeController`
+    já configurado, ou None (usa `ITEMS_PAGE_SIZE` das configurações).
+    """
+    if tamanho_pagina is None:
+        tamanho_pagina = get_settings().ITEMS_PAGE_SIZE
+    if isinstance(tamanho_pagina, PageSizeController):
+        return tamanho_pagina
+    if tamanho_pagina == AUTO_PAGE_SIZE:
+        return PageSizeController()
+    if isinstance(tamanho_pagina, bool) or not isinstance(tamanho_pagina, int) or not 1 <= tamanho_pagina <= MAX_PAGE_SIZE:
+        raise ValueError(f"tamanho_pagina deve ser um inteiro de 1 a {MAX_PAGE_SIZE} ou '{AUTO_PAGE_SIZE}'; "
+                         f"recebido: {tamanho_pagina!r}.")
+    return tamanho_pagina
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from ..api_client.call_api import call_monday_api, acall_monday_api
+from ..api_client.multiplex import merge_queries, split_response
+from ..api_client.retry import Deadline
+from ..queries.builder import build_subitems_query, ITEMS_BY_ID_LIMIT
+
+# Modos de `subitens` das funções de extração
+SUBITEMS_NONE = "none"          # subitens não são pedidos
+SUBITEMS_INLINE = "inline"      # subitens dentro de cada página do items_page (padrão)
+SUBITEMS_DEFERRED = "deferred"  # páginas sem subitens; subitens buscados depois, em lotes de items(ids:)
+SUBITEMS_MODES = (SUBITEMS_NONE, SUBITEMS_INLINE, SUBITEMS_DEFERRED)
+
+
+def subitems_mode(subitens: str) -> str:
+    """Valida o parâmetro `subitens` das funções de extração."""
+    if subitens not in SUBITEMS_MODES:
+        raise ValueError(f"subitens deve ser um de {', '.join(SUBITEMS_MODES)}; recebido: {subitens!r}.")
+    return subitens
+
+def fetch_subitems(item_ids: list[str], paralelos: int = 1, deadline: Deadline = None, values: bool = False) -> dict:
+    """
+    Busca os subitens dos itens `item_ids` em lotes de `items(ids:)` de até
+    `ITEMS_BY_ID_LIMIT` IDs.
+
+    Com `paralelos > 1`, até `paralelos` lotes vão na mesma chamada à API
+    (queries combinadas por `merge_queries`), dividindo o número de idas e
+    voltas na mesma proporção.
+
+    Com `values=True`, os valores de coluna trazem também o `value` (JSON bruto).
+
+    Retorna {id do item: lista de subitens}.
+    """
+    query = build_subitems_query(values)
+    subitems = {}
+    lotes = _batches(item_ids)
+    for inicio in range(0, len(lotes), max(paralelos, 1)):
+        grupo = lotes[inicio:inicio + max(paralelos, 1)]
+        if len(grupo) == 1:
+            respostas = [call_monday_api(query, {"itemIds": grupo[0]}, deadline=deadline)]
+        else:
+            merged, variables = merge_queries([(query, {"itemIds": lote}) for lote in grupo])
+            respostas = split_response(call_monday_api(merged, variables, deadline=deadline), len(grupo))
+        for resposta in respostas:
+            _collect(resposta, subitems)
+    _log_fetch(item_ids, lotes, subitems)
+    return subitems
+
+async def afetch_subitems(item_ids: list[str], paralelos: int = 1, deadline: Deadline = None,
+                          values: bool = False) -> dict:
+    """
+    Versão assíncrona de `fetch_subitems`: até `paralelos` lotes são buscados ao
+    mesmo tempo pelo cliente assíncrono compartilhado (respeitando o limite de
+    concorrência e o orçamento de complexidade).
+    """
+    query = build_subitems_query(values)
+    subitems = {}
+    lotes = _batches(item_ids)
+    for inicio in range(0, len(lotes), max(paralelos, 1)):
+        respostas = await asyncio.gather(*(
+            acall_monday_api(query, {"itemIds": lote}, deadline=deadline)
+            for lote in lotes[inicio:inicio + max(paralelos, 1)]
+        ))
+        for resposta in respostas:
+            _collect(resposta, subitems)
+    _log_fetch(item_ids, lotes, subitems)
+    return subitems
+
+def attach_subitems(items: list[dict], subitems: dict):
+    """Coloca em cada item a lista de subitens buscada (no mesmo formato do modo `inline`)."""
+    for item in items:
+        item["subitems"] = subitems.get(item["id"], [])
+
+def _batches(item_ids: list[str]) -> list[list[str]]:
+    item_ids = list(dict.fromkeys(item_ids))
+    return [item_ids[i:i + ITEMS_BY_ID_LIMIT] for i in range(0, len(item_ids), ITEMS_BY_ID_LIMIT)]
+
+def _collect(response_data: dict, subitems: dict):
+    for item in response_data.get("items") or []:
+        subitems[str(item["id"])] = item.get("subitems") or []
+
+def _log_fetch(item_ids: list[str], lotes: list, subitems: dict):
+    total = sum(len(s) for s in subitems.values())
+    logging.info(f"Subitens de {len(item_ids)} item(ns) buscados em {len(lotes)} lote(s): {total} subitem(ns).")
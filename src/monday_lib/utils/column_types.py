@@ -0,0 +1,99 @@
+"""
+Conversão das colunas de texto das tabelas de itens para os tipos do pandas,
+a partir do tipo de cada coluna no Monday (`ColunaIDMapper`, campo `type`).
+
+Cada coluna é convertida inteira, de forma vetorizada:
+  - date -> datetime64;
+  - numbers -> float64; rating -> Int64;
+  - status, color e o grupo do item -> category (do rótulo, o `text`);
+  - checkbox -> bool.
+
+Quando o `value` (JSON bruto) foi pedido à API, as colunas de
+`RAW_VALUE_TYPES` são lidas só dele: datas em datetime64 com fuso UTC
+(`datetime64[ns, UTC]`), checkbox de `checked`, números e rating do valor
+guardado (o `text` pode ter unidade ou formatação). Sem o `value`, vêm do
+`text`, e as datas ficam sem fuso (o `text` tem a hora no fuso da conta).
+As duas fontes nunca se misturam em uma mesma tabela.
+
+Células vazias viram valores ausentes (NaT / <NA> / NaN); as demais colunas
+continuam como texto. O tipo resultante depende só do tipo da coluna (e de
+o `value` ter sido pedido), e não dos valores, então páginas convertidas
+separadamente (gravação página a página) têm sempre as mesmas colunas com
+os mesmos dtypes.
+"""
+import pandas as pd
+from typing import Iterable
+
+DATE_TYPES = {"date"}
+NUMERIC_TYPES = {"numbers"}
+INTEGER_TYPES = {"rating"}
+CATEGORY_TYPES = {"status", "color"}
+BOOL_TYPES = {"checkbox"}
+
+# Tipos em que o `text` perde informação e a conversão lê o `value` (JSON bruto)
+RAW_VALUE_TYPES = DATE_TYPES | NUMERIC_TYPES | INTEGER_TYPES | BOOL_TYPES
+
+# Texto da coluna checkbox marcada
+CHECKBOX_CHECKED = "v"
+
+
+def convert_columns(df: pd.DataFrame, types: dict, raw_values: dict = None,
+                    categories: Iterable[str] = ()) -> pd.DataFrame:
+    """
+    Converte as colunas de `df` conforme `types` ({título: tipo da coluna no Monday}).
+
+    Args:
+        df: Tabela com os valores em texto (ex: de `ItemFlattener.to_frames`).
+        types: Tipo de cada coluna; colunas sem tipo conhecido ficam como estão.
+        raw_values: {título: lista com o `value` de cada linha} das colunas de
+            `RAW_VALUE_TYPES`, quando o `value` foi pedido à API (uma coluna
+            ausente do dicionário não tem valor em nenhuma linha). Com None,
+            todas as colunas são lidas do `text`.
+        categories: Colunas extras convertidas para category (ex: "grupo").
+    """
+    converted = {}
+    for title in df.columns:
+        column_type = types.get(title)
+        series = df[title]
+        if title in categories or column_type in CATEGORY_TYPES:
+            converted[title] = _to_category(series)
+        elif column_type in RAW_VALUE_TYPES and raw_values is not None:
+            raw = pd.Series(raw_values.get(title) or [None] * len(series), index=series.index, dtype=object)
+            converted[title] = _from_value(raw, column_type)
+        elif column_type in DATE_TYPES:
+            converted[title] = pd.to_datetime(_blank_to_na(series), errors="coerce",
+                                              format="ISO8601").astype("datetime64[ns]")
+        elif column_type in NUMERIC_TYPES:
+            converted[title] = _to_number(series)
+        elif column_type in INTEGER_TYPES:
+            converted[title] = _to_number(series).round().astype("Int64")
+        elif column_type in BOOL_TYPES:
+            converted[title] = series.eq(CHECKBOX_CHECKED)
+    return df.assign(**converted) if converted else df
+
+def _blank_to_na(series: pd.Series) -> pd.Series:
+    return series.mask(series.eq(""))
+
+def _to_category(series: pd.Series) -> pd.Series:
+    return _blank_to_na(series).astype("category")
+
+def _from_value(raw: pd.Series, column_type: str) -> pd.Series:
+    """Converte a coluna a partir do `value` (JSON bruto) de cada célula."""
+    if column_type in DATE_TYPES:
+        # {"date": "2025-01-31", "time": "13:45:00"}: data e hora em UTC (sem "time", meia-noite)
+        dates = raw.str.extract(r'"date"\s*:\s*"([^"]+)"', expand=False)
+        times = raw.str.extract(r'"time"\s*:\s*"([^"]+)"', expand=False)
+        # Resolução fixa: o pandas infere a unidade pelos valores, e ela mudaria de uma página para outra
+        return pd.to_datetime(dates.where(times.isna(), dates + " " + times), errors="coerce",
+                              format="ISO8601", utc=True).astype("datetime64[ns, UTC]")
+    if column_type in BOOL_TYPES:
+        # {"checked": "true"} (ou true); sem value, desmarcado
+        return raw.str.contains(r'"checked"\s*:\s*"?true', regex=True).fillna(False).astype(bool)
+    if column_type in INTEGER_TYPES:
+        ratings = raw.str.extract(r'"rating"\s*:\s*"?(-?[\d.]+)', expand=False)
+        return pd.to_numeric(ratings, errors="coerce").round().astype("Int64")
+    # numbers: o value é o número em JSON, em geral como string ("12.5")
+    return pd.to_numeric(raw.str.strip('"'), errors="coerce").astype("float64")
+
+def _to_number(series: pd.Series) -> pd.Series:
+    return pd.to_numeric(_blank_to_na(series), errors="coerce").astype("float64")
@@ -1,6 +1,9 @@
+import time
+import inspect
 import logging
 import functools
 from ..utils.logger import api_logger
+from ..api_client.metrics import call_context, get_metrics_registry, iter_in_context, aiter_in_context
 
 def log_api_errors(func):
     """
@@ -10,22 +13,95 @@ def log_api_errors(func):
     capturá-la, logar uma mensagem de erro contextualizada (incluindo o nome
     da função que falhou) no logger de persistência 'api_logger', e então
     re-levantar a exceção para não interromper o fluxo de erro.
+
+    Também mede a duração de cada execução: registra no log e no registro de
+    métricas (`monday_function_duration_seconds`), e marca as chamadas à API
+    feitas dentro da função com o nome dela.
+
+    Funciona com funções comuns, funções `async def` e geradores (síncronos e
+    assíncronos). Nos geradores, a duração vai da primeira até a última página
+    consumida e o erro é registrado quando acontece durante a iteração.
     """
+    def _log_failure(e: Exception):
+        # Se uma exceção ocorrer, loga com o nome da função que falhou
+        error_message = f"Falha na execução de '{func.__name__}'."
+
+        # Loga a mensagem de alto nível no console (via logger raiz)
+        logging.error(error_message)
+        # Loga a mensagem de alto nível + causa no arquivo de persistência
+        api_logger.error(f"{error_message} Causa: {e}")
+
+    def _record_timing(start: float, ok: bool):
+        elapsed = time.perf_counter() - start
+        get_metrics_registry().record_function(func.__name__, elapsed, ok)
+        if ok:
+            logging.info(f"'{func.__name__}' concluída em {elapsed:.2f}s.")
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def gen_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                yield from iter_in_context(func(*args, **kwargs), function=func.__name__)
+            except GeneratorExit:
+                # Consumidor parou antes do fim: não é uma falha
+                _record_timing(start, ok=True)
+                raise
+            except Exception as e:
+                _record_timing(start, ok=False)
+                _log_failure(e)
+                raise
+            _record_timing(start, ok=True)
+        return gen_wrapper
+
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        async def asyncgen_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            values = aiter_in_context(func(*args, **kwargs), function=func.__name__)
+            try:
+                async for value in values:
+                    yield value
+            except GeneratorExit:
+                await values.aclose()
+                _record_timing(start, ok=True)
+                raise
+            except Exception as e:
+                _record_timing(start, ok=False)
+                _log_failure(e)
+                raise
+            _record_timing(start, ok=True)
+        return asyncgen_wrapper
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                with call_context(function=func.__name__):
+                    result = await func(*args, **kwargs)
+            except Exception as e:
+                _record_timing(start, ok=False)
+                _log_failure(e)
+                raise
+            _record_timing(start, ok=True)
+            return result
+        return async_wrapper
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         # A lógica de tratamento de erro que queremos reutilizar
+        start = time.perf_counter()
         try:
             # Tenta executar a função original e retornar seu resultado
-            return func(*args, **kwargs)
+            with call_context(function=func.__name__):
+                result = func(*args, **kwargs)
         except Exception as e:
-            # Se uma exceção ocorrer, loga com o nome da função que falhou
-            error_message = f"Falha na execução de '{func.__name__}'."
-            
-            # Loga a mensagem de alto nível no console (via logger raiz)
-            logging.error(error_message)
-            # Loga a mensagem de alto nível + causa no arquivo de persistência
-            api_logger.error(f"{error_message} Causa: {e}")
-            
+            _record_timing(start, ok=False)
+            _log_failure(e)
+
             # Re-levanta a exceção para que o programa principal saiba que a falha ocorreu
             raise
-    return wrapper
\ No newline at end of file
+        _record_timing(start, ok=True)
+        return result
+    return wrapper
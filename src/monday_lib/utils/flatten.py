@@ -0,0 +1,228 @@
+"""
+Achatamento colunar dos itens da API em tabelas (elementos e subelementos).
+
+Em vez de montar um dicionário por item e entregar a lista ao `pd.DataFrame`,
+cada coluna do quadro recebe uma posição (slot) fixa uma única vez, a partir do
+esquema do `ColunaIDMapper`, e os valores de cada página são gravados direto
+nas listas das colunas. No fim, os DataFrames (ou tabelas Arrow) são montados
+de uma vez a partir dessas listas.
+
+No modo tipado (`tipado=True`) as colunas são convertidas pelo tipo de cada
+coluna no Monday (ver `utils/column_types.py`).
+"""
+import pandas as pd
+from itertools import islice, repeat
+from typing import Iterable
+from .column_types import RAW_VALUE_TYPES, convert_columns
+
+# Colunas fixas das tabelas, antes das colunas do quadro
+ITEM_FIELDS = ("id", "grupo", "nome")
+SUBITEM_FIELDS = ("item_pai_id", "item_pai_nome", "subitem_id", "subitem_nome")
+
+# Itens por página ao achatar um iterável sem páginas (ex: uma lista de itens)
+PAGE_ROWS = 1000
+
+# Tipos de coluna do quadro que não vêm nos `column_values` dos itens (o nome é o campo fixo `nome`)
+NON_VALUE_TYPES = {"name"}
+
+
+class _ColumnTable:
+    """Listas de valores de uma tabela: uma por campo fixo e uma por coluna do quadro (slot).
+
+    Com `typed=True` guarda também o tipo de cada coluna (do esquema ou, se a
+    coluna não estiver nele, do `type` do valor de coluna) e, se os valores de
+    coluna trazem o `value` (`values`), o `value` bruto das colunas de
+    `RAW_VALUE_TYPES`. Com `all_columns=True`, as colunas do esquema entram no
+    resultado mesmo antes de aparecerem nos itens.
+    """
+    def __init__(self, fields: tuple, schema: dict | Iterable[str] = (), typed: bool = False,
+                 all_columns: bool = False):
+        self.fields = {name: [] for name in fields}
+        self.slots = {}
+        self.columns = []
+        self.seen = []
+        self.rows = 0
+        self.taken = 0
+        self.typed = typed
+        self.types = {}
+        self.raw = {}
+        self.values = False
+        for title in schema:
+            column_type = schema[title].get('type') if isinstance(schema, dict) else None
+            slot = self._slot(title)
+            self.seen[slot] = all_columns and column_type not in NON_VALUE_TYPES
+            if isinstance(schema, dict):
+                self.types[title] = column_type
+
+    def _slot(self, title: str) -> int:
+        """Slot da coluna `title`; colunas fora do esquema ganham um slot novo, no fim."""
+        slot = self.slots.get(title)
+        if slot is None:
+            slot = self.slots[title] = len(self.columns)
+            self.columns.append([None] * self.rows)
+            self.seen.append(False)
+        return slot
+
+    def append(self, field_rows: list[tuple], column_rows: list[list]):
+        """Acrescenta uma página: os campos fixos e os `column_values` de cada linha."""
+        n = len(column_rows)
+        for values, new_values in zip(self.fields.values(), zip(*field_rows)):
+            values.extend(new_values)
+
+        # Valores da página por título; só depois cada título é levado ao seu slot
+        page = {}
+        raw_page = {}
+        for row, columns in enumerate(column_rows):
+            for col in columns:
+                title = col['column']['title']
+                values = page.get(title)
+                if values is None:
+                    values = page[title] = [None] * n
+                    if self.typed:
+                        self._track_type(title, col, raw_page, n)
+                values[row] = col.get('text') or col.get('display_value') or ''
+                if raw_page and title in raw_page:
+                    raw_page[title][row] = col.get('value')
+        for title in page:
+            self._slot(title)
+        for title in raw_page:
+            self.raw.setdefault(title, [None] * self.rows)
+        for title, values in self.raw.items():
+            values.extend(raw_page.get(title) or repeat(None, n))
+
+        # Colunas sem valor na página (ex: projeção) recebem None nas linhas da página
+        for title, slot in self.slots.items():
+            page_values = page.get(title)
+            if page_values is None:
+                self.columns[slot].extend(repeat(None, n))
+            else:
+                self.columns[slot].extend(page_values)
+                self.seen[slot] = True
+        self.rows += n
+
+    def _track_type(self, title: str, col: dict, raw_page: dict, n: int):
+        """Registra o tipo da coluna e, se for o caso, reserva a lista do `value` bruto na página."""
+        column_type = self.types.setdefault(title, col.get('type'))
+        if 'value' in col:
+            # O `value` foi pedido à API (`valores_brutos=True`): a conversão passa a usar só ele
+            self.values = True
+            if column_type in RAW_VALUE_TYPES:
+                raw_page[title] = [None] * n
+
+    def as_dict(self) -> dict:
+        """{nome da coluna: lista de valores}, só com as colunas que apareceram nos itens."""
+        if not self.rows:
+            return {}
+        data = dict(self.fields)
+        data.update((title, self.columns[slot]) for title, slot in self.slots.items() if self.seen[slot])
+        return data
+
+    def take(self, keep: bool = True) -> tuple[dict, dict]:
+        """
+        Valores das linhas acrescentadas desde a última chamada: ({coluna: lista}, {título: `value` bruto}).
+        Com `keep=False` essas linhas saem da tabela (só os slots e os tipos continuam).
+        """
+        start = self.taken
+        if start == self.rows:
+            return {}, {}
+        if keep:
+            data = {name: values[start:] for name, values in self.as_dict().items()}
+            raw = {title: values[start:] for title, values in self.raw.items()}
+            self.taken = self.rows
+            return data, raw
+
+        data, raw = self.as_dict(), self.raw
+        self.fields = {name: [] for name in self.fields}
+        self.columns = [[] for _ in self.columns]
+        self.raw = {title: [] for title in self.raw}
+        self.rows = 0
+        return data, raw
+
+
+class ItemFlattener:
+    """Achata as páginas de itens da API em tabelas de elementos e subelementos.
+
+    As colunas dos itens têm a ordem do esquema do quadro (`ColunaIDMapper.coluna_map`,
+    ou uma lista de títulos), e as dos subitens a ordem de `esquema_subitens`
+    (`ColunaIDMapper.subitem_map`); colunas que não estão no esquema entram no
+    fim, na ordem em que aparecem. Colunas do esquema que não aparecem em
+    nenhum item ficam de fora, a não ser com `todas_colunas=True`: aí todas as
+    colunas dos esquemas (menos a do nome) estão nas tabelas desde a primeira
+    página, vazias onde não houver valor. É o que a gravação página a página
+    usa, para que o cabeçalho dos arquivos já tenha todas as colunas do quadro.
+
+    O resultado é o mesmo de `list2dfs`: uma linha por item (`id`, `grupo`,
+    `nome` e uma coluna por título) e uma por subitem (`item_pai_id`,
+    `item_pai_nome`, `subitem_id`, `subitem_nome` e as colunas do subitem). O
+    valor de cada coluna é o `text` (ou o `display_value`) da API.
+
+    Com `tipado=True`, as colunas de data, número, status e checkbox (e o
+    `grupo`) são convertidas pelo tipo da coluna no Monday (`convert_columns`).
+    Com itens extraídos com `valores_brutos=True`, datas, números e checkbox
+    vêm do `value` (datas com fuso UTC); sem ele, do `text` (datas sem fuso).
+
+    Para gravar página a página, `take_frames` entrega só as linhas novas desde
+    a chamada anterior; com `acumular=False` essas linhas saem da memória em
+    seguida (e `to_frames` deixa de ter o resultado completo).
+
+    Exemplo de Uso:
+        mapper = ColunaIDMapper(board_id, subsetor)
+        flattener = ItemFlattener(mapper.coluna_map, esquema_subitens=mapper.subitem_map)
+        for pagina in iter_items_paginados(board_id, subsetor, por_pagina=True, ...):
+            flattener.add_page(pagina)
+        elementos, subelementos = flattener.to_frames()
+    """
+    def __init__(self, schema: dict | Iterable[str] = None, tipado: bool = False, acumular: bool = True,
+                 todas_colunas: bool = False, esquema_subitens: dict | Iterable[str] = None):
+        self.tipado = tipado
+        self.acumular = acumular
+        self.items = _ColumnTable(ITEM_FIELDS, schema or (), tipado, todas_colunas)
+        self.subitems = _ColumnTable(SUBITEM_FIELDS, esquema_subitens or (), tipado, todas_colunas)
+
+    def add_page(self, items: list[dict]):
+        """Acrescenta uma página de itens (e os subitens de cada um)."""
+        item_rows, item_columns = [], []
+        subitem_rows, subitem_columns = [], []
+        for item in items:
+            item_rows.append((item['id'], item['group']['title'], item['name']))
+            item_columns.append(item['columns'])
+            for sub_item in item.get("subitems") or ():
+                subitem_rows.append((item['id'], item['name'], sub_item['id'], sub_item['name']))
+                subitem_columns.append(sub_item['columns'])
+        self.items.append(item_rows, item_columns)
+        self.subitems.append(subitem_rows, subitem_columns)
+
+    def add_items(self, items: Iterable[dict]):
+        """Acrescenta os itens de um iterável qualquer (percorrido uma única vez), em páginas de `PAGE_ROWS`."""
+        iterator = iter(items)
+        while page := list(islice(iterator, PAGE_ROWS)):
+            self.add_page(page)
+
+    def to_frames(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """[ Elementos, Sub Elementos ] como DataFrames."""
+        return (self._frame(self.items, self.items.as_dict(), self.items.raw),
+                self._frame(self.subitems, self.subitems.as_dict(), self.subitems.raw))
+
+    def take_frames(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """[ Elementos, Sub Elementos ] só com as linhas acrescentadas desde a última chamada."""
+        return tuple(self._frame(table, *table.take(self.acumular)) for table in (self.items, self.subitems))
+
+    def _frame(self, table: _ColumnTable, data: dict, raw: dict) -> pd.DataFrame:
+        df = pd.DataFrame(data)
+        if self.tipado:
+            df = convert_columns(df, table.types, raw if table.values else None,
+                                 categories=("grupo",) if table is self.items else ())
+        return df
+
+    def to_arrow(self) -> tuple:
+        """[ Elementos, Sub Elementos ] como tabelas do Arrow (`pyarrow.Table`). Requer o pacote `pyarrow`."""
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("ItemFlattener.to_arrow requer o pacote 'pyarrow'.") from e
+        if self.tipado:
+            return tuple(pa.Table.from_pandas(df, preserve_index=False) for df in self.to_frames())
+        return tuple(
+            pa.table({name: pa.array(values, type=pa.string()) for name, values in table.as_dict().items()})
+            for table in (self.items, self.subitems)
+        )
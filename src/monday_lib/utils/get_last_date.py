@@ -1,7 +1,7 @@
 import datetime
 
 def get_date() -> tuple[str]:
-    today = datetime.today()
+    today = datetime.date.today()
     first_day_this_month = today.replace(day=1)
     last_day_last_month = first_day_this_month - datetime.timedelta(days=1)
     first_day_last_month = last_day_last_month.replace(day=1)
@@ -1,4 +1,6 @@
 import pandas as pd
+from typing import Iterable
+from .flatten import ItemFlattener
 """
 Este arquivo é usado apenas para tratar a lista recebida da chamada API, portanto não suporta outra estrutura de dados.
 """
@@ -54,31 +56,26 @@ def filtrar_itens_grupo(data: list, grupo: str= None) -> list:
         itens_por_grupo.append(item)
     return itens_por_grupo
 
-def list2dfs(_items: list) -> tuple[pd.DataFrame, pd.DataFrame]:
+def list2dfs(_items: Iterable[dict], schema: dict = None, tipado: bool = False) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     [ Elementos, Sub Elementos ]
 
     Itera sobre os elementos da lista recebida de "filrar_itens_grupo" 
     e cria DataFrame's dos elementos e sub elementos.
     
-    Entrada -> List
+    Entrada -> List (ou qualquer iterável, ex: o gerador `iter_items_paginados`;
+               os itens são percorridos uma única vez)
+               schema (opcional) -> `ColunaIDMapper.coluna_map`, que fixa a ordem das colunas
+               tipado (opcional) -> converte as colunas pelo tipo no Monday (datas,
+               números, status, checkbox; ver `utils/column_types.py`)
 
     Saida -> Tuple (pd.DataFrame)
-    """
-    element_rows = []
-    for item in _items:
-        row = {
-            "id": item['id'],
-            "grupo": item['group']['title'],
-            "nome": item['name'],
-        }                                                       
-        row.update(_obter_valor_coluna(item['columns']))   # Atualiza o dicionario com todos os campos das colunas daquele item
-        element_rows.append(row)
-
-    sub_itens =_list2df_subitems(_items)
-    itens = pd.DataFrame(element_rows)
 
-    return itens, sub_itens
+    O achatamento é colunar (ver `utils/flatten.py`).
+    """
+    flattener = ItemFlattener(schema, tipado)
+    flattener.add_items(_items)
+    return flattener.to_frames()
 
 def _list2df_subitems(_items: list) -> pd.DataFrame:
     """ 
@@ -86,16 +83,4 @@ def _list2df_subitems(_items: list) -> pd.DataFrame:
     Entrada -> List
     Saida -> pd.DataFrame
     """
-    subelements_rows = []
-    for item in _items:
-        for sub_item in item.get("subitems", []):
-            sub_row = {
-                "item_pai_id": item['id'],
-                "item_pai_nome": item['name'],
-                "subitem_id": sub_item['id'],
-                "subitem_nome": sub_item['name'],
-            }
-            sub_row.update(_obter_valor_coluna(sub_item['columns']))    # Atualiza o dicionario com todos os campos das colunas daquele sub_item
-            subelements_rows.append(sub_row)
-
-    return pd.DataFrame(subelements_rows)
\ No newline at end of file
+    return list2dfs(_items)[1]
@@ -1,35 +1,83 @@
 import logging
-import os
+import sys
+import threading
 from logging.handlers import RotatingFileHandler
-from infra.settings import get_settings
-settings = get_settings()
+from ..infra.settings import get_settings, ConfigurationError
+
+LOG_FORMAT = "%(asctime)s - [%(levelname)s] - [%(filename)s -> %(funcName)s()] - %(message)s"
+
+
+class _LazyRotatingFileHandler(logging.Handler):
+    """
+    Handler que só cria o arquivo de log (`LOGS_PATH/api_errors.log`) na primeira
+    mensagem emitida.
+
+    Assim a importação do pacote não depende de `load_settings` nem toca o disco.
+    Se uma mensagem chegar antes das configurações serem carregadas, ela é
+    enviada ao handler de último recurso do `logging` (stderr).
+    """
+    def __init__(self, filename: str, level=logging.NOTSET, **kwargs):
+        super().__init__(level)
+        self.filename = filename
+        self.kwargs = kwargs
+        self._handler = None
+        self._init_lock = threading.Lock()
+
+    def _get_handler(self) -> RotatingFileHandler:
+        if self._handler is None:
+            with self._init_lock:
+                if self._handler is None:
+                    handler = RotatingFileHandler(get_settings().LOGS_PATH / self.filename, **self.kwargs)
+                    handler.setFormatter(self.formatter)
+                    self._handler = handler
+        return self._handler
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            handler = self._get_handler()
+        except ConfigurationError:
+            logging.lastResort.handle(record)
+            return
+        handler.handle(record)
+
+    def close(self):
+        if self._handler is not None:
+            self._handler.close()
+        super().close()
+
 
 def setup_logger(name, level=logging.ERROR):
     """
     Configura um logger específico para escrever em um arquivo, com rotação.
+    O arquivo só é aberto quando a primeira mensagem é registrada.
     """
-    log_dir = os.path.dirname(log_file)
-    os.makedirs(log_dir, exist_ok=True)
-
-    # Cria o handler para o arquivo
-    log_file = settings.LOGS_PATH / "api_errors.log"
-    handler = RotatingFileHandler(log_file, maxBytes=1024*1024, backupCount=5, encoding='utf-8')
+    handler = _LazyRotatingFileHandler("api_errors.log", maxBytes=1024*1024, backupCount=5, encoding='utf-8')
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     handler.setFormatter(formatter)
 
     # Pega o logger e configura
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
+
     # IMPORTANTE: Propagate = False
     # Impede que as mensagens de erro deste logger sejam enviadas para o logger raiz (console)
     # Isso evita que a mesma mensagem de erro apareça duas vezes no terminal.
     logger.propagate = False
-    
+
     if not logger.handlers:
         logger.addHandler(handler)
 
     return logger
 
 
-api_logger = setup_logger('api_error_logger')
\ No newline at end of file
+def configure_logging(level=logging.INFO, stream=sys.stdout):
+    """
+    Configuração de logging no console usada pela biblioteca (INFO e acima, no terminal).
+
+    Não é executada na importação do pacote: `load_settings` a chama, e não faz
+    nada se a aplicação já tiver configurado o logger raiz.
+    """
+    logging.basicConfig(level=level, stream=stream, format=LOG_FORMAT)
+
+
+api_logger = setup_logger('api_error_logger')
@@ -0,0 +1,353 @@
+"""
+Gravação das tabelas de elementos e subelementos em arquivos, página a página.
+
+Cada formato tem um `TableWriter`, que recebe os DataFrames das páginas
+conforme elas chegam (`write`) e termina o arquivo em `close`:
+  - "xlsx": Excel, gravado linha a linha no modo write-only do openpyxl;
+  - "parquet": Parquet (requer `pyarrow`);
+  - "feather" / "arrow": Arrow IPC, o formato do Feather v2 (requer `pyarrow`);
+  - "csv": CSV em UTF-8;
+  - "jsonl": JSON Lines comprimido com gzip (`.jsonl.gz`).
+
+`ItemTablesWriter` grava as duas tabelas ao mesmo tempo, cada uma na sua
+thread, enquanto a próxima página é buscada.
+
+Novos formatos podem ser registrados em `WRITERS` (ou passados direto como
+uma subclasse de `TableWriter`).
+"""
+import gzip
+import logging
+import pandas as pd
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Linhas acumuladas antes de gravar um row group (Parquet) / record batch (Arrow)
+ARROW_BLOCK_ROWS = 64_000
+
+# Limite de linhas de uma planilha do Excel (contando o cabeçalho)
+EXCEL_MAX_ROWS = 1_048_576
+
+
+class TableWriter:
+    """Grava uma tabela em um arquivo, a partir de DataFrames recebidos aos poucos.
+
+    As colunas do arquivo são as do primeiro DataFrame não vazio; nas páginas
+    seguintes, colunas que faltarem ficam vazias e colunas novas são
+    descartadas (com um aviso no log), exceto nos formatos que aceitam linhas
+    com colunas diferentes. Por isso a extração entrega a primeira página já
+    com todas as colunas do quadro (`ItemFlattener(todas_colunas=True)`); só
+    uma coluna criada no quadro durante a gravação fica de fora.
+
+    Subclasses definem `extension` e `_write`, e podem sobrescrever `_close`.
+
+    Args:
+        path: Caminho do arquivo, sem a extensão (ver `path_for`).
+    """
+    extension = ""
+    # O formato aceita linhas com colunas diferentes (ex: JSON Lines)?
+    flexible_columns = False
+
+    def __init__(self, path: str):
+        self.path = self.path_for(path)
+        self.columns = None
+        self.rows = 0
+        self._dropped = set()
+
+    @classmethod
+    def path_for(cls, path: str) -> str:
+        return path if path.endswith(cls.extension) else f"{path}{cls.extension}"
+
+    def write(self, df: pd.DataFrame):
+        """Acrescenta as linhas de `df` ao arquivo (DataFrames vazios são ignorados)."""
+        if df.empty:
+            return
+        if self.columns is None:
+            self.columns = list(df.columns)
+        elif not self.flexible_columns:
+            df = self._align(df)
+        self._write(df)
+        self.rows += len(df)
+
+    def close(self):
+        """Termina o arquivo (grava um arquivo vazio se nenhuma linha foi recebida)."""
+        self._close()
+        logging.info(f"Arquivo gravado: {self.path} ({self.rows} linha(s)).")
+
+    def abort(self):
+        """Libera o arquivo sem terminá-lo (após um erro na extração)."""
+        pass
+
+    def _align(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Deixa `df` com as colunas do arquivo."""
+        new = [column for column in df.columns if column not in self.columns and column not in self._dropped]
+        if new:
+            self._dropped.update(new)
+            logging.warning(f"{self.path}: coluna(s) {', '.join(map(str, new))} apareceram depois do início "
+                            f"da gravação e ficam fora do arquivo.")
+        if list(df.columns) == self.columns:
+            return df
+        return df.reindex(columns=self.columns)
+
+    def _write(self, df: pd.DataFrame):
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+
+class ExcelTableWriter(TableWriter):
+    """Excel (.xlsx) no modo write-only do openpyxl: memória constante, qualquer que seja o tamanho do quadro.
+
+    Cada página é escrita linha a linha e sai da memória em seguida (as
+    linhas vão para arquivos temporários do openpyxl, e o .xlsx é montado a
+    partir deles em `close`). Quando uma planilha chega a `EXCEL_MAX_ROWS`
+    linhas, a gravação continua em uma nova ("Sheet2", "Sheet3", ...), com o
+    mesmo cabeçalho.
+    """
+    extension = ".xlsx"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        from openpyxl import Workbook
+        self._workbook = Workbook(write_only=True)
+        self._sheet = None
+        self._sheet_rows = 0
+
+    def _write(self, df: pd.DataFrame):
+        # O Excel não guarda o fuso: datas com fuso (UTC) são gravadas em UTC, sem ele
+        aware = {title: df[title].dt.tz_convert(None) for title in df.columns
+                 if isinstance(df[title].dtype, pd.DatetimeTZDtype)}
+        if aware:
+            df = df.assign(**aware)
+        # Valores ausentes (NaN, NaT, <NA>) viram células vazias; categorias, o seu texto
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            if self._sheet is None or self._sheet_rows >= EXCEL_MAX_ROWS:
+                self._new_sheet()
+            self._sheet.append(row)
+            self._sheet_rows += 1
+
+    def _new_sheet(self):
+        self._sheet = self._workbook.create_sheet(f"Sheet{len(self._workbook.worksheets) + 1}")
+        self._sheet_rows = 0
+        if self.columns:
+            self._sheet.append(self.columns)
+            self._sheet_rows = 1
+
+    def _close(self):
+        if self._sheet is None:
+            self._new_sheet()
+        self._workbook.save(self.path)
+        self._workbook = None
+
+    def abort(self):
+        self._workbook = None
+
+
+class CsvTableWriter(TableWriter):
+    """CSV em UTF-8, com o cabeçalho da primeira página."""
+    extension = ".csv"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(self.path, "w", encoding="utf-8", newline="")
+
+    def _write(self, df: pd.DataFrame):
+        df.to_csv(self._file, header=self.rows == 0, index=False)
+
+    def _close(self):
+        self._file.close()
+
+    def abort(self):
+        self._file.close()
+
+
+class JsonlTableWriter(TableWriter):
+    """JSON Lines (um objeto por linha) comprimido com gzip; datas em ISO 8601."""
+    extension = ".jsonl.gz"
+    flexible_columns = True
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = gzip.open(self.path, "wt", encoding="utf-8", compresslevel=6)
+
+    def _write(self, df: pd.DataFrame):
+        text = df.to_json(orient="records", lines=True, date_format="iso", force_ascii=False)
+        self._file.write(text if text.endswith("\n") else f"{text}\n")
+
+    def _close(self):
+        self._file.close()
+
+    def abort(self):
+        self._file.close()
+
+
+class _ArrowTableWriter(TableWriter):
+    """Base dos formatos do Arrow: as páginas são convertidas em `pyarrow.Table` com o esquema da primeira."""
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.pa = _import_pyarrow(type(self).__name__)
+        self.schema = None
+        self._writer = None
+        self._pending = []
+        self._pending_rows = 0
+
+    def _write(self, df: pd.DataFrame):
+        table = self._to_arrow(df)
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+        if self._pending_rows >= ARROW_BLOCK_ROWS:
+            self._flush()
+
+    def _close(self):
+        self._flush()
+        if self._writer is None:
+            # Nenhuma linha: arquivo com o esquema vazio
+            self._writer = self._open(self.schema or self.pa.schema([]))
+        self._writer.close()
+
+    def abort(self):
+        if self._writer is not None:
+            self._writer.close()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        table = self.pa.concat_tables(self._pending)
+        self._pending, self._pending_rows = [], 0
+        if self._writer is None:
+            self._writer = self._open(self.schema)
+        self._writer.write_table(table)
+
+    def _to_arrow(self, df: pd.DataFrame):
+        # Categorias viram texto: o dicionário de cada página é diferente
+        categories = [column for column in df.columns if isinstance(df[column].dtype, pd.CategoricalDtype)]
+        if categories:
+            df = df.astype({column: object for column in categories})
+        if self.schema is None:
+            self.schema = self._schema(df)
+        return self.pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+
+    def _schema(self, df: pd.DataFrame):
+        """Esquema do arquivo: o inferido da primeira página, com as colunas de texto (ou vazias) como string."""
+        pa = self.pa
+        inferred = pa.Schema.from_pandas(df, preserve_index=False)
+        fields = []
+        for field in inferred:
+            dtype = df[field.name].dtype
+            if pa.types.is_null(field.type) or pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+                field = pa.field(field.name, pa.string())
+            fields.append(field)
+        return pa.schema(fields)
+
+    def _open(self, schema):
+        raise NotImplementedError
+
+
+class ParquetTableWriter(_ArrowTableWriter):
+    """Parquet (compressão zstd), um row group a cada `ARROW_BLOCK_ROWS` linhas. Requer `pyarrow`."""
+    extension = ".parquet"
+
+    def _open(self, schema):
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(self.path, schema, compression="zstd")
+
+
+class ArrowIpcTableWriter(_ArrowTableWriter):
+    """Arrow IPC em arquivo (compressão lz4), um record batch a cada `ARROW_BLOCK_ROWS` linhas. Requer `pyarrow`."""
+    extension = ".arrow"
+
+    def _open(self, schema):
+        options = self.pa.ipc.IpcWriteOptions(compression="lz4")
+        return self.pa.ipc.new_file(self.path, schema, options=options)
+
+
+class FeatherTableWriter(ArrowIpcTableWriter):
+    """Feather v2 (o mesmo Arrow IPC em arquivo, com a extensão .feather)."""
+    extension = ".feather"
+
+
+# formato -> classe de gravação
+WRITERS = {
+    "xlsx": ExcelTableWriter,
+    "parquet": ParquetTableWriter,
+    "feather": FeatherTableWriter,
+    "arrow": ArrowIpcTableWriter,
+    "csv": CsvTableWriter,
+    "jsonl": JsonlTableWriter,
+}
+
+
+def writer_class(formato: str | type[TableWriter]) -> type[TableWriter]:
+    """Valida o parâmetro `formato`: um nome de `WRITERS` ou uma subclasse de `TableWriter`."""
+    if isinstance(formato, type) and issubclass(formato, TableWriter):
+        return formato
+    if formato not in WRITERS:
+        raise ValueError(f"formato deve ser um de {', '.join(WRITERS)}; recebido: {formato!r}.")
+    return WRITERS[formato]
+
+
+class ItemTablesWriter:
+    """Grava as tabelas de elementos e de subelementos ao mesmo tempo.
+
+    Cada tabela tem a sua thread: `write` entrega as duas páginas e volta logo,
+    enquanto a gravação anterior da mesma tabela é esperada (uma página por vez
+    em cada arquivo, na ordem). Assim a gravação de uma tabela não espera a da
+    outra, e as duas acontecem enquanto a próxima página é buscada na API. Um
+    erro de gravação aparece na chamada seguinte (ou em `close`).
+
+    Exemplo de Uso:
+        with ItemTablesWriter("parquet", "saida/CRI_elementos", "saida/CRI_subelementos") as writer:
+            for pagina in iter_items_paginados(..., por_pagina=True):
+                flattener.add_page(pagina)
+                writer.write(*flattener.take_frames())
+    """
+    def __init__(self, formato: str | type[TableWriter], arquivo_elementos: str, arquivo_subelementos: str):
+        cls = writer_class(formato)
+        self.elementos = cls(arquivo_elementos)
+        self.subelementos = cls(arquivo_subelementos)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="monday_gravacao")
+        self._pending: dict[TableWriter, Future] = {}
+
+    def write(self, elementos: pd.DataFrame, subelementos: pd.DataFrame):
+        for writer, df in ((self.elementos, elementos), (self.subelementos, subelementos)):
+            if df.empty:
+                continue
+            self._wait(writer)
+            self._pending[writer] = self._executor.submit(writer.write, df)
+
+    def close(self):
+        """Espera as gravações pendentes e termina os dois arquivos (também ao mesmo tempo)."""
+        try:
+            for writer in (self.elementos, self.subelementos):
+                self._wait(writer)
+            closes = [self._executor.submit(writer.close) for writer in (self.elementos, self.subelementos)]
+            for future in closes:
+                future.result()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _wait(self, writer: TableWriter):
+        future = self._pending.pop(writer, None)
+        if future is not None:
+            future.result()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Já há um erro: só libera as threads e os arquivos, sem mascará-lo com outro
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            for writer in (self.elementos, self.subelementos):
+                writer.abort()
+
+
+def _import_pyarrow(owner: str):
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401 - carrega o submódulo usado por pyarrow.ipc.new_file
+    except ImportError as e:
+        raise ImportError(f"{owner} requer o pacote 'pyarrow'.") from e
+    return pyarrow